@@ -0,0 +1,262 @@
+// Shared chart code for fid_correlation.html, fid_correlation_wcfg.html and
+// fid_correlation_combined.html (built by helper_scripts/build_fid_correlation.py).
+//
+// Each page sets window.FID_CHART = {data, xcol, hoverLabel} before loading this file.
+// Plotly and the shared data JSON are only fetched once #fig scrolls into view; the
+// first paint uses the regression fits precomputed at build time, and r / trend lines
+// are refit in the browser only after a box-select, legend toggle or CFG switch.
+(function () {
+const PLOTLY_SRC = "https://cdn.plot.ly/plotly-2.35.2.min.js";
+const cfg = window.FID_CHART;
+const fig = document.getElementById("fig");
+
+function loadPlotly() {
+  return new Promise((resolve, reject) => {
+    if (window.Plotly) return resolve();
+    const s = document.createElement("script");
+    s.src = PLOTLY_SRC; s.charset = "utf-8";
+    s.onload = resolve; s.onerror = reject;
+    document.head.appendChild(s);
+  });
+}
+
+function start() {
+  Promise.all([fetch(cfg.data).then(res => res.json()), loadPlotly()])
+    .then(([data]) => draw(unpack(data)));
+}
+
+if ("IntersectionObserver" in window) {
+  const io = new IntersectionObserver(entries => {
+    if (entries.some(e => e.isIntersecting)) { io.disconnect(); start(); }
+  }, { rootMargin: "300px" });
+  io.observe(fig);
+} else {
+  start();
+}
+
+// Columnar JSON -> the record objects and per-page settings the chart works with
+function unpack(data) {
+  const records = data.rows.map(row => Object.fromEntries(data.columns.map((c, k) => [c, row[k]])));
+  const wide = data.panels.length !== 3;
+  return {
+    records, panels: data.panels, categories: data.categories, hidden: data.hidden,
+    fits: data.fits, xlabels: data.xlabels,
+    xcol: cfg.xcol, xlabel: data.xlabels[cfg.xcol],
+    rows: wide ? 2 : 1, cols: wide ? 2 : 3,
+  };
+}
+
+// #fig is sized by the page's CSS (see FIGURE_SIZES in the build script), so the
+// space is reserved before Plotly arrives and nothing shifts when the chart draws.
+function draw(D) {
+
+const axisFor = i => i === 0 ? ["x","y"] : ["x"+(i+1), "y"+(i+1)];
+const recsByCat = cat => D.records.filter(r => r.category === cat);
+
+// Hover shows only the metrics present in this figure (so the 1x3 omits SimpleEval).
+// customdata layout: [method, fid, <metric values in panel order>]
+const hoverTemplate =
+  "<b>%{customdata[0]}</b><br>" + cfg.hoverLabel + ": %{customdata[1]:.2f}<br>" +
+  D.panels.map((p, k) => p.label + ": %{customdata[" + (k + 2) + "]:.3f}").join("<br>") +
+  "<extra></extra>";
+const customFor = recs => recs.map(r => [r.method, r[D.xcol], ...D.panels.map(p => r[p.key])]);
+
+const traces = [];
+const trendIdxForPanel = {};   // panel index -> trend-line trace index
+const scatterTraces = [];      // {idx, panel, cat, recs} for every scatter (category) trace
+D.panels.forEach((panel, i) => {
+  const [ax, ay] = axisFor(i);
+  const fit = D.fits[D.xcol][i];
+  // scatter traces per category
+  Object.entries(D.categories).forEach(([cat, style]) => {
+    const recs = recsByCat(cat);
+    scatterTraces.push({ idx: traces.length, panel: i, cat: cat, recs: recs });
+    traces.push({
+      type: "scatter", mode: "markers",
+      xaxis: ax, yaxis: ay,
+      meta: { panel: i },
+      x: recs.map(r => r[D.xcol]),
+      y: recs.map(r => r[panel.key]),
+      name: style.label,
+      legendgroup: cat,
+      visible: D.hidden.includes(cat) ? "legendonly" : true,
+      showlegend: i === 0,
+      marker: { size: 8, color: style.color, symbol: style.symbol,
+                line: { color: "#fff", width: 1 } },
+      selected:   { marker: { opacity: 1.0, size: 10 } },
+      unselected: { marker: { opacity: 0.15 } },
+      customdata: customFor(recs),
+      hovertemplate: hoverTemplate,
+    });
+  });
+  // trend line (precomputed; refit live on selection)
+  trendIdxForPanel[i] = traces.length;
+  traces.push({
+    type: "scatter", mode: "lines",
+    xaxis: ax, yaxis: ay,
+    x: fit.trend_x, y: fit.trend_y,
+    line: { color: "#4A4A4A", width: 2, dash: "dash" },
+    hoverinfo: "skip", showlegend: false,
+  });
+});
+
+// Grid layout with independent axes
+const layout = {
+  grid: { rows: D.rows, columns: D.cols, pattern: "independent",
+          xgap: (D.rows === 1 ? 0.26 : 0.18), ygap: 0.28 },
+  margin: { l: 50, r: 12, t: 40, b: 46 },
+  font: { size: 12 },
+  legend: { orientation: "h", x: 0.5, xanchor: "center", y: (D.rows === 1 ? 1.16 : 1.13), font: { size: 12 } },
+  hovermode: "closest",
+  hoverlabel: { bgcolor: "#fff", bordercolor: "#888", font: { family: "monospace", size: 13 } },
+  annotations: [],
+  paper_bgcolor: "#fff", plot_bgcolor: "#fff",
+  dragmode: "select",   // dragging a rectangle recomputes stats
+};
+
+const annIndexForPanel = {};   // panel index -> layout.annotations index
+D.panels.forEach((panel, i) => {
+  const [ax, ay] = axisFor(i);
+  const xa = "xaxis" + (i === 0 ? "" : (i+1));
+  const ya = "yaxis" + (i === 0 ? "" : (i+1));
+  // visible left/bottom axis lines + outside ticks, mirror off (top/right hidden) — matches matplotlib spines
+  const spine = { showline: true, linecolor: "#222", linewidth: 1.2, mirror: false,
+                  ticks: "outside", tickcolor: "#222", ticklen: 6, tickwidth: 1.2 };
+  layout[xa] = Object.assign({ title: { text: D.xlabel, font: { size: 13 } }, tickfont: { size: 10 }, gridcolor: "#eee", zeroline: false }, spine);
+  layout[ya] = Object.assign({ title: { text: panel.label + " →", font: { size: 13 } }, tickfont: { size: 10 }, gridcolor: "#eee", zeroline: false }, spine);
+  annIndexForPanel[i] = layout.annotations.length;
+  layout.annotations.push({
+    xref: ax + " domain", yref: ay + " domain",
+    x: 0.96, y: 0.96, xanchor: "right", yanchor: "top",
+    text: statsText(D.fits[D.xcol][i].r),
+    showarrow: false, align: "right",
+    font: { size: 11, family: "monospace" },
+    bgcolor: "rgba(255,255,255,0.85)", bordercolor: "#999", borderwidth: 1, borderpad: 4,
+  });
+});
+
+// ---- stats helpers (recompute r for a selected subset) ----
+function statsText(r) {
+  return "r = " + ((r === null) ? "n/a" : r.toFixed(3));
+}
+function pearson(xs, ys) {
+  const n = xs.length;
+  if (n < 2) return null;
+  const mx = xs.reduce((a,b)=>a+b,0)/n, my = ys.reduce((a,b)=>a+b,0)/n;
+  let sxy=0, sxx=0, syy=0;
+  for (let i=0;i<n;i++){ const dx=xs[i]-mx, dy=ys[i]-my; sxy+=dx*dy; sxx+=dx*dx; syy+=dy*dy; }
+  if (sxx===0 || syy===0) return null;
+  return sxy/Math.sqrt(sxx*syy);
+}
+// least-squares line over a point set; returns endpoints spanning the selected x-range
+function fitLine(xs, ys) {
+  const n = xs.length;
+  if (n < 2) return null;
+  const mx = xs.reduce((a,b)=>a+b,0)/n, my = ys.reduce((a,b)=>a+b,0)/n;
+  let sxy=0, sxx=0;
+  for (let i=0;i<n;i++){ const dx=xs[i]-mx; sxy+=dx*(ys[i]-my); sxx+=dx*dx; }
+  if (sxx===0) return null;
+  const slope = sxy/sxx, intercept = my - slope*mx;
+  const xlo = Math.min(...xs), xhi = Math.max(...xs);
+  return { x: [xlo, xhi], y: [slope*xlo+intercept, slope*xhi+intercept] };
+}
+
+let selection = null;   // panel -> {x,y} from a box-select, or null when none active
+let suppress = false;   // guard so our own trend restyle doesn't re-trigger render()
+
+Plotly.newPlot(fig, traces, layout, {responsive: true, displaylogo: false,
+  modeBarButtonsToRemove: ["lasso2d"]});
+
+// Points to use per panel = currently VISIBLE categories (respects legend toggles).
+function visiblePanelPts() {
+  const m = {};
+  scatterTraces.forEach(st => {
+    const tr = fig.data[st.idx];
+    if (tr.visible === "legendonly") return;          // hidden via legend
+    const a = (m[st.panel] = m[st.panel] || {x:[], y:[]});
+    for (let k = 0; k < tr.x.length; k++) { a.x.push(tr.x[k]); a.y.push(tr.y[k]); }
+  });
+  return m;
+}
+
+// True while the legend shows exactly the categories the build-time fits were made for
+function defaultVisibility() {
+  return scatterTraces.every(st =>
+    (fig.data[st.idx].visible === "legendonly") === D.hidden.includes(st.cat));
+}
+
+// Update r and the regression line for every panel: precomputed fits when nothing is
+// selected and the legend is untouched, otherwise refit the selected / visible points.
+function render() {
+  const precomputed = !selection && defaultVisibility();
+  const base = precomputed ? null : visiblePanelPts();
+  const annUpdate = {}, tX = [], tY = [], tIdx = [];
+  D.panels.forEach((panel, i) => {
+    const ai = annIndexForPanel[i];
+    tIdx.push(trendIdxForPanel[i]);
+    if (precomputed) {
+      const fit = D.fits[D.xcol][i];
+      annUpdate["annotations[" + ai + "].text"] = statsText(fit.r);
+      tX.push(fit.trend_x); tY.push(fit.trend_y);
+      return;
+    }
+    const pts = (selection && selection[i] && selection[i].x.length) ? selection[i] : base[i];
+    if (pts && pts.x.length >= 1) {
+      annUpdate["annotations[" + ai + "].text"] = statsText(pearson(pts.x, pts.y));
+      const line = fitLine(pts.x, pts.y);
+      tX.push(line ? line.x : []); tY.push(line ? line.y : []);
+    } else {
+      annUpdate["annotations[" + ai + "].text"] = statsText(null);
+      tX.push([]); tY.push([]);                       // nothing visible -> no line
+    }
+  });
+  suppress = true;
+  Plotly.restyle(fig, { x: tX, y: tY }, tIdx).then(() => { suppress = false; });
+  Plotly.relayout(fig, annUpdate);
+}
+
+fig.on("plotly_selected", (ev) => {
+  const m = {};
+  if (ev && ev.points) ev.points.forEach(pt => {
+    const pidx = pt.data.meta ? pt.data.meta.panel : null;
+    if (pidx === null || pidx === undefined) return;
+    (m[pidx] = m[pidx] || {x:[], y:[]});
+    m[pidx].x.push(pt.x); m[pidx].y.push(pt.y);
+  });
+  selection = m; render();
+});
+fig.on("plotly_deselect", () => { selection = null; render(); });   // double-click clears
+fig.on("plotly_restyle", () => { if (!suppress) render(); });        // legend toggles
+
+// ---- Guidance toggle (combined page): swap the x column between w/o CFG and w/ CFG ----
+function switchGuidance(col) {
+  const label = D.xlabels[col];
+  D.xcol = col; D.xlabel = label;
+  selection = null;                                  // x range changed; drop any box selection
+  const xUpd = [], cdUpd = [], idxs = [];
+  scatterTraces.forEach(st => {
+    idxs.push(st.idx);
+    xUpd.push(st.recs.map(r => r[col]));
+    cdUpd.push(customFor(st.recs));                  // customFor reads the now-updated D.xcol
+  });
+  suppress = true;
+  Plotly.restyle(fig, { x: xUpd, customdata: cdUpd }, idxs).then(() => {
+    const axUpd = {};
+    D.panels.forEach((p, i) => {
+      const xa = "xaxis" + (i === 0 ? "" : (i + 1));
+      axUpd[xa + ".title.text"] = label;
+      axUpd[xa + ".autorange"] = true;               // re-fit the axis to the new range
+    });
+    return Plotly.relayout(fig, axUpd);
+  }).then(() => { suppress = false; render(); });
+}
+
+document.querySelectorAll(".guidance-toggle button").forEach(btn => {
+  btn.addEventListener("click", () => {
+    document.querySelectorAll(".guidance-toggle button").forEach(b =>
+      b.setAttribute("aria-pressed", b === btn ? "true" : "false"));
+    switchGuidance(btn.getAttribute("data-col"));
+  });
+});
+}
+})();
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Build the interactive ImageNet-FID vs T2I-metric charts from one results file.
+
+fid_correlation.html (x = FID w/o CFG), fid_correlation_wcfg.html (x = FID w/ CFG)
+and fid_correlation_combined.html (toggle between the two) used to be
+standalone copies, each with its own records array. They are now small pages
+generated from fid_correlation_results.csv, sharing:
+
+    assets/fid_correlation_data.json   compact columnar records, panel and category
+                                       styles, and the regression fits (Pearson r and
+                                       least-squares trend line per x column / panel)
+    assets/fid_correlation.js          chart code; loads Plotly and the JSON only when
+                                       the chart scrolls into view
+
+Fits are computed here over the categories shown by default (Pixel-space starts
+hidden in the legend), so the first paint needs no statistics in the browser.
+Both shared files are referenced with a content hash (?v=...) so browsers can
+cache them across the three pages and still pick up changes.
+
+Usage:
+    python helper_scripts/build_fid_correlation.py
+    python helper_scripts/build_fid_correlation.py --results path/to/results.csv
+
+Requirements:
+    pip install numpy pandas
+"""
+
+import argparse
+import hashlib
+import html
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+SCRIPT_DIR = Path(__file__).parent
+ASSETS_DIR = SCRIPT_DIR.parent / "assets"
+DEFAULT_RESULTS = SCRIPT_DIR / "fid_correlation_results.csv"
+DATA_FILE = "fid_correlation_data.json"
+CHART_JS = "fid_correlation.js"
+
+X_COLUMNS = {
+    "fid_nocfg": "← ImageNet FID (w/o CFG)",
+    "fid_cfg": "← ImageNet FID (w/ CFG)",
+}
+PANELS = [
+    {"key": "geneval", "label": "GenEval"},
+    {"key": "dpgbench", "label": "DPG-Bench"},
+    {"key": "genaibench", "label": "GenAIBench"},
+]
+CATEGORIES = {
+    "RAE": {"label": "Latent (RAE)", "color": "#3498DB", "symbol": "circle"},
+    "VAE": {"label": "Latent (VAE)", "color": "#C0392B", "symbol": "square"},
+    "Pixel": {"label": "Pixel-space", "color": "#27AE60", "symbol": "triangle-up"},
+}
+HIDDEN_CATEGORIES = ["Pixel"]
+
+# Output page -> initial x column, hover label for the FID value, CFG toggle
+PAGES = {
+    "fid_correlation.html": {"xcol": "fid_nocfg", "hover_label": "FID (w/o CFG)", "toggle": False},
+    "fid_correlation_wcfg.html": {"xcol": "fid_cfg", "hover_label": "FID (w/ CFG)", "toggle": False},
+    # Generic hover label so it stays valid across the CFG toggle
+    "fid_correlation_combined.html": {"xcol": "fid_nocfg", "hover_label": "ImageNet FID", "toggle": True},
+}
+
+# Match the 1x3 panel aspect ratio to the 2x2's (~1.59:1 w:h, which looks nice).
+# 2x2: 980x720, margins 80/24/72/72, xgap .18 ygap .28 -> panel ~402x253 px.
+# 1x3: 1440 wide, xgap .26 -> panel ~384 wide; height 280.
+FIGURE_SIZES = {1: ("1440px", "280px"), 2: ("980px", "720px")}
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8"/>
+<meta name="viewport" content="width=device-width, initial-scale=1"/>
+<title>ImageNet FID vs T2I metrics</title>
+<!-- Generated by diffusion-bench/helper_scripts/build_fid_correlation.py; edit the results CSV, not this file. -->
+<style>
+  body {{ font-family: Georgia, 'Times New Roman', serif; margin: 0; padding: 16px;
+         background: #fff; color: #222; }}
+  #fig {{ width: 100%; margin: 0 auto; max-width: {max_width}; height: {height}; }}
+{toggle_css}</style>
+</head>
+<body>
+{toggle_html}<div id="fig"></div>
+<script>window.FID_CHART = {config};</script>
+<script src="{chart_js}" defer></script>
+</body>
+</html>
+"""
+
+TOGGLE_CSS = """  .guidance-toggle { display: flex; align-items: center; gap: 8px; margin: 0 0 8px;
+                     font-family: Georgia, serif; font-size: 13px; }
+  .guidance-toggle .gt-label { color: #555; }
+  .guidance-toggle button { border: 1px solid #d0d3dc; background: #fff; color: #444;
+                            padding: 3px 13px; border-radius: 6px; font: inherit; cursor: pointer;
+                            transition: background .15s, color .15s, border-color .15s; }
+  .guidance-toggle button[aria-pressed="true"] { background: #2952b3; border-color: #2952b3; color: #fff; }
+"""
+
+TOGGLE_BUTTONS = [("fid_nocfg", "without CFG"), ("fid_cfg", "with CFG")]
+
+
+def load_results(path):
+    """Load per-method results (CSV or JSON records) and check the required columns."""
+    path = Path(path)
+    df = pd.read_json(path) if path.suffix.lower() == ".json" else pd.read_csv(path)
+    required = ["method", "category", *X_COLUMNS, *(panel["key"] for panel in PANELS)]
+    missing = [column for column in required if column not in df.columns]
+    if missing:
+        raise ValueError(f"{path} is missing column(s): {', '.join(missing)}")
+    unknown = sorted(set(df["category"]) - set(CATEGORIES))
+    if unknown:
+        raise ValueError(f"{path} has unknown categories: {', '.join(unknown)}")
+    return df
+
+
+def regression_fits(df):
+    """Pearson r and trend-line endpoints per x column and panel, over the default-visible rows.
+
+    Returns {xcol: [{"r", "trend_x", "trend_y"} per panel]}, all panels of one x
+    column fitted at once from a (panels, n) matrix.
+    """
+    visible = df[~df["category"].isin(HIDDEN_CATEGORIES)]
+    ys = visible[[panel["key"] for panel in PANELS]].to_numpy(dtype=np.float64).T   # (P, n)
+    yc = ys - ys.mean(axis=1, keepdims=True)
+
+    fits = {}
+    for xcol in X_COLUMNS:
+        x = visible[xcol].to_numpy(dtype=np.float64)
+        xc = x - x.mean()
+        sxx = xc @ xc
+        sxy = yc @ xc                                     # (P,)
+        r = sxy / np.sqrt(sxx * (yc * yc).sum(axis=1))
+        slope = sxy / sxx
+        intercept = ys.mean(axis=1) - slope * x.mean()
+        trend_x = np.array([x.min(), x.max()])
+        trend_y = slope[:, None] * trend_x + intercept[:, None]   # (P, 2)
+        fits[xcol] = [
+            {"r": round(float(r[i]), 6), "trend_x": trend_x.tolist(),
+             "trend_y": [round(float(v), 6) for v in trend_y[i]]}
+            for i in range(len(PANELS))
+        ]
+    return fits
+
+
+def build_data(df):
+    """The shared JSON payload: columnar records plus styles and precomputed fits."""
+    columns = ["method", "category", *X_COLUMNS, *(panel["key"] for panel in PANELS)]
+    if "simpleeval" in df.columns:
+        columns.append("simpleeval")
+    rows = [
+        [value.item() if hasattr(value, "item") else value for value in row]
+        for row in df[columns].itertuples(index=False)
+    ]
+    return {
+        "columns": columns,
+        "rows": rows,
+        "panels": PANELS,
+        "categories": CATEGORIES,
+        "hidden": HIDDEN_CATEGORIES,
+        "xlabels": X_COLUMNS,
+        "fits": regression_fits(df),
+    }
+
+
+def versioned(name, content):
+    """URL of an asset with a short content hash for cache busting."""
+    return f"{name}?v={hashlib.sha256(content).hexdigest()[:10]}"
+
+
+def render_page(settings, data_url, chart_url):
+    """HTML for one chart page."""
+    rows = 1 if len(PANELS) == 3 else 2
+    max_width, height = FIGURE_SIZES[rows]
+    toggle_html = ""
+    if settings["toggle"]:
+        buttons = "\n".join(
+            f'  <button type="button" data-col="{col}" '
+            f'aria-pressed="{"true" if col == settings["xcol"] else "false"}">{text}</button>'
+            for col, text in TOGGLE_BUTTONS
+        )
+        toggle_html = (f'<div class="guidance-toggle">\n  <span class="gt-label">ImageNet FID:</span>\n'
+                       f'{buttons}\n</div>\n')
+    config = json.dumps({"data": data_url, "xcol": settings["xcol"],
+                         "hoverLabel": settings["hover_label"]})
+    return PAGE_TEMPLATE.format(
+        max_width=max_width,
+        height=height,
+        toggle_css=TOGGLE_CSS if settings["toggle"] else "",
+        toggle_html=toggle_html,
+        config=config.replace("</", "<\\/"),
+        chart_js=html.escape(chart_url),
+    )
+
+
+def write_if_changed(path, content):
+    """Write bytes only if they differ, so unchanged outputs keep their mtime."""
+    if path.exists() and path.read_bytes() == content:
+        return False
+    path.write_bytes(content)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the FID-correlation chart pages")
+    parser.add_argument("--results", type=str, default=str(DEFAULT_RESULTS),
+                        help="Results CSV/JSON (default: helper_scripts/fid_correlation_results.csv)")
+    parser.add_argument("--output-dir", type=str, default=str(ASSETS_DIR))
+    args = parser.parse_args()
+
+    output_dir = Path(args.output_dir)
+    df = load_results(args.results)
+    data = build_data(df)
+    data_bytes = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode() + b"\n"
+    chart_bytes = (ASSETS_DIR / CHART_JS).read_bytes()
+
+    outputs = {DATA_FILE: data_bytes}
+    data_url = versioned(DATA_FILE, data_bytes)
+    chart_url = versioned(CHART_JS, chart_bytes)
+    for name, settings in PAGES.items():
+        outputs[name] = render_page(settings, data_url, chart_url).encode()
+
+    print(f"Loaded {len(df)} methods from {args.results}")
+    for xcol, fits in data["fits"].items():
+        stats = ", ".join(f"{panel['label']} r={fit['r']:.3f}" for panel, fit in zip(PANELS, fits))
+        print(f"  {xcol}: {stats}")
+    for name, content in outputs.items():
+        changed = write_if_changed(output_dir / name, content)
+        print(f"{'✓ Wrote' if changed else '  Unchanged'} {output_dir / name} ({len(content) / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
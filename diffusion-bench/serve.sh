@@ -1,20 +1,20 @@
 #!/bin/bash
-# Local preview server for the NanoGen project page.
+# Local preview server for the diffusion-bench project page.
 #
 # The page references shared assets one level up (../static/...), so the
-# server MUST run from the repo root, not from inside nanogen/.
-# This script serves the repo root and points you at /nanogen/.
+# server MUST run from the repo root, not from inside diffusion-bench/.
+# This script serves the repo root and points you at /diffusion-bench/.
+#
+# scripts/serve.py is threaded and serves precompressed (gzip/brotli) text
+# assets with ETags, range requests and a latency summary on exit.
 
 PORT=8008
 
-# Repo root = parent of this script's directory (nanogen/)
+# Repo root = parent of this script's directory (diffusion-bench/)
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 ROOT_DIR="$(cd "$SCRIPT_DIR/.." && pwd)"
 
-echo "Serving repo root: $ROOT_DIR"
-echo "Open: http://localhost:$PORT/nanogen/"
 echo "Press Ctrl+C to stop"
 echo ""
 
-cd "$ROOT_DIR"
-python3 -m http.server "$PORT"
+python3 "$ROOT_DIR/scripts/serve.py" --root "$ROOT_DIR" --port "$PORT" --page diffusion-bench/ "$@"
@@ -3,57 +3,127 @@
 Create a placeholder hero image for testing layout.
 This creates a simple gradient image that matches the aspect ratio.
 
+The gradient, scattered dots (global information) and node lattice (spatial
+structure) are rendered as whole NumPy arrays, so 4K / retina sizes and many
+color or seed variations can be batch-rendered in one pass.
+
 Usage:
     python create_placeholder_hero.py
+    python create_placeholder_hero.py --sizes 1200x675 2400x1350 3840x2160
+    python create_placeholder_hero.py --seeds 1 2 3 --top-color "#1a1a40" --bottom-color "#764ba2"
 """
 
+import argparse
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 
-def create_placeholder_hero():
-    """Create a placeholder hero image with gradient."""
-
-    # Dimensions for 16:9 aspect ratio
-    width, height = 1200, 675
-
-    # Create gradient from blue to purple
-    image = Image.new('RGB', (width, height))
+# Reference size: all geometry (dot radii, grid spacing, margins) scales with width / BASE_WIDTH
+BASE_WIDTH, BASE_HEIGHT = 1200, 675
+
+DEFAULT_THEME = {
+    "top_color": "#667eea",     # Blue
+    "bottom_color": "#764ba2",  # Purple
+    "dot_color": "#b4c8ff",
+    "node_color": "#c8b4ff",
+    "line_color": "#ffffff",
+}
+
+
+def to_rgb(color):
+    """Accept '#rrggbb' or an (r, g, b) tuple; return a float32 array."""
+    if isinstance(color, str):
+        color = tuple(int(color.lstrip("#")[i:i + 2], 16) for i in (0, 2, 4))
+    return np.asarray(color, dtype=np.float32)
+
+
+def blend(canvas, coverage, color):
+    """Alpha-blend a solid color into a (B, H, W, 3) canvas with (B, H, W) coverage."""
+    canvas += coverage[..., None] * (color - canvas)
+
+
+def render_heroes(width, height, variants, n_dots=30):
+    """
+    Render several hero variants of one size as a (B, H, W, 3) uint8 array.
+
+    Each variant is a dict with a `seed` and optional theme colors (see DEFAULT_THEME).
+    """
+    scale = width / BASE_WIDTH
+    themes = [{**DEFAULT_THEME, **v} for v in variants]
+    batch = len(themes)
+
+    def colors(key):
+        return np.stack([to_rgb(t[key]) for t in themes])[:, None, None, :]  # (B, 1, 1, 3)
+
+    ys = np.arange(height, dtype=np.float32)[:, None]
+    xs = np.arange(width, dtype=np.float32)[None, :]
+
+    # --- Gradient layer: one broadcast lerp over rows for every variant ---
+    t = (ys / height)[None, :, :, None]                                       # (1, H, 1, 1)
+    canvas = colors("top_color") + (colors("bottom_color") - colors("top_color")) * t
+    canvas = np.broadcast_to(canvas, (batch, height, width, 3)).copy()
+
+    # --- Scatter layer (left half): all dots of all variants stamped at once ---
+    margin = 50 * scale
+    rngs = [np.random.default_rng(theme.get("seed", 42)) for theme in themes]
+    cx = np.stack([rng.uniform(margin, width // 2 - margin, n_dots) for rng in rngs])
+    cy = np.stack([rng.uniform(margin, height - margin, n_dots) for rng in rngs])
+    radius = np.stack([rng.uniform(3, 8, n_dots) for rng in rngs]) * scale   # (B, N)
+
+    reach = int(np.ceil(8 * scale)) + 1
+    offsets = np.arange(-reach, reach + 1)
+    oy, ox = np.meshgrid(offsets, offsets, indexing="ij")                   # (P, P) stamp window
+    py = np.round(cy)[..., None, None].astype(np.int64) + oy                 # (B, N, P, P)
+    px = np.round(cx)[..., None, None].astype(np.int64) + ox
+    dist = np.hypot(py - cy[..., None, None], px - cx[..., None, None])
+    dot_coverage = np.clip(radius[..., None, None] + 0.5 - dist, 0, 1)
+
+    inside = (py >= 0) & (py < height) & (px >= 0) & (px < width) & (dot_coverage > 0)
+    b_idx = np.broadcast_to(np.arange(batch)[:, None, None, None], py.shape)
+    coverage = np.zeros((batch, height, width), dtype=np.float32)
+    np.maximum.at(coverage, (b_idx[inside], py[inside], px[inside]), dot_coverage[inside])
+    blend(canvas, coverage, colors("dot_color"))
+
+    # --- Lattice layer (right half): lines and nodes from modular distance fields ---
+    grid = 40 * scale
+    grid_start = width // 2 + margin
+    n_cols = int(np.ceil((width - margin - grid_start) / grid))
+    n_rows = int(np.ceil(height / grid))
+    x_last = grid_start + (n_cols - 1) * grid
+    y_last = (n_rows - 1) * grid
+
+    # Distance from each pixel to the nearest lattice column / row
+    dx = np.abs((xs - grid_start + grid / 2) % grid - grid / 2)
+    dy = np.abs((ys + grid / 2) % grid - grid / 2)
+    in_x = (xs >= grid_start - 0.5) & (xs <= x_last + 0.5)
+    in_y = ys <= y_last + 0.5
+
+    line_width = max(scale, 1.0)
+    vertical = np.clip(line_width / 2 + 0.5 - dx, 0, 1) * in_x * in_y
+    horizontal = np.clip(line_width / 2 + 0.5 - dy, 0, 1) * in_x * (ys < height)
+    lines = np.maximum(vertical, horizontal)
+    blend(canvas, np.broadcast_to(0.4 * lines, (batch, height, width)), colors("line_color"))
+
+    node_radius = 5 * scale
+    node_dist = np.hypot(dx, dy)
+    node_mask = (xs >= grid_start - node_radius - 1) & (xs <= x_last + node_radius + 1)
+    fill = np.clip(node_radius + 0.5 - node_dist, 0, 1) * node_mask
+    ring = np.clip(1 - np.abs(node_dist - node_radius) / line_width, 0, 1) * node_mask
+    blend(canvas, np.broadcast_to(fill, (batch, height, width)), colors("node_color"))
+    blend(canvas, np.broadcast_to(ring, (batch, height, width)), colors("line_color"))
+
+    return np.clip(canvas + 0.5, 0, 255).astype(np.uint8)
+
+
+def add_label(image):
+    """Draw the centered 'Generate with Flux' placeholder text."""
+    width, height = image.size
+    scale = width / BASE_WIDTH
     draw = ImageDraw.Draw(image)
 
-    # Create gradient
-    for y in range(height):
-        # Blue (#667eea) to Purple (#764ba2)
-        r = int(102 + (118 - 102) * y / height)
-        g = int(126 + (75 - 126) * y / height)
-        b = int(234 + (162 - 234) * y / height)
-        draw.rectangle([(0, y), (width, y+1)], fill=(r, g, b))
-
-    # Add some simple geometric shapes to suggest the concept
-    # Left side: scattered circles (global information)
-    np.random.seed(42)
-    for _ in range(30):
-        x = np.random.randint(50, width//2 - 50)
-        y = np.random.randint(50, height - 50)
-        r = np.random.randint(3, 8)
-        draw.ellipse([x-r, y-r, x+r, y+r], fill=(180, 200, 255, 128))
-
-    # Right side: grid pattern (spatial structure)
-    grid_start = width // 2 + 50
-    grid_size = 40
-    for i in range(0, height, grid_size):
-        for j in range(grid_start, width - 50, grid_size):
-            draw.ellipse([j-5, i-5, j+5, i+5], fill=(200, 180, 255), outline=(255, 255, 255))
-            # Connect to neighbors
-            if i < height - grid_size:
-                draw.line([j, i, j, i+grid_size], fill=(255, 255, 255, 100), width=1)
-            if j < width - 50 - grid_size:
-                draw.line([j, i, j+grid_size, i], fill=(255, 255, 255, 100), width=1)
-
-    # Add text overlay (placeholder)
     try:
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 36)
-        font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 24)
+        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", int(36 * scale))
+        font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", int(24 * scale))
     except:
         font = ImageFont.load_default()
         font_small = ImageFont.load_default()
@@ -65,18 +135,39 @@ def create_placeholder_hero():
     bbox = draw.textbbox((0, 0), text, font=font)
     text_width = bbox[2] - bbox[0]
     text_x = (width - text_width) // 2
-    text_y = height // 2 - 40
+    text_y = height // 2 - int(40 * scale)
 
     # Draw text with shadow
-    draw.text((text_x+2, text_y+2), text, fill=(0, 0, 0, 100), font=font)
+    shadow = max(int(2 * scale), 1)
+    draw.text((text_x + shadow, text_y + shadow), text, fill=(0, 0, 0), font=font)
     draw.text((text_x, text_y), text, fill=(255, 255, 255), font=font)
 
     bbox2 = draw.textbbox((0, 0), text2, font=font_small)
     text2_width = bbox2[2] - bbox2[0]
     text2_x = (width - text2_width) // 2
-    text2_y = text_y + 50
+    text2_y = text_y + int(50 * scale)
+
+    draw.text((text2_x, text2_y), text2, fill=(255, 255, 255), font=font_small)
+    return image
+
+
+def render_hero_variants(sizes, variants, label=True):
+    """Batch-render every (size, variant) combination; returns [((w, h), variant, Image)]."""
+    results = []
+    for width, height in sizes:
+        batch = render_heroes(width, height, variants)
+        for variant, pixels in zip(variants, batch):
+            image = Image.fromarray(pixels)
+            results.append(((width, height), variant, add_label(image) if label else image))
+    return results
 
-    draw.text((text2_x, text2_y), text2, fill=(255, 255, 255, 200), font=font_small)
+
+def create_placeholder_hero():
+    """Create a placeholder hero image with gradient."""
+
+    # Dimensions for 16:9 aspect ratio
+    width, height = BASE_WIDTH, BASE_HEIGHT
+    [(_, _, image)] = render_hero_variants([(width, height)], [{"seed": 42}])
 
     # Save
     output_path = Path(__file__).parent.parent.parent / "static/img/hero.png"
@@ -89,8 +180,38 @@ def create_placeholder_hero():
     return str(output_path)
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Render placeholder hero images")
+    parser.add_argument("--sizes", nargs="+", default=None, metavar="WxH",
+                        help="Render these sizes (e.g. 2400x1350 3840x2160) instead of static/img/hero.png")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[42],
+                        help="One variant per seed (default: 42)")
+    for key, value in DEFAULT_THEME.items():
+        parser.add_argument(f"--{key.replace('_', '-')}", default=value, help=f"(default: {value})")
+    parser.add_argument("--no-label", action="store_true", help="Omit the placeholder text")
+    parser.add_argument("--output-dir", type=str, default=str(Path(__file__).parent / "outputs"))
+    args = parser.parse_args()
+
+    if args.sizes is None and args.seeds == [42] and not args.no_label and all(
+        getattr(args, key) == value for key, value in DEFAULT_THEME.items()
+    ):
+        create_placeholder_hero()
+        return
+
+    sizes = [tuple(int(v) for v in size.lower().split("x")) for size in args.sizes or ["1200x675"]]
+    theme = {key: getattr(args, key) for key in DEFAULT_THEME}
+    variants = [{**theme, "seed": seed} for seed in args.seeds]
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for (width, height), variant, image in render_hero_variants(sizes, variants, label=not args.no_label):
+        output_path = output_dir / f"hero_{width}x{height}_seed{variant['seed']}.png"
+        image.save(output_path, "PNG", optimize=True)
+        print(f"✓ {output_path}")
+
+
 if __name__ == "__main__":
     print("Creating placeholder hero image...")
     print("="*60)
-    create_placeholder_hero()
-    print("="*60)
\ No newline at end of file
+    main()
+    print("="*60)
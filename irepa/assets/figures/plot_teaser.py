@@ -6,15 +6,29 @@ This recreates the main teaser figure with proper formatting for web display.
 Ensures no rotation issues, correct dimensions, and professional styling.
 
 Usage:
-    python plot_teaser.py
+    python plot_teaser.py                                  # Placeholder data (layout preview only)
+    python plot_teaser.py --results encoders.csv           # Real per-encoder results
+
+Results file (CSV or JSON records), one row per vision encoder:
+    encoder,fid,ssm,lp_accuracy
+    PE-Spatial-B,21.0,0.71,53.1
+    ...
+Correlations of SSM and linear-probing accuracy with FID (Pearson and
+Spearman, with bootstrap confidence intervals) are computed from it and
+written into the titles, trend lines and takeaway box.
 
 Output:
     teaser.png in current directory (1200x800px)
 """
 
+import argparse
+import time
+
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 from pathlib import Path
+from scipy.stats import rankdata
 
 # Set style for professional look
 plt.style.use('seaborn-v0_8-darkgrid')
@@ -28,23 +42,113 @@ plt.rcParams['ytick.labelsize'] = 10
 plt.rcParams['legend.fontsize'] = 10
 
 
-def create_teaser_figure():
+REQUIRED_COLUMNS = ["encoder", "fid", "ssm", "lp_accuracy"]
+
+
+def load_results(path):
+    """Load per-encoder results from CSV or JSON and check the required columns."""
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        results = pd.read_json(path)
+    else:
+        results = pd.read_csv(path)
+    missing = [c for c in REQUIRED_COLUMNS if c not in results.columns]
+    if missing:
+        raise ValueError(f"{path} is missing column(s): {', '.join(missing)}")
+    return results.dropna(subset=REQUIRED_COLUMNS).reset_index(drop=True)
+
+
+def placeholder_results(n_encoders=27, seed=42):
+    """Random stand-in results with the same columns as a real results file."""
+    rng = np.random.default_rng(seed)
+    fid = rng.uniform(15, 40, n_encoders)
+    return pd.DataFrame({
+        "encoder": [f"encoder-{i}" for i in range(n_encoders)],
+        "fid": fid,
+        "ssm": -fid + rng.normal(0, 3, n_encoders),      # High correlation
+        "lp_accuracy": rng.uniform(50, 85, n_encoders),  # Low correlation
+    })
+
+
+def _rowwise_pearson(x, y):
+    """Pearson r along the last axis of two equally shaped arrays."""
+    x = x - x.mean(axis=-1, keepdims=True)
+    y = y - y.mean(axis=-1, keepdims=True)
+    denom = np.sqrt((x * x).sum(axis=-1) * (y * y).sum(axis=-1))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (x * y).sum(axis=-1) / denom
+
+
+def bootstrap_correlations(x, y, n_boot=10000, ci=95, seed=0):
+    """
+    Pearson and Spearman correlation with percentile bootstrap confidence intervals.
+
+    All `n_boot` resamples are drawn as one (n_boot, n) index array and scored in
+    a single vectorized pass (ties in the Spearman ranks are averaged).
+    Returns {"pearson": (r, lo, hi), "spearman": (rho, lo, hi)}.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    idx = rng.integers(0, len(x), size=(n_boot, len(x)))
+    xb, yb = x[idx], y[idx]
+
+    tail = (100 - ci) / 2
+    stats = {}
+    for name, point, boot in [
+        ("pearson", _rowwise_pearson(x, y), _rowwise_pearson(xb, yb)),
+        ("spearman", _rowwise_pearson(rankdata(x), rankdata(y)),
+         _rowwise_pearson(rankdata(xb, axis=1), rankdata(yb, axis=1))),
+    ]:
+        lo, hi = np.nanpercentile(boot, [tail, 100 - tail])
+        stats[name] = (float(point), float(lo), float(hi))
+    return stats
+
+
+def abs_interval(r, lo, hi):
+    """|r| and its interval, for correlations reported as magnitudes."""
+    if lo >= 0:
+        return abs(r), lo, hi
+    if hi <= 0:
+        return abs(r), -hi, -lo
+    return abs(r), 0.0, max(-lo, hi)
+
+
+def correlation_title(label, stats, ci=95):
+    """Two-line subplot title: |r| with its CI, then Spearman rho."""
+    r, lo, hi = abs_interval(*stats["pearson"])
+    rho = stats["spearman"][0]
+    return f"{label}: |r| = {r:.3f}\n{ci}% CI [{lo:.2f}, {hi:.2f}], Spearman ρ = {rho:.2f}"
+
+
+def create_teaser_figure(results=None, n_boot=10000):
     """
     Create the main teaser figure showing:
     - Spatial structure vs global information comparison
     - Correlation plots
     - Example comparisons
 
-    TODO: Replace with actual data from your experiments
-    This is a template - customize with your actual results.
+    `results` is a DataFrame with encoder, fid, ssm and lp_accuracy columns
+    (see load_results); placeholder data is used if it is None.
     """
+    if results is None:
+        results = placeholder_results()
+
+    # Correlation statistics drive the titles and takeaway text
+    fid_scores = results["fid"].to_numpy()
+    ssm_scores = results["ssm"].to_numpy()
+    lp_scores = results["lp_accuracy"].to_numpy()
+    ssm_stats = bootstrap_correlations(ssm_scores, fid_scores, n_boot=n_boot)
+    lp_stats = bootstrap_correlations(lp_scores, fid_scores, n_boot=n_boot, seed=1)
+    ssm_r = abs(ssm_stats["pearson"][0])
+    lp_r = abs(lp_stats["pearson"][0])
 
     # Create figure with subplots
     fig = plt.figure(figsize=(16, 10), dpi=100)
 
     # Define layout: 2 rows, 3 columns
     gs = fig.add_gridspec(2, 3, hspace=0.3, wspace=0.3,
-                          left=0.08, right=0.95, bottom=0.08, top=0.92)
+                          left=0.08, right=0.95, bottom=0.08, top=0.88)
 
     # Title
     fig.suptitle('What Drives Representation Alignment: Global Information or Spatial Structure?',
@@ -53,17 +157,10 @@ def create_teaser_figure():
     # --- SUBPLOT 1: Correlation SSM vs FID ---
     ax1 = fig.add_subplot(gs[0, 0])
 
-    # TODO: Replace with actual data
-    # This is example data - replace with your actual encoder data
-    np.random.seed(42)
-    n_encoders = 27
-    fid_scores = np.random.uniform(15, 40, n_encoders)
-    ssm_scores = -fid_scores + np.random.normal(0, 3, n_encoders)  # High correlation
-
     ax1.scatter(ssm_scores, fid_scores, s=100, alpha=0.6, c='#667eea', edgecolors='black', linewidth=0.5)
     ax1.set_xlabel('Spatial Structure Metric (SSM)')
     ax1.set_ylabel('FID Score (↓ better)')
-    ax1.set_title('SSM vs FID: |r| = 0.852', fontweight='bold')
+    ax1.set_title(correlation_title('SSM vs FID', ssm_stats), fontweight='bold')
     ax1.grid(True, alpha=0.3)
 
     # Add trend line
@@ -75,29 +172,31 @@ def create_teaser_figure():
     # --- SUBPLOT 2: Correlation LP vs FID ---
     ax2 = fig.add_subplot(gs[0, 1])
 
-    # TODO: Replace with actual data
-    lp_scores = np.random.uniform(50, 85, n_encoders)  # ImageNet accuracy
-    fid_scores_2 = np.random.uniform(15, 40, n_encoders)  # Low correlation
-
-    ax2.scatter(lp_scores, fid_scores_2, s=100, alpha=0.6, c='#999999', edgecolors='black', linewidth=0.5)
+    ax2.scatter(lp_scores, fid_scores, s=100, alpha=0.6, c='#999999', edgecolors='black', linewidth=0.5)
     ax2.set_xlabel('Linear Probing Accuracy (%)')
     ax2.set_ylabel('FID Score (↓ better)')
-    ax2.set_title('LP Accuracy vs FID: |r| = 0.26', fontweight='bold')
+    ax2.set_title(correlation_title('LP Accuracy vs FID', lp_stats), fontweight='bold')
     ax2.grid(True, alpha=0.3)
 
+    # Add trend line
+    z = np.polyfit(lp_scores, fid_scores, 1)
+    p = np.poly1d(z)
+    x_line = np.linspace(lp_scores.min(), lp_scores.max(), 100)
+    ax2.plot(x_line, p(x_line), "--", color='#666666', alpha=0.8, linewidth=2)
+
     # --- SUBPLOT 3: Key Takeaway ---
     ax3 = fig.add_subplot(gs[0, 2])
     ax3.axis('off')
 
-    takeaway_text = """
+    takeaway_text = f"""
     KEY FINDING:
 
     Spatial Structure >> Global Information
 
-    • SSM correlation: |r| = 0.852
-    • LP correlation: |r| = 0.26
+    • SSM correlation: |r| = {ssm_r:.3f}
+    • LP correlation: |r| = {lp_r:.2f}
 
-    ⟹ 3× better predictor
+    ⟹ {ssm_r / max(lp_r, 1e-6):.1f}× better predictor
 
     Encoders with lower ImageNet
     accuracy but better spatial
@@ -182,13 +281,33 @@ def create_teaser_figure():
     print("\nNext steps:")
     print(f"1. Review the figure: open {output_path}")
     print("2. Copy to static: cp assets/figures/teaser.png static/img/")
-    print("3. Replace data with actual experimental results")
+    print("3. Regenerate with real data: python plot_teaser.py --results <file.csv>")
 
     return str(output_path)
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Generate the iREPA teaser figure")
+    parser.add_argument("--results", type=str, default=None,
+                        help="Per-encoder results (CSV or JSON) with encoder, fid, ssm, lp_accuracy")
+    parser.add_argument("--n-boot", type=int, default=10000,
+                        help="Bootstrap resamples for confidence intervals (default: 10000)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.results:
+        results = load_results(args.results)
+        print(f"Loaded {len(results)} encoders from {args.results}")
+    else:
+        results = None
+        print("No --results given, using placeholder data (not real encoder results)")
+
+    create_teaser_figure(results, n_boot=args.n_boot)
+    print(f"  Done in {time.perf_counter() - start:.2f}s")
+
+
 if __name__ == "__main__":
     print("Generating teaser figure...")
     print("="*60)
-    create_teaser_figure()
+    main()
     print("="*60)
\ No newline at end of file
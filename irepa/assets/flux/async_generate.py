@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Concurrent Flux generation engine for the iREPA asset scripts.
+
+All requested prompts are submitted to Replicate at once, bounded by a
+concurrency cap. Each prediction is created and then polled; one that times
+out (or whose task is cancelled) is cancelled on Replicate too, so it stops
+billing before a retry starts a new one. Only transient errors (timeouts,
+network errors, HTTP 429/5xx) are retried, with exponential backoff. Each
+finished prediction is downloaded and post-processed (e.g. optimize_icon) as
+soon as it lands, while the others are still running.
+
+To exercise it without the real API, start the local stub and point the
+client at it:
+    python stub_replicate.py --port 8765 &
+    REPLICATE_BASE_URL=http://127.0.0.1:8765 REPLICATE_API_TOKEN=stub \\
+        python generate_icons.py
+
+Requirements:
+    pip install replicate pyyaml pillow
+"""
+
+import asyncio
+import random
+import time
+
+import httpx
+import replicate
+from replicate.exceptions import ModelError, ReplicateError
+
+from downloader import download_outputs, output_urls
+from flux_common import MODEL, build_input
+from generation_cache import cache_key
+
+
+def is_transient(error):
+    """True for errors worth retrying: timeouts, network errors and HTTP 429/5xx responses."""
+    if isinstance(error, (asyncio.TimeoutError, httpx.TransportError)):
+        return True
+    if isinstance(error, ReplicateError):
+        return error.status is None or error.status == 429 or error.status >= 500
+    return False
+
+
+async def cancel_prediction(prediction):
+    """Cancel a prediction on Replicate; best effort, a failure is only reported."""
+    try:
+        await asyncio.shield(prediction.async_cancel())
+    except Exception as e:
+        print(f"  Could not cancel prediction {prediction.id}: {e}")
+
+
+async def run_prediction(client, model_input, timeout):
+    """Create a prediction and poll it to completion; returns its output.
+
+    On timeout, cancellation or a polling error the remote prediction is
+    cancelled before the exception propagates. A prediction that finishes as
+    failed or canceled raises ModelError.
+    """
+    prediction = await client.predictions.async_create(model=MODEL, input=model_input)
+    try:
+        await asyncio.wait_for(prediction.async_wait(), timeout=timeout)
+    except BaseException:
+        await cancel_prediction(prediction)
+        raise
+    if prediction.status != "succeeded":
+        raise ModelError(prediction)
+    return prediction.output
+
+
+async def generate_one(client, name, prompt_config, output_dir, semaphore, postprocess=None,
+                       default_aspect_ratio="1:1", retries=3, timeout=300.0, backoff=2.0,
+                       cache=None, force=False):
+    """Run one prediction with retries, then download and post-process it."""
+    model_input = build_input(prompt_config, default_aspect_ratio)
+    key = cache_key(MODEL, model_input, prompt_config.get("seed"))
+    output_file = output_dir / f"{prompt_config['output_file']}_raw.png"
+    start = time.perf_counter()
+
+    # Unchanged prompts are served from the cache without touching the API
+    if cache is not None and not force:
+        if await asyncio.to_thread(cache.fetch, key, output_file):
+            print(f"✓ Cached {name}: {output_file}")
+            if postprocess is not None:
+                return await asyncio.to_thread(postprocess, name, prompt_config, output_file)
+            return output_file
+
+    # Only the remote prediction holds a concurrency slot
+    async with semaphore:
+        for attempt in range(retries + 1):
+            try:
+                output = await run_prediction(client, model_input, timeout)
+                break
+            except Exception as e:
+                reason = "timed out" if isinstance(e, asyncio.TimeoutError) else e
+                if not is_transient(e):
+                    print(f"✗ {name}: {reason}")
+                    return None
+                if attempt == retries:
+                    print(f"✗ {name}: giving up after {retries + 1} attempts ({reason})")
+                    return None
+                delay = backoff * 2 ** attempt * (1 + random.random())
+                print(f"  {name}: attempt {attempt + 1} failed ({reason}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    image_urls = output_urls(output)
+    image_url = image_urls[0]
+    print(f"✓ Generated {name}: {image_url} ({time.perf_counter() - start:.1f}s)")
+
+    # Download and post-process off the event loop so other predictions keep flowing
+    try:
+        saved, digests = await asyncio.to_thread(
+            download_outputs, image_urls, output_dir, prompt_config["output_file"]
+        )
+        print(f"✓ Saved to: {', '.join(str(path) for path in saved)}")
+        if cache is not None:
+            await asyncio.to_thread(cache.put, key, saved, {
+                "name": prompt_config["name"],
+                "model": MODEL,
+                "input": model_input,
+                "seed": prompt_config.get("seed"),
+                "image_url": image_url,
+            }, sha256=digests)
+        if postprocess is not None:
+            return await asyncio.to_thread(postprocess, name, prompt_config, output_file)
+    except Exception as e:
+        print(f"✗ {name}: error after generation: {e}")
+        return None
+
+    return output_file
+
+
+async def generate_all(prompt_configs, output_dir, postprocess=None, default_aspect_ratio="1:1",
+                       concurrency=4, retries=3, timeout=300.0, backoff=2.0, client=None,
+                       cache=None, force=False):
+    """
+    Generate every entry of `prompt_configs` ({name: prompts.yaml entry}) concurrently.
+
+    `postprocess(name, prompt_config, raw_path)` runs in a worker thread as soon as
+    each download finishes; its return value (or the raw path if no postprocess is
+    given) is collected per name. Failed items map to None. With a `cache`
+    (generation_cache.GenerationCache), unchanged prompts skip the API unless
+    `force` is set.
+    """
+    if client is None:
+        client = replicate.Client()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        generate_one(client, name, config, output_dir, semaphore, postprocess=postprocess,
+                     default_aspect_ratio=default_aspect_ratio, retries=retries,
+                     timeout=timeout, backoff=backoff, cache=cache, force=force)
+        for name, config in prompt_configs.items()
+    ])
+    print(f"\n✓ {sum(r is not None for r in results)}/{len(results)} items finished "
+          f"in {time.perf_counter() - start:.1f}s (concurrency={concurrency})")
+
+    return dict(zip(prompt_configs, results))
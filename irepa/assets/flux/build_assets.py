@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Build the site's Flux assets from prompts.yaml as one pipelined job graph.
+
+By default the jobs are hero_image and the icon_* entries, the images the
+page uses. Other entries (e.g. hero_image_alt) are paid generations that
+would publish files nothing references, so they are built only when named
+with --only.
+
+Each job runs
+    remote generation -> local optimization (process pool) -> publish to static/img
+and jobs overlap: while one image is still generating remotely, finished ones
+are already being optimized and copied. Entries named icon_* are optimized
+with optimize_icon and published to static/img/icons/; all others use
+optimize_image and go to static/img/.
+
+A job is skipped when its published file still matches the recorded
+generation key, optimization settings and content hash (outputs/build_state.json).
+
+Usage:
+    python build_assets.py                   # Build the hero and icons that are out of date
+    python build_assets.py --dry-run         # Show what would run
+    python build_assets.py --only hero_image icon_irepa
+    python build_assets.py --only hero_image_alt   # Opt-in entries must be named
+    python build_assets.py --force           # Regenerate and rebuild everything
+
+Requirements:
+    pip install replicate pyyaml pillow
+"""
+
+import argparse
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import replicate
+
+from async_generate import generate_one
+from flux_common import (Image, generation_key, load_prompts, make_cache, optimize_icon,
+                         optimize_image, require_api_token)
+
+SCRIPT_DIR = Path(__file__).parent
+OUTPUTS_DIR = SCRIPT_DIR / "outputs"
+STATIC_IMG_DIR = SCRIPT_DIR.parent.parent / "static" / "img"
+STATE_FILE = OUTPUTS_DIR / "build_state.json"
+
+# Entries built when --only is not given
+DEFAULT_JOBS = ("hero_image",)
+DEFAULT_JOB_PREFIX = "icon_"
+
+# Optimizer, its settings, default aspect ratio and publish directory per asset kind
+ASSET_KINDS = {
+    "icon": (optimize_icon, {"size": 256}, "1:1", STATIC_IMG_DIR / "icons"),
+    "image": (optimize_image, {"max_width": 1920}, "16:9", STATIC_IMG_DIR),
+}
+
+
+def plan_jobs(prompts, only=None):
+    """Turn prompts.yaml entries into build jobs: the `only` names, else hero_image and icon_*."""
+    jobs = []
+    for name, config in prompts.items():
+        if not isinstance(config, dict) or "prompt" not in config:
+            continue
+        if only is not None:
+            if name not in only:
+                continue
+        elif name not in DEFAULT_JOBS and not name.startswith(DEFAULT_JOB_PREFIX):
+            continue
+        kind = "icon" if name.startswith("icon_") else "image"
+        optimizer, params, aspect_ratio, publish_dir = ASSET_KINDS[kind]
+        jobs.append({
+            "name": name,
+            "config": config,
+            "kind": kind,
+            "optimizer": optimizer,
+            "params": params,
+            "aspect_ratio": aspect_ratio,
+            "key": generation_key(config, aspect_ratio),
+            "optimized": OUTPUTS_DIR / f"{config['output_file']}.png",
+            "published": publish_dir / f"{config['output_file']}.png",
+        })
+    return jobs
+
+
+def file_sha256(path):
+    """SHA-256 of a file, or None if it does not exist."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def load_state():
+    """Load the per-job build records."""
+    if not STATE_FILE.exists():
+        return {}
+    with open(STATE_FILE) as f:
+        return json.load(f)
+
+
+def save_state(state):
+    """Write the per-job build records atomically."""
+    tmp = STATE_FILE.with_suffix(".json.tmp")
+    with open(tmp, "w") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp, STATE_FILE)
+
+
+def is_up_to_date(job, state):
+    """True if the published file still matches this job's generation key and settings."""
+    record = state.get(job["name"])
+    return (
+        record is not None
+        and record["key"] == job["key"]
+        and record["params"] == job["params"]
+        and record["published"] == str(job["published"])
+        and record["sha256"] == file_sha256(job["published"])
+    )
+
+
+def publish(optimized, published):
+    """Copy an optimized asset into static/img atomically; returns its SHA-256."""
+    published.parent.mkdir(parents=True, exist_ok=True)
+    tmp = published.with_name(published.name + ".tmp")
+    shutil.copyfile(optimized, tmp)
+    os.replace(tmp, published)
+    return file_sha256(published)
+
+
+async def run_job(job, client, semaphore, process_pool, cache, args, state, timings):
+    """Generate, optimize and publish one asset, recording per-stage timings."""
+    loop = asyncio.get_running_loop()
+    name = job["name"]
+
+    start = time.perf_counter()
+    raw = await generate_one(client, name, job["config"], OUTPUTS_DIR, semaphore,
+                             default_aspect_ratio=job["aspect_ratio"], retries=args.retries,
+                             timeout=args.timeout, cache=cache, force=args.force)
+    generated = time.perf_counter()
+    if raw is None:
+        return False
+
+    # CPU-bound resize/compress runs in a separate process
+    optimize = functools.partial(job["optimizer"], str(raw), str(job["optimized"]), **job["params"])
+    if await loop.run_in_executor(process_pool, optimize) is None:
+        print(f"✗ {name}: optimization failed")
+        return False
+    optimized = time.perf_counter()
+
+    sha256 = await asyncio.to_thread(publish, job["optimized"], job["published"])
+    published = time.perf_counter()
+    print(f"✓ Published {name}: {job['published']}")
+
+    state[name] = {
+        "key": job["key"],
+        "params": job["params"],
+        "published": str(job["published"]),
+        "sha256": sha256,
+    }
+    save_state(state)
+    timings[name] = (generated - start, optimized - generated, published - optimized)
+    return True
+
+
+async def build(jobs, args, cache, state):
+    """Run all jobs concurrently: generation slots are capped, optimization uses a process pool."""
+    client = replicate.Client()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    timings = {}
+    with ProcessPoolExecutor(max_workers=args.workers) as process_pool:
+        results = await asyncio.gather(*[
+            run_job(job, client, semaphore, process_pool, cache, args, state, timings)
+            for job in jobs
+        ])
+    return dict(zip((job["name"] for job in jobs), results)), timings
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate, optimize and publish the Flux hero image and icons from prompts.yaml",
+    )
+    parser.add_argument("--only", nargs="+", default=None, metavar="NAME",
+                        help="Build these prompts.yaml entries instead of hero_image and icon_*")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Show what would be built without generating or writing anything")
+    parser.add_argument("--force", action="store_true",
+                        help="Ignore cached generations and up-to-date checks")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Do not read or write the generation cache")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="Max remote predictions in flight (default: 4)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Optimization processes (default: CPU count)")
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=300.0)
+    args = parser.parse_args()
+
+    prompts = load_prompts()
+    jobs = plan_jobs(prompts, only=set(args.only) if args.only else None)
+    if args.only:
+        unknown = set(args.only) - {job["name"] for job in jobs}
+        if unknown:
+            parser.error(f"Unknown prompt(s): {', '.join(sorted(unknown))}")
+
+    OUTPUTS_DIR.mkdir(exist_ok=True)
+    cache = make_cache(["--no-cache"] if args.no_cache else [])
+    state = load_state()
+
+    # Decide what needs to run
+    pending, needs_api = [], False
+    print("=" * 60)
+    print(f"Flux asset build: {len(jobs)} job(s)")
+    print("=" * 60)
+    for job in jobs:
+        if not args.force and is_up_to_date(job, state):
+            action = "up to date"
+        else:
+            pending.append(job)
+            cached = cache is not None and not args.force and cache.get(job["key"]) is not None
+            needs_api = needs_api or not cached
+            action = f"{'cached' if cached else 'generate'} -> {job['kind']} -> {job['published']}"
+        print(f"  {job['name']:<16} {action}")
+
+    if args.dry_run or not pending:
+        print("\nDry run: nothing was written." if args.dry_run else "\n✓ Everything is up to date.")
+        return
+
+    if Image is None:
+        print("Error: pillow is required to optimize assets (pip install pillow)")
+        return
+    if needs_api:
+        require_api_token()
+
+    start = time.perf_counter()
+    results, timings = asyncio.run(build(pending, args, cache, state))
+    total = time.perf_counter() - start
+
+    # Summary
+    print("\n" + "=" * 60)
+    print(f"✓ Built {sum(results.values())}/{len(pending)} asset(s) in {total:.1f}s")
+    print("=" * 60)
+    print(f"  {'job':<16} {'generate':>9} {'optimize':>9} {'publish':>9}")
+    for name, ok in results.items():
+        if ok:
+            gen, opt, pub = timings[name]
+            print(f"  {name:<16} {gen:>8.1f}s {opt:>8.1f}s {pub:>8.2f}s")
+        else:
+            print(f"  {name:<16} failed")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Pooled, streaming, resumable downloader for the Flux scripts.
+
+Replaces urllib.request.urlretrieve with:
+  - keep-alive connections reused across downloads (one pool per host)
+  - chunked streaming into <dest>.part, renamed atomically when complete
+  - Range-based resume of the .part file between retries of the same download
+  - the completed file checked against the total size the server reported
+    and, if given, an expected SHA-256; a mismatch is retried from scratch
+  - SHA-256 of the completed file, returned to the caller
+  - parallel downloads for predictions with several outputs
+
+Usage:
+    python downloader.py URL [URL ...] [--out-dir DIR] [--workers N]
+
+Only the standard library is used, so it can be tested against any local
+HTTP server (e.g. stub_replicate.py, which serves /files/<id>.png with Range support).
+"""
+
+import argparse
+import hashlib
+import http.client
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+CHUNK_SIZE = 1024 * 1024
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+
+class DownloadError(Exception):
+    """Raised when a download fails after all retries."""
+
+    def __init__(self, message, retryable=True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class ConnectionPool:
+    """Thread-safe pool of keep-alive HTTP(S) connections, keyed by (scheme, host, port)."""
+
+    def __init__(self, max_per_host=8, timeout=60.0):
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, scheme, netloc):
+        """Return an idle connection to `netloc`, or open a new one."""
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), queue.LifoQueue())
+        try:
+            return idle.get_nowait()
+        except queue.Empty:
+            if scheme == "https":
+                return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+            return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def release(self, scheme, netloc, conn):
+        """Return a connection whose response was fully read; extras are closed."""
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), queue.LifoQueue())
+        if idle.qsize() < self.max_per_host:
+            idle.put(conn)
+        else:
+            conn.close()
+
+    def close(self):
+        """Close every idle connection."""
+        with self._lock:
+            pools, self._idle = list(self._idle.values()), {}
+        for idle in pools:
+            while not idle.empty():
+                idle.get_nowait().close()
+
+
+DEFAULT_POOL = ConnectionPool()
+
+
+def _content_range(value):
+    """(start, total) of a `Content-Range: bytes start-end/total` or `bytes */total` header.
+
+    Either is None when missing or unknown ("*").
+    """
+    unit, _, spec = (value or "").partition(" ")
+    if unit != "bytes":
+        return None, None
+    span, _, total = spec.partition("/")
+    start = span.split("-", 1)[0]
+    return (int(start) if start.isdigit() else None,
+            int(total) if total.isdigit() else None)
+
+
+def file_sha256(path, chunk_size=CHUNK_SIZE):
+    """SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stream_once(url, part_path, pool, chunk_size, max_redirects=5):
+    """Fetch `url` into `part_path`, resuming from its current size.
+
+    Returns the total size of the resource as reported by the server, or None
+    if it did not say.
+    """
+    for _ in range(max_redirects + 1):
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        headers = {"Connection": "keep-alive", "User-Agent": "irepa-flux-downloader"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+
+        conn = pool.acquire(parts.scheme, parts.netloc)
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+        except Exception:
+            conn.close()
+            raise
+
+        reusable = True
+        try:
+            if response.status in REDIRECT_CODES:
+                response.read()
+                url = urljoin(url, response.getheader("Location"))
+                continue
+
+            if response.status == 416 and offset:
+                # Nothing left to fetch: the .part file already holds the whole body
+                response.read()
+                return _content_range(response.getheader("Content-Range"))[1]
+            if response.status not in (200, 206):
+                response.read()
+                retryable = response.status >= 500 or response.status in (408, 429)
+                raise DownloadError(f"HTTP {response.status} for {url}", retryable=retryable)
+
+            expected = response.getheader("Content-Length")
+            total = int(expected) if expected is not None else None
+            if response.status == 206:
+                # Only append if the server resumes exactly where the .part file ends
+                start, total = _content_range(response.getheader("Content-Range"))
+                if start != offset:
+                    response.read()
+                    part_path.unlink(missing_ok=True)
+                    raise DownloadError(f"Content-Range start {start} != offset {offset} for {url}")
+
+            # 200 means the server ignored the Range header: start over
+            mode = "ab" if response.status == 206 else "wb"
+            received = 0
+            with open(part_path, mode) as f:
+                while True:
+                    chunk = response.read(chunk_size)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    received += len(chunk)
+
+            if expected is not None and received != int(expected):
+                reusable = False
+                raise DownloadError(f"Incomplete body for {url}: {received}/{expected} bytes")
+            return total
+        except Exception:
+            reusable = False
+            raise
+        finally:
+            if reusable and not response.will_close:
+                pool.release(parts.scheme, parts.netloc, conn)
+            else:
+                conn.close()
+
+    raise DownloadError(f"Too many redirects for {url}")
+
+
+def download(url, dest, expected_sha256=None, pool=None, retries=3, backoff=1.0, chunk_size=CHUNK_SIZE):
+    """
+    Download `url` to `dest` and return its SHA-256 hex digest.
+
+    Data streams into `<dest>.part`; on network errors the next attempt resumes
+    it with a Range request. The file is renamed onto `dest` only once it is
+    complete: its size matches the total the server reported and, if
+    `expected_sha256` is given, its digest matches. Otherwise the .part file is
+    discarded and the download retried from the start.
+    """
+    pool = pool or DEFAULT_POOL
+    dest = Path(dest)
+    part_path = dest.with_name(dest.name + ".part")
+    # A .part left by an earlier run may belong to a different URL; never resume onto it
+    part_path.unlink(missing_ok=True)
+
+    for attempt in range(retries + 1):
+        try:
+            total = _stream_once(url, part_path, pool, chunk_size)
+            size = part_path.stat().st_size
+            if total is not None and size != total:
+                part_path.unlink(missing_ok=True)
+                raise DownloadError(f"Size mismatch for {url}: {size} != {total} bytes")
+            digest = file_sha256(part_path, chunk_size)
+            if expected_sha256 is not None and digest != expected_sha256:
+                part_path.unlink(missing_ok=True)
+                raise DownloadError(f"SHA-256 mismatch for {url}: {digest} != {expected_sha256}")
+            break
+        except (OSError, http.client.HTTPException, DownloadError) as e:
+            if attempt == retries or not getattr(e, "retryable", True):
+                raise DownloadError(f"Failed to download {url}: {e}") from e
+            time.sleep(backoff * 2 ** attempt)
+
+    os.replace(part_path, dest)
+    return digest
+
+
+def download_all(jobs, max_workers=4, pool=None, **kwargs):
+    """
+    Download several (url, dest) or (url, dest, expected_sha256) jobs in parallel
+    over a shared connection pool.
+
+    Returns the SHA-256 digests in the same order as `jobs`.
+    """
+    pool = pool or DEFAULT_POOL
+    jobs = list(jobs)
+    if len(jobs) == 1:
+        return [download(*jobs[0], pool=pool, **kwargs)]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        futures = [executor.submit(download, *job, pool=pool, **kwargs) for job in jobs]
+        return [future.result() for future in futures]
+
+
+def output_urls(output):
+    """Normalize a Replicate output (URL, file output or list of either) to a list of URLs."""
+    if not isinstance(output, (list, tuple)):
+        output = [output]
+    return [getattr(item, "url", None) or str(item) for item in output]
+
+
+def download_outputs(output, output_dir, stem, pool=None):
+    """
+    Download every image of a prediction in parallel.
+
+    The first output is saved as <stem>_raw.png and any further ones as
+    <stem>_raw_<i>.png. Returns (saved paths, their SHA-256 digests).
+    """
+    urls = output_urls(output)
+    paths = [Path(output_dir) / (f"{stem}_raw.png" if i == 0 else f"{stem}_raw_{i}.png")
+             for i in range(len(urls))]
+    digests = download_all(zip(urls, paths), pool=pool)
+    return paths, digests
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download files with pooling, resume and hashing")
+    parser.add_argument("urls", nargs="+")
+    parser.add_argument("--out-dir", type=str, default=".")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    jobs = [(url, out_dir / (Path(urlsplit(url).path).name or "download")) for url in args.urls]
+
+    start = time.perf_counter()
+    digests = download_all(jobs, max_workers=args.workers)
+    for (url, dest), digest in zip(jobs, digests):
+        print(f"✓ {dest} ({dest.stat().st_size} bytes, sha256 {digest[:16]}...)")
+    print(f"✓ {len(jobs)} file(s) in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
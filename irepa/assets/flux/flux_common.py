@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Shared Flux helpers for the iREPA asset scripts.
+
+generate_hero.py, generate_icons.py, async_generate.py and build_assets.py all
+load prompts.yaml, build the same Flux input, call Replicate through the
+generation cache and optimize the result with Pillow; that code lives here.
+
+Requirements:
+    pip install replicate pyyaml pillow
+"""
+
+import os
+import sys
+import yaml
+from pathlib import Path
+
+from downloader import download_outputs, output_urls
+from generation_cache import GenerationCache, cache_key
+
+try:
+    import replicate
+except ImportError:
+    print("Error: replicate package not installed")
+    print("Install with: pip install replicate")
+    sys.exit(1)
+
+try:
+    from PIL import Image
+except ImportError:
+    print("Warning: pillow not installed, skipping optimization")
+    print("Install with: pip install pillow")
+    Image = None
+
+MODEL = "black-forest-labs/flux-schnell"
+PROMPTS_FILE = Path(__file__).parent / "prompts.yaml"
+
+
+def load_prompts():
+    """Load prompts from YAML file."""
+    with open(PROMPTS_FILE) as f:
+        return yaml.safe_load(f)
+
+
+def require_api_token():
+    """Exit with instructions if the Replicate API token is missing."""
+    if not os.getenv("REPLICATE_API_TOKEN"):
+        print("Error: REPLICATE_API_TOKEN not set")
+        print("Get your token at https://replicate.com/account")
+        print("Then: export REPLICATE_API_TOKEN='your-token-here'")
+        sys.exit(1)
+
+
+def build_input(prompt_config, default_aspect_ratio="1:1"):
+    """Build the Flux input dict for one prompts.yaml entry."""
+    model_input = {
+        "prompt": prompt_config["prompt"],
+        "num_outputs": prompt_config.get("num_outputs", 1),
+        "aspect_ratio": prompt_config.get("dimensions", default_aspect_ratio),
+        "output_format": "png",
+        "output_quality": 100,
+    }
+    if "seed" in prompt_config:
+        model_input["seed"] = prompt_config["seed"]
+    return model_input
+
+
+def generation_key(prompt_config, default_aspect_ratio="1:1"):
+    """Cache key for one prompts.yaml entry (see generation_cache.cache_key)."""
+    return cache_key(MODEL, build_input(prompt_config, default_aspect_ratio), prompt_config.get("seed"))
+
+
+def make_cache(argv):
+    """Build the generation cache from --no-cache / --cache-max-mb=N flags."""
+    if "--no-cache" in argv:
+        return None
+    max_mb = next((float(a.split("=")[1]) for a in argv if a.startswith("--cache-max-mb=")), None)
+    if max_mb is None:
+        return GenerationCache()
+    return GenerationCache(max_bytes=int(max_mb * 1024 ** 2))
+
+
+def generate_image(prompt_config, output_dir, cache=None, force=False, default_aspect_ratio="1:1"):
+    """Generate image using Flux via Replicate.
+
+    If `cache` is given, an unchanged (model, input, seed) is served from it
+    instead of calling the API again; `force` skips the lookup and refreshes it.
+    """
+    model_input = build_input(prompt_config, default_aspect_ratio)
+    output_file = output_dir / f"{prompt_config['output_file']}_raw.png"
+    key = cache_key(MODEL, model_input, prompt_config.get("seed"))
+    if cache is not None and not force and cache.fetch(key, output_file):
+        print(f"✓ Cached: {prompt_config['name']} -> {output_file}")
+        return output_file
+
+    require_api_token()
+
+    print(f"\nGenerating: {prompt_config['name']}")
+    print(f"Prompt: {prompt_config['prompt'][:100]}...")
+
+    # Generate with Flux
+    try:
+        output = replicate.run(MODEL, input=model_input)
+
+        # Get the output URLs
+        image_urls = output_urls(output)
+        image_url = image_urls[0]
+
+        print(f"✓ Generated: {image_url}")
+
+        # Download every output in parallel over pooled keep-alive connections
+        saved, digests = download_outputs(image_urls, output_dir, prompt_config["output_file"])
+        print(f"✓ Saved to: {', '.join(str(path) for path in saved)}")
+
+        if cache is not None:
+            cache.put(key, saved, {
+                "name": prompt_config["name"],
+                "model": MODEL,
+                "input": model_input,
+                "seed": prompt_config.get("seed"),
+                "image_url": image_url,
+            }, sha256=digests)
+
+        return output_file
+
+    except Exception as e:
+        print(f"Error generating image: {e}")
+        return None
+
+
+def optimize_image(input_path, output_path, max_width=1920):
+    """Optimize image for web (resize and compress). Returns the output path or None."""
+    if Image is None:
+        print("Skipping optimization (pillow not installed)")
+        return None
+
+    try:
+        img = Image.open(input_path)
+
+        # Resize if too large
+        if img.width > max_width:
+            ratio = max_width / img.width
+            new_size = (max_width, int(img.height * ratio))
+            img = img.resize(new_size, Image.Resampling.LANCZOS)
+
+        # Save optimized
+        img.save(output_path, "PNG", optimize=True, quality=95)
+        print(f"✓ Optimized: {output_path}")
+        return output_path
+
+    except Exception as e:
+        print(f"Error optimizing image: {e}")
+        return None
+
+
+def optimize_icon(input_path, output_path, size=256):
+    """Optimize icon for web (resize to square and compress). Returns the output path or None."""
+    if Image is None:
+        print("Skipping optimization (pillow not installed)")
+        return None
+
+    try:
+        img = Image.open(input_path)
+
+        # Convert to RGBA if needed
+        if img.mode != "RGBA":
+            img = img.convert("RGBA")
+
+        # Resize to square
+        img = img.resize((size, size), Image.Resampling.LANCZOS)
+
+        # Save optimized
+        img.save(output_path, "PNG", optimize=True)
+        print(f"✓ Optimized: {output_path} ({size}x{size})")
+        return output_path
+
+    except Exception as e:
+        print(f"Error optimizing icon: {e}")
+        return None
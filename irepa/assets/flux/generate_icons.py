@@ -4,7 +4,16 @@ Generate takeaway icons for iREPA project page using Flux AI.
 
 Usage:
     python generate_icons.py [--icon NAME]  # Generate specific icon
-    python generate_icons.py                 # Generate all icons
+    python generate_icons.py                 # Generate all icons (concurrently)
+
+Options:
+    --concurrency=N   Max predictions in flight at once (default: 4)
+    --retries=N       Retries per icon, with exponential backoff (default: 3)
+    --timeout=SECS    Per-prediction timeout (default: 300)
+    --sequential      Generate one icon at a time (old behaviour)
+    --force           Ignore cached results and regenerate
+    --no-cache        Do not read or write the generation cache
+    --cache-max-mb=N  Evict least recently used cache entries beyond N MB
 
 Requirements:
     pip install replicate pyyaml pillow
@@ -13,100 +22,12 @@ Set your API key:
     export REPLICATE_API_TOKEN="your-token-here"
 """
 
-import os
+import asyncio
 import sys
-import yaml
 from pathlib import Path
 
-try:
-    import replicate
-except ImportError:
-    print("Error: replicate package not installed")
-    print("Install with: pip install replicate")
-    sys.exit(1)
-
-try:
-    from PIL import Image
-except ImportError:
-    print("Warning: pillow not installed, skipping optimization")
-    Image = None
-
-
-def load_prompts():
-    """Load prompts from YAML file."""
-    prompts_file = Path(__file__).parent / "prompts.yaml"
-    with open(prompts_file) as f:
-        return yaml.safe_load(f)
-
-
-def generate_image(prompt_config, output_dir):
-    """Generate image using Flux via Replicate."""
-    # Check for API token
-    if not os.getenv("REPLICATE_API_TOKEN"):
-        print("Error: REPLICATE_API_TOKEN not set")
-        print("Get your token at https://replicate.com/account")
-        print("Then: export REPLICATE_API_TOKEN='your-token-here'")
-        sys.exit(1)
-
-    print(f"\nGenerating: {prompt_config['name']}")
-    print(f"Prompt: {prompt_config['prompt'][:100]}...")
-
-    # Generate with Flux
-    try:
-        output = replicate.run(
-            "black-forest-labs/flux-schnell",
-            input={
-                "prompt": prompt_config["prompt"],
-                "num_outputs": 1,
-                "aspect_ratio": prompt_config.get("dimensions", "1:1"),
-                "output_format": "png",
-                "output_quality": 100,
-            }
-        )
-
-        # Get the output URL
-        if isinstance(output, list):
-            image_url = output[0]
-        else:
-            image_url = output
-
-        print(f"✓ Generated: {image_url}")
-
-        # Download the image
-        import urllib.request
-        output_file = output_dir / f"{prompt_config['output_file']}_raw.png"
-        urllib.request.urlretrieve(image_url, output_file)
-        print(f"✓ Saved to: {output_file}")
-
-        return output_file
-
-    except Exception as e:
-        print(f"Error generating image: {e}")
-        return None
-
-
-def optimize_icon(input_path, output_path, size=256):
-    """Optimize icon for web (resize to square and compress)."""
-    if Image is None:
-        print("Skipping optimization (pillow not installed)")
-        return
-
-    try:
-        img = Image.open(input_path)
-
-        # Convert to RGBA if needed
-        if img.mode != "RGBA":
-            img = img.convert("RGBA")
-
-        # Resize to square
-        img = img.resize((size, size), Image.Resampling.LANCZOS)
-
-        # Save optimized
-        img.save(output_path, "PNG", optimize=True)
-        print(f"✓ Optimized: {output_path} ({size}x{size})")
-
-    except Exception as e:
-        print(f"Error optimizing icon: {e}")
+from flux_common import (Image, generate_image, generation_key, load_prompts, make_cache,
+                         optimize_icon, require_api_token)
 
 
 def main():
@@ -122,9 +43,21 @@ def main():
 
     # Check if specific icon requested
     specific_icon = None
+    sequential = False
+    force = "--force" in sys.argv
+    cache = make_cache(sys.argv[1:])
+    concurrency, retries, timeout = 4, 3, 300.0
     for arg in sys.argv[1:]:
         if arg.startswith("--icon="):
             specific_icon = arg.split("=")[1]
+        elif arg.startswith("--concurrency="):
+            concurrency = int(arg.split("=")[1])
+        elif arg.startswith("--retries="):
+            retries = int(arg.split("=")[1])
+        elif arg.startswith("--timeout="):
+            timeout = float(arg.split("=")[1])
+        elif arg == "--sequential":
+            sequential = True
         elif arg in icon_configs:
             specific_icon = arg
 
@@ -143,18 +76,43 @@ def main():
 
     # Generate all icons
     generated = []
-    for name, config in icon_configs.items():
-        print(f"\n{'='*60}")
-        print(f"Processing: {name}")
-        print(f"{'='*60}")
-
-        raw_image = generate_image(config, outputs_dir)
-
-        if raw_image and Image:
-            # Optimize for web
+    if sequential:
+        for name, config in icon_configs.items():
+            print(f"\n{'='*60}")
+            print(f"Processing: {name}")
+            print(f"{'='*60}")
+
+            raw_image = generate_image(config, outputs_dir, cache=cache, force=force)
+
+            if raw_image and Image:
+                # Optimize for web
+                optimized_path = outputs_dir / f"{config['output_file']}.png"
+                optimize_icon(raw_image, optimized_path, size=256)
+                generated.append((name, optimized_path))
+    else:
+        from async_generate import generate_all
+
+        # The API is only needed for icons that are not cached yet
+        if force or cache is None or any(
+            cache.get(generation_key(config)) is None for config in icon_configs.values()
+        ):
+            require_api_token()
+
+        def optimize(name, config, raw_image):
+            # Runs in a worker thread as soon as this icon's download finishes
+            if Image is None:
+                return None
             optimized_path = outputs_dir / f"{config['output_file']}.png"
             optimize_icon(raw_image, optimized_path, size=256)
-            generated.append((name, optimized_path))
+            return optimized_path
+
+        print(f"\nSubmitting {len(icon_configs)} icon(s) with concurrency={concurrency}...")
+        results = asyncio.run(generate_all(
+            icon_configs, outputs_dir, postprocess=optimize,
+            concurrency=concurrency, retries=retries, timeout=timeout,
+            cache=cache, force=force,
+        ))
+        generated = [(name, path) for name, path in results.items() if path is not None]
 
     # Summary
     print("\n" + "="*60)
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for Flux generations.
+
+Each generation is keyed by a SHA-256 of (model, full input dict, seed), so a
+prompt that has not changed since the last run is served from disk instead of
+calling Replicate again. Entries are stored as <key>.png (plus <key>_<i>.png
+for every further output of a num_outputs > 1 prediction) and <key>.json
+metadata, and the least recently used entries are evicted once the cache
+grows past its size limit. An entry holding fewer images than its input's
+num_outputs is a miss. Each image's SHA-256 is recorded at put() time
+(checked against the digest the downloader computed, when given) and
+re-checked on every read; an entry that fails the check is dropped.
+
+put() and evict() may run concurrently from worker threads: they share a
+lock, and readers treat an entry that disappears mid-read as a miss.
+
+Usage:
+    python generation_cache.py            # Show cache stats
+    python generation_cache.py --clear    # Remove all cached generations
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / ".cache"
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3  # 2 GB
+
+
+def cache_key(model, model_input, seed=None):
+    """Hash the model, its full input dict and the seed into a cache key."""
+    payload = json.dumps(
+        {"model": model, "input": model_input, "seed": seed},
+        sort_keys=True, separators=(",", ":"), ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def file_sha256(path):
+    """SHA-256 hex digest of a file."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+class GenerationCache:
+    """On-disk store of generated images keyed by cache_key()."""
+
+    def __init__(self, root=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _paths(self, key):
+        shard = self.root / key[:2]
+        return shard / f"{key}.png", shard / f"{key}.json"
+
+    def _image_paths(self, key, count):
+        """Paths of the `count` images of an entry: <key>.png, <key>_1.png, ..."""
+        image_path, _ = self._paths(key)
+        return [image_path] + [image_path.with_name(f"{key}_{i}.png") for i in range(1, count)]
+
+    def get_all(self, key):
+        """Return every cached image path for `key` (one per output), or None on a miss."""
+        metadata = self.metadata(key)
+        if metadata is None:
+            return None
+        count = metadata.get("input", {}).get("num_outputs", 1)
+        image_paths = self._image_paths(key, count)
+        digests = metadata.get("sha256")
+        if isinstance(digests, str):
+            digests = [digests]  # Entries written before multi-output support
+        # Mark as recently used for LRU eviction
+        now = time.time()
+        try:
+            for path in image_paths + [self._paths(key)[1]]:
+                os.utime(path, (now, now))
+            intact = digests is None or [file_sha256(path) for path in image_paths] == digests[:count]
+        except FileNotFoundError:
+            return None  # Incomplete entry, or evicted by another thread in between
+        if not intact:
+            print(f"  Cache: dropping corrupt entry {key[:12]}")
+            self.remove(key)
+            return None
+        return image_paths
+
+    def get(self, key):
+        """Return the cached (first) image path for `key`, or None on a miss."""
+        image_paths = self.get_all(key)
+        return image_paths[0] if image_paths else None
+
+    def metadata(self, key):
+        """Return the stored metadata for `key`, or None on a miss."""
+        _, meta_path = self._paths(key)
+        try:
+            with open(meta_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def fetch(self, key, output_file):
+        """Copy a cached entry to `output_file`; returns the path or None on a miss.
+
+        Further outputs go next to it as <stem>_<i><suffix>, the names
+        downloader.download_outputs() gives them.
+        """
+        image_paths = self.get_all(key)
+        if image_paths is None:
+            return None
+        output_file = Path(output_file)
+        try:
+            for i, image_path in enumerate(image_paths):
+                dest = output_file if i == 0 else output_file.with_name(
+                    f"{output_file.stem}_{i}{output_file.suffix}")
+                shutil.copyfile(image_path, dest)
+        except FileNotFoundError:
+            return None
+        return output_file
+
+    def put(self, key, image_files, metadata, sha256=None):
+        """Store every downloaded output and the metadata, then evict down to the size limit.
+
+        `image_files` is the list of outputs in order (a single path is one output).
+        `sha256` lists their digests as computed by the downloader; if the stored
+        copies do not match, nothing is cached and ValueError is raised.
+        """
+        if isinstance(image_files, (str, os.PathLike)):
+            image_files = [image_files]
+        if isinstance(sha256, str):
+            sha256 = [sha256]
+        with self._lock:
+            return self._put(key, list(image_files), metadata, sha256)
+
+    def remove(self, key):
+        """Delete every file of an entry."""
+        image_path, meta_path = self._paths(key)
+        with self._lock:
+            meta_path.unlink(missing_ok=True)
+            for path in [image_path] + list(meta_path.parent.glob(f"{key}_*.png")):
+                path.unlink(missing_ok=True)
+
+    def _put(self, key, image_files, metadata, expected=None):
+        image_paths = self._image_paths(key, len(image_files))
+        _, meta_path = self._paths(key)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to temp names and rename so a crash never leaves a half entry;
+        # the metadata goes last, so it only ever describes complete images
+        tmp_images, digests, size = [], [], 0
+        for image_file, image_path in zip(image_files, image_paths):
+            tmp_image = image_path.with_suffix(".png.tmp")
+            shutil.copyfile(image_file, tmp_image)
+            digests.append(file_sha256(tmp_image))
+            size += tmp_image.stat().st_size
+            tmp_images.append(tmp_image)
+        if expected is not None and digests != list(expected):
+            for tmp_image in tmp_images:
+                tmp_image.unlink(missing_ok=True)
+            raise ValueError(f"Not caching {key[:12]}: stored images do not match the downloaded SHA-256")
+
+        metadata = dict(metadata, key=key, sha256=digests,
+                        bytes=size, cached_at=time.time())
+        tmp_meta = meta_path.with_suffix(".json.tmp")
+        with open(tmp_meta, "w") as f:
+            json.dump(metadata, f, indent=2, sort_keys=True)
+
+        meta_path.unlink(missing_ok=True)
+        for tmp_image, image_path in zip(tmp_images, image_paths):
+            os.replace(tmp_image, image_path)
+        os.replace(tmp_meta, meta_path)
+        self._evict(self.max_bytes)
+        return image_paths[0]
+
+    def entries(self):
+        """List (last_used, bytes, image_paths, meta_path) for every complete entry."""
+        entries = []
+        for meta_path in self.root.glob("*/*.json"):
+            image_path = meta_path.with_suffix(".png")
+            image_paths = [image_path] + sorted(meta_path.parent.glob(f"{meta_path.stem}_*.png"))
+            try:
+                image_stat = image_path.stat()
+                size = sum(path.stat().st_size for path in image_paths) + meta_path.stat().st_size
+            except FileNotFoundError:
+                continue  # Incomplete, or evicted while listing
+            entries.append((image_stat.st_mtime, size, image_paths, meta_path))
+        return entries
+
+    def evict(self, max_bytes=None):
+        """Remove least recently used entries until the cache fits in `max_bytes`."""
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        with self._lock:
+            return self._evict(max_bytes)
+
+    def _evict(self, max_bytes):
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _, _ in entries)
+        removed = 0
+        for _, size, image_paths, meta_path in entries:
+            if total <= max_bytes:
+                break
+            meta_path.unlink(missing_ok=True)
+            for image_path in image_paths:
+                image_path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        if removed:
+            print(f"  Cache: evicted {removed} entr{'y' if removed == 1 else 'ies'} "
+                  f"({total / 1024 ** 2:.1f} MB kept)")
+        return removed
+
+
+def main():
+    cache = GenerationCache()
+    if "--clear" in sys.argv:
+        removed = cache.evict(max_bytes=0)
+        print(f"✓ Cleared {removed} cached generation(s) from {cache.root}")
+        return
+
+    entries = cache.entries()
+    total = sum(size for _, size, _, _ in entries)
+    print(f"Cache: {cache.root}")
+    print(f"  Entries: {len(entries)}")
+    print(f"  Size: {total / 1024 ** 2:.1f} MB (limit {cache.max_bytes / 1024 ** 2:.0f} MB)")
+
+
+if __name__ == "__main__":
+    main()
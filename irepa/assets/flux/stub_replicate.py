@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Replicate predictions API, for testing the Flux scripts offline.
+
+Implements just enough of the API for `replicate.Client` to run a model:
+    POST /v1/models/<owner>/<name>/predictions   -> new prediction ("starting")
+    GET  /v1/predictions/<id>                    -> "succeeded" once --delay has passed
+    POST /v1/predictions/<id>/cancel             -> "canceled"
+    GET  /files/<id>.png                         -> a small solid-color PNG (Range supported)
+
+Usage:
+    python stub_replicate.py [--port 8765] [--delay 2.0] [--fail-rate 0.2]
+
+Then run any Flux script against it:
+    REPLICATE_BASE_URL=http://127.0.0.1:8765 REPLICATE_API_TOKEN=stub python generate_icons.py
+"""
+
+import argparse
+import json
+import random
+import struct
+import threading
+import time
+import uuid
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def make_png(width, height, color):
+    """Encode a solid-color RGB PNG with the standard library only."""
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    row = b"\x00" + bytes(color) * width
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(row * height))
+            + chunk(b"IEND", b""))
+
+
+class StubReplicateHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+    predictions = {}
+    lock = threading.Lock()
+    delay = 2.0
+    fail_rate = 0.0
+    image_size = 512
+
+    def log_message(self, format, *args):
+        print(f"  [stub] {self.command} {self.path} -> {args[1] if len(args) > 1 else ''}")
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def prediction_payload(self, prediction_id):
+        prediction = self.predictions[prediction_id]
+        base = f"http://{self.headers['Host']}"
+        done = time.time() - prediction["created"] >= self.delay and not prediction["canceled"]
+        status = "canceled" if prediction["canceled"] else "succeeded" if done else "processing"
+        return {
+            "id": prediction_id,
+            "model": prediction["model"],
+            "version": "stub",
+            "status": status,
+            "input": prediction["input"],
+            "output": [f"{base}/files/{prediction_id}.png"] if done else None,
+            "logs": "",
+            "error": None,
+            "metrics": {"predict_time": self.delay} if done else {},
+            "created_at": None,
+            "urls": {"get": f"{base}/v1/predictions/{prediction_id}"},
+        }
+
+    def do_POST(self):
+        parts = self.path.strip("/").split("/")
+        if len(parts) == 4 and parts[:2] == ["v1", "predictions"] and parts[3] == "cancel":
+            if parts[2] not in self.predictions:
+                return self.send_json(404, {"detail": "Not found"})
+            with self.lock:
+                if self.prediction_payload(parts[2])["status"] == "processing":
+                    self.predictions[parts[2]]["canceled"] = True
+            return self.send_json(200, self.prediction_payload(parts[2]))
+        if len(parts) != 5 or parts[:2] != ["v1", "models"] or parts[4] != "predictions":
+            return self.send_json(404, {"detail": "Not found"})
+
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if random.random() < self.fail_rate:
+            return self.send_json(500, {"detail": "Injected stub failure"})
+
+        prediction_id = uuid.uuid4().hex[:12]
+        with self.lock:
+            self.predictions[prediction_id] = {
+                "model": f"{parts[2]}/{parts[3]}",
+                "input": body.get("input", {}),
+                "created": time.time(),
+                "canceled": False,
+            }
+        payload = self.prediction_payload(prediction_id)
+        payload["status"] = "starting"
+        self.send_json(201, payload)
+
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")
+        if len(parts) == 3 and parts[:2] == ["v1", "predictions"] and parts[2] in self.predictions:
+            return self.send_json(200, self.prediction_payload(parts[2]))
+
+        if len(parts) == 2 and parts[0] == "files" and parts[1].endswith(".png"):
+            seed = zlib.crc32(parts[1].encode())
+            color = (seed & 0xFF, (seed >> 8) & 0xFF, (seed >> 16) & 0xFF)
+            body = make_png(self.image_size, self.image_size, color)
+            status, start = 200, 0
+            range_header = self.headers.get("Range", "")
+            if range_header.startswith("bytes="):
+                start = int(range_header[6:].split("-")[0] or 0)
+                if start >= len(body):
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{len(body)}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                status = 206
+            self.send_response(status)
+            self.send_header("Content-Type", "image/png")
+            self.send_header("Content-Length", str(len(body) - start))
+            if status == 206:
+                self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+            self.end_headers()
+            self.wfile.write(body[start:])
+            return
+
+        self.send_json(404, {"detail": "Not found"})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stub of the Replicate predictions API")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=2.0,
+                        help="Seconds before a prediction succeeds (default: 2.0)")
+    parser.add_argument("--fail-rate", type=float, default=0.0,
+                        help="Fraction of prediction requests answered with HTTP 500")
+    parser.add_argument("--image-size", type=int, default=512)
+    args = parser.parse_args()
+
+    StubReplicateHandler.delay = args.delay
+    StubReplicateHandler.fail_rate = args.fail_rate
+    StubReplicateHandler.image_size = args.image_size
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), StubReplicateHandler)
+    print(f"Stub Replicate API on http://127.0.0.1:{args.port}")
+    print(f"  export REPLICATE_BASE_URL=http://127.0.0.1:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -88,26 +88,13 @@ if [ "$SKIP_FLUX" = false ] && [ "$ONLY_FIGURES" = false ]; then
     else
         check_requirements "assets/flux/requirements.txt" "Flux"
 
-        # Generate hero image
-        echo -e "${BLUE}Generating hero image...${NC}"
+        # Generate, optimize and publish the hero image and icons (skips up-to-date ones)
+        echo -e "${BLUE}Building hero image and takeaway icons...${NC}"
         cd assets/flux
-        python3 generate_hero.py
+        python3 build_assets.py
         cd "$PROJECT_ROOT"
 
-        # Generate icons
-        echo -e "${BLUE}Generating takeaway icons...${NC}"
-        cd assets/flux
-        python3 generate_icons.py
-        cd "$PROJECT_ROOT"
-
-        echo -e "${GREEN}✓ Flux image generation complete${NC}"
-
-        # Copy to static
-        echo -e "${BLUE}Copying Flux images to static...${NC}"
-        mkdir -p static/img/icons
-        cp -f assets/flux/outputs/hero.png static/img/ 2>/dev/null || echo "  Hero image not found (ok if generation failed)"
-        cp -f assets/flux/outputs/icon_*.png static/img/icons/ 2>/dev/null || echo "  Icons not found (ok if generation failed)"
-        echo -e "${GREEN}✓ Images copied${NC}"
+        echo -e "${GREEN}✓ Flux images generated and copied to static/img${NC}"
     fi
 fi
 
@@ -1,20 +1,28 @@
 #!/bin/bash
 
-# Simple script to serve the project page locally
+# Serve the project page locally
+#
+# Serves the repo root (the page links ../static/css/paper-layout.css) with
+# scripts/serve.py: threaded, precompressed gzip/brotli assets, ETags/304,
+# range requests and a latency summary on exit.
 
 PORT=8000
 
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+ROOT_DIR="$(cd "$SCRIPT_DIR/.." && pwd)"
+
 echo "Starting local server for iREPA project page..."
-echo "Open your browser and navigate to: http://localhost:${PORT}"
 echo "Press Ctrl+C to stop the server"
 echo ""
 
 # Check if Python 3 is available
 if command -v python3 &> /dev/null; then
-    python3 -m http.server $PORT
+    PYTHON=python3
 elif command -v python &> /dev/null; then
-    python -m http.server $PORT
+    PYTHON=python
 else
     echo "Error: Python is not installed or not in PATH"
     exit 1
-fi
\ No newline at end of file
+fi
+
+"$PYTHON" "$ROOT_DIR/scripts/serve.py" --root "$ROOT_DIR" --port "$PORT" --page irepa/ "$@"
@@ -0,0 +1,258 @@
+"""
+Deep-Zoom Tile Pyramids
+=======================
+Turns the original image and each VAE reconstruction into a DZI tile pyramid
+(the Deep Zoom format OpenSeadragon reads) plus a viewer page that shows all
+of them side by side with synchronized pan and zoom. The page only fetches
+the tiles in view, so fine detail can be compared without downloading the
+2-3 MB comparison PNGs.
+
+Layout of the output directory:
+    index.html              viewer (OpenSeadragon from a CDN, tile sources inlined)
+    <label>.dzi             DZI descriptor per image
+    <label>_files/<level>/<col>_<row>.<format>
+
+All images share one size (reconstructions are resized to the original's),
+so every level is built for the whole stack at once: one vectorized 2x2 box
+downsample of an (N, H, W, 3) array per level. Tiles are encoded on a thread
+pool (Pillow releases the GIL while encoding).
+
+Usage:
+    python deep_zoom.py original.png E2E-FLUX-VAE.png E2E-SD-VAE.png --labels Original FLUX SD --output zoom
+    python deep_zoom.py reconstruction_outputs/cat_original.png reconstruction_outputs/cat_E2E-*.png \\
+        --output zoom                           # Labels default to the file names
+
+    python vae_reconstruction_comparison.py --image input.jpg --deep-zoom
+"""
+
+import argparse
+import html
+import json
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+TILE_SIZE = 254             # 254 + 2 px overlap = 256 px tiles
+TILE_OVERLAP = 1
+TILE_FORMATS = {'png': ('PNG', {'compress_level': 6}),
+                'webp': ('WEBP', {'lossless': True, 'method': 4}),
+                'jpg': ('JPEG', {'quality': 92})}
+OPENSEADRAGON_URL = 'https://cdn.jsdelivr.net/npm/openseadragon@4.1/build/openseadragon'
+
+
+def level_count(width, height):
+    """Number of DZI levels: level 0 is 1x1, the last is full resolution"""
+    return math.ceil(math.log2(max(width, height))) + 1
+
+
+def downsample(stack):
+    """Halve an (N, H, W, 3) uint8 stack with a 2x2 box filter (odd edges replicated)"""
+    _, h, w, _ = stack.shape
+    if h % 2 or w % 2:
+        stack = np.pad(stack, ((0, 0), (0, h % 2), (0, w % 2), (0, 0)), mode='edge')
+    s = stack.astype(np.uint16)
+    return ((s[:, 0::2, 0::2] + s[:, 1::2, 0::2] + s[:, 0::2, 1::2] + s[:, 1::2, 1::2] + 2) // 4).astype(np.uint8)
+
+
+def tile_boxes(width, height, tile_size=TILE_SIZE, overlap=TILE_OVERLAP):
+    """(col, row, x0, y0, x1, y1) of every tile of one level, overlap included"""
+    boxes = []
+    for row in range(math.ceil(height / tile_size)):
+        for col in range(math.ceil(width / tile_size)):
+            x0 = max(col * tile_size - overlap, 0)
+            y0 = max(row * tile_size - overlap, 0)
+            x1 = min((col + 1) * tile_size + overlap, width)
+            y1 = min((row + 1) * tile_size + overlap, height)
+            boxes.append((col, row, x0, y0, x1, y1))
+    return boxes
+
+
+def save_tile(array, path, pil_format, options):
+    Image.fromarray(array).save(path, pil_format, **options)
+
+
+def dzi_xml(width, height, tile_format, tile_size=TILE_SIZE, overlap=TILE_OVERLAP):
+    return (f'<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<Image xmlns="http://schemas.microsoft.com/deepzoom/2008" Format="{tile_format}" '
+            f'Overlap="{overlap}" TileSize="{tile_size}">\n'
+            f'  <Size Width="{width}" Height="{height}"/>\n'
+            f'</Image>\n')
+
+
+def build_pyramids(images, labels, output_dir, tile_format='png', workers=None):
+    """Write a DZI pyramid per image; `images` are equally sized (H, W, 3) uint8 arrays. Returns tile count"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    pil_format, options = TILE_FORMATS[tile_format]
+
+    stack = np.stack([np.asarray(image, dtype=np.uint8) for image in images])    # (N, H, W, 3)
+    _, height, width, _ = stack.shape
+    levels = level_count(width, height)
+    names = [safe_label(label) for label in labels]
+
+    for name in names:
+        (output_dir / f"{name}.dzi").write_text(dzi_xml(width, height, tile_format))
+
+    tiles = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        level = stack
+        for index in reversed(range(levels)):
+            _, h, w, _ = level.shape
+            boxes = tile_boxes(w, h)
+            for n, name in enumerate(names):
+                level_dir = output_dir / f"{name}_files" / str(index)
+                level_dir.mkdir(parents=True, exist_ok=True)
+                for col, row, x0, y0, x1, y1 in boxes:
+                    # Slices are views; every level array stays alive until its tiles are written
+                    futures.append(executor.submit(save_tile, level[n, y0:y1, x0:x1],
+                                                   level_dir / f"{col}_{row}.{tile_format}", pil_format, options))
+            tiles += len(boxes) * len(names)
+            if index:
+                level = downsample(level)
+        for future in futures:
+            future.result()
+    return tiles
+
+
+def safe_label(label):
+    """File-name-safe version of a viewer label"""
+    return "".join(c if c.isalnum() or c in ('-', '_', '.') else '_' for c in label)
+
+
+VIEWER_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8"/>
+<meta name="viewport" content="width=device-width, initial-scale=1"/>
+<title>{title}</title>
+<style>
+  body {{ font-family: Georgia, 'Times New Roman', serif; margin: 0; padding: 12px; background: #f5f5f5; color: #333; }}
+  h1 {{ font-size: 18px; font-weight: normal; margin: 0 0 4px; }}
+  p.hint {{ font-size: 13px; color: #666; margin: 0 0 10px; }}
+  .panes {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(300px, 1fr)); gap: 10px; }}
+  .pane {{ background: #fff; border: 1px solid #ddd; border-radius: 6px; overflow: hidden; }}
+  .pane h2 {{ font-size: 15px; font-weight: normal; text-align: center; margin: 6px 0; }}
+  .viewer {{ width: 100%; aspect-ratio: {aspect}; background: #222; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+<p class="hint">Scroll or pinch to zoom, drag to pan; all panes follow. Double-click resets.</p>
+<div class="panes">
+{panes}
+</div>
+<script src="{osd}/openseadragon.min.js"></script>
+<script>
+(function () {{
+  var SOURCES = {sources};
+  var viewers = SOURCES.map(function (src) {{
+    return OpenSeadragon({{
+      id: src.id,
+      prefixUrl: "{osd}/images/",
+      tileSources: src.tiles,
+      showNavigationControl: false,
+      visibilityRatio: 1,
+      gestureSettingsMouse: {{ dblClickToZoom: false }},
+      imageSmoothingEnabled: false,
+      maxZoomPixelRatio: 8
+    }});
+  }});
+
+  // Mirror the active viewer's viewport onto the others
+  var syncing = false;
+  viewers.forEach(function (leader) {{
+    function follow() {{
+      if (syncing) return;
+      syncing = true;
+      var zoom = leader.viewport.getZoom(), center = leader.viewport.getCenter();
+      viewers.forEach(function (v) {{
+        if (v !== leader) {{ v.viewport.zoomTo(zoom, null, true); v.viewport.panTo(center, true); }}
+      }});
+      syncing = false;
+    }}
+    leader.addHandler("zoom", follow);
+    leader.addHandler("pan", follow);
+    leader.addHandler("canvas-double-click", function () {{
+      viewers.forEach(function (v) {{ v.viewport.goHome(true); }});
+    }});
+  }});
+}})();
+</script>
+</body>
+</html>
+"""
+
+
+def write_viewer(output_dir, labels, width, height, tile_format, title):
+    """Viewer page with the DZI descriptors inlined (no XHR, so it also opens from file://)"""
+    sources, panes = [], []
+    for i, label in enumerate(labels):
+        name = safe_label(label)
+        sources.append({'id': f"viewer-{i}", 'tiles': {'Image': {
+            'xmlns': 'http://schemas.microsoft.com/deepzoom/2008',
+            'Url': f"{name}_files/", 'Format': tile_format,
+            'Overlap': str(TILE_OVERLAP), 'TileSize': str(TILE_SIZE),
+            'Size': {'Width': str(width), 'Height': str(height)},
+        }}})
+        panes.append(f'  <div class="pane"><h2>{html.escape(label)}</h2>'
+                     f'<div class="viewer" id="viewer-{i}"></div></div>')
+    page = VIEWER_TEMPLATE.format(
+        title=html.escape(title),
+        aspect=f"{width} / {height}",
+        panes="\n".join(panes),
+        osd=OPENSEADRAGON_URL,
+        sources=json.dumps(sources).replace("</", "<\\/"),
+    )
+    path = Path(output_dir) / 'index.html'
+    path.write_text(page)
+    return path
+
+
+def create_deep_zoom(original_image, reconstructions, labels, output_dir, title='VAE reconstructions',
+                     tile_format='png', workers=None):
+    """Pyramids for the original (PIL) and each reconstruction (resized to match) plus the viewer page"""
+    size = original_image.size
+    images = [np.asarray(original_image.convert('RGB'))] + [
+        np.asarray((img if img.size == size else img.resize(size, Image.LANCZOS)).convert('RGB'))
+        for img in reconstructions
+    ]
+    tiles = build_pyramids(images, labels, output_dir, tile_format, workers)
+    viewer = write_viewer(output_dir, labels, size[0], size[1], tile_format, title)
+    return viewer, tiles
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build DZI tile pyramids and a synchronized deep-zoom viewer')
+    parser.add_argument('images', nargs='+', help='Original image first, then the reconstructions')
+    parser.add_argument('--labels', nargs='+', default=None,
+                        help='Pane labels, one per image (default: file names)')
+    parser.add_argument('--output', type=str, required=True, help='Output directory')
+    parser.add_argument('--title', type=str, default='VAE reconstructions')
+    parser.add_argument('--tile-format', choices=list(TILE_FORMATS), default='png',
+                        help='Tile format (default: png, lossless so artifacts are the VAE\'s own)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help='Tile encoding threads (default: CPU count)')
+    args = parser.parse_args()
+
+    labels = args.labels or [Path(p).stem for p in args.images]
+    if len(labels) != len(args.images):
+        parser.error(f"{len(args.images)} images but {len(labels)} labels")
+    if len(set(map(safe_label, labels))) != len(labels):
+        parser.error("Labels must be unique")
+
+    start = time.perf_counter()
+    images = [Image.open(p).convert('RGB') for p in args.images]
+    viewer, tiles = create_deep_zoom(images[0], images[1:], labels, args.output,
+                                     args.title, args.tile_format, args.workers)
+    print(f"✓ {tiles} tiles for {len(images)} image(s) in {time.perf_counter() - start:.1f}s")
+    print(f"✓ Viewer: {viewer}")
+
+
+if __name__ == '__main__':
+    main()
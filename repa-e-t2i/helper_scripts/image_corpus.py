@@ -0,0 +1,240 @@
+"""
+Pre-decoded Image Corpus
+========================
+Packs a set of images into fixed-resolution uint8 shards, one per VAE
+resolution, so repeated reconstruction runs skip PNG/JPEG decoding and
+Lanczos resizing entirely.
+
+Layout of a corpus directory:
+    index.json          ids, source paths / SHA-256, original sizes, shard files
+    images_1024.npy     (N, 1024, 1024, 3) uint8
+    images_512.npy      (N, 512, 512, 3) uint8
+
+Shards are plain .npy files opened with np.load(mmap_mode='r'): reading an
+image is a slice of the memory map (no copy, no decode), and any image can
+be fetched by id without touching the others.
+
+The largest (base) resolution is resized from the source; smaller ones are
+resized from that, and index.json records this chain. That reproduces what
+vae_reconstruction_comparison.py does when it loads an image at --resolution
+and resizes it for each 512px VAE only when --resolution is the base, so the
+comparison script rejects any other --resolution for a corpus.
+
+Usage:
+    python image_corpus.py inputs/ --output corpus
+    python image_corpus.py a.png b.jpg --output corpus --resolutions 1024 512
+    python image_corpus.py --list corpus
+
+    python vae_reconstruction_comparison.py --corpus corpus --image-id a
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+# Resolutions used by VAE_CONFIGS in vae_reconstruction_comparison.py
+DEFAULT_RESOLUTIONS = [1024, 512]
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.webp'}
+INDEX_NAME = 'index.json'
+FORMAT_VERSION = 2
+
+
+def image_id(path):
+    """Filename-safe id for an image (same rule as the comparison script's output names)"""
+    name = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in Path(path).stem)
+    return '_'.join(name.split())[:50]
+
+
+def shard_name(resolution):
+    return f"images_{resolution}.npy"
+
+
+def find_images(paths):
+    """Expand files and directories into a sorted list of image paths"""
+    images = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            images.extend(p for p in sorted(path.rglob('*')) if p.suffix.lower() in IMAGE_EXTENSIONS)
+        else:
+            images.append(path)
+    return images
+
+
+def file_sha256(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+class ImageCorpus:
+    """Read-only view of a packed corpus: corpus.get(image_id, resolution) -> (R, R, 3) uint8"""
+
+    def __init__(self, corpus_dir):
+        self.corpus_dir = Path(corpus_dir)
+        with open(self.corpus_dir / INDEX_NAME) as f:
+            self.index = json.load(f)
+        if self.index.get('version') != FORMAT_VERSION:
+            raise ValueError(f"{self.corpus_dir}: unsupported corpus version {self.index.get('version')}")
+
+        self.ids = [entry['id'] for entry in self.index['images']]
+        self.rows = {image_id: row for row, image_id in enumerate(self.ids)}
+        self.shards = {}
+        for resolution, name in self.index['shards'].items():
+            shard = np.load(self.corpus_dir / name, mmap_mode='r')
+            expected = (len(self.ids), int(resolution), int(resolution), 3)
+            if shard.shape != expected or shard.dtype != np.uint8:
+                raise ValueError(f"{name}: expected uint8 {expected}, found {shard.dtype} {shard.shape}")
+            self.shards[int(resolution)] = shard
+
+    @property
+    def resolutions(self):
+        return sorted(self.shards, reverse=True)
+
+    @property
+    def base_resolution(self):
+        """The resolution resized straight from the sources; every other shard is resized from it"""
+        return next(int(r) for r, parent in self.index['resized_from'].items() if parent == 'source')
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, image_id):
+        return image_id in self.rows
+
+    def get(self, image_id, resolution):
+        """Zero-copy (R, R, 3) uint8 view of one image at one packed resolution"""
+        if image_id not in self.rows:
+            raise KeyError(f"'{image_id}' is not in {self.corpus_dir} (ids: {', '.join(self.ids[:10])}"
+                           f"{', ...' if len(self.ids) > 10 else ''})")
+        if resolution not in self.shards:
+            raise KeyError(f"{self.corpus_dir} has no {resolution}px shard (packed: {self.resolutions})")
+        return self.shards[resolution][self.rows[image_id]]
+
+    def entry(self, image_id):
+        """Index entry (source path, SHA-256, original size) of one image"""
+        return self.index['images'][self.rows[image_id]]
+
+
+def pack_image(source, row, shard_paths, resolutions):
+    """Decode, resize and write one image into row `row` of every shard. Runs in a worker process."""
+    image = Image.open(source).convert('RGB')
+    original_size = image.size
+    base = image.resize((resolutions[0], resolutions[0]), Image.LANCZOS)     # largest first
+    for resolution in resolutions:
+        resized = base if resolution == resolutions[0] else base.resize((resolution, resolution), Image.LANCZOS)
+        shard = np.load(shard_paths[resolution], mmap_mode='r+')
+        shard[row] = np.asarray(resized)
+        shard.flush()
+        del shard
+    return original_size
+
+
+def is_current(index_path, entries, resolutions):
+    """True if an existing corpus was packed from the same sources and resolutions"""
+    if not index_path.exists():
+        return False
+    with open(index_path) as f:
+        index = json.load(f)
+    packed = [(e['id'], e['sha256']) for e in index.get('images', [])]
+    return (index.get('version') == FORMAT_VERSION
+            and sorted(map(int, index.get('shards', {}))) == sorted(resolutions)
+            and packed == [(e['id'], e['sha256']) for e in entries]
+            and all((index_path.parent / name).exists() for name in index['shards'].values()))
+
+
+def pack_corpus(sources, output_dir, resolutions=DEFAULT_RESOLUTIONS, workers=None, force=False):
+    """Pack `sources` into `output_dir`; returns the index dict"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    resolutions = sorted(set(resolutions), reverse=True)
+    index_path = output_dir / INDEX_NAME
+
+    entries = [{'id': image_id(s), 'source': str(s), 'sha256': file_sha256(s)} for s in sources]
+    seen = {}
+    for entry in entries:
+        if entry['id'] in seen:
+            raise ValueError(f"Duplicate id '{entry['id']}': {seen[entry['id']]} and {entry['source']}")
+        seen[entry['id']] = entry['source']
+
+    if not force and is_current(index_path, entries, resolutions):
+        print(f"✓ Corpus is up to date: {output_dir}")
+        with open(index_path) as f:
+            return json.load(f)
+
+    # Allocate every shard up front; workers fill their own rows through the memory map
+    shard_paths = {}
+    for resolution in resolutions:
+        path = output_dir / shard_name(resolution)
+        np.lib.format.open_memmap(path, mode='w+', dtype=np.uint8,
+                                  shape=(len(entries), resolution, resolution, 3)).flush()
+        shard_paths[resolution] = path
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(pack_image, entry['source'], row, shard_paths, resolutions)
+                   for row, entry in enumerate(entries)]
+        for entry, future in zip(entries, futures):
+            entry['width'], entry['height'] = future.result()
+            print(f"✓ {entry['id']} ({entry['width']}x{entry['height']})")
+
+    index = {
+        'version': FORMAT_VERSION,
+        'shards': {str(r): shard_paths[r].name for r in resolutions},
+        # Matches pack_image: the largest from the source, the others from the largest
+        'resized_from': {str(r): 'source' if r == resolutions[0] else resolutions[0] for r in resolutions},
+        'images': entries,
+    }
+    tmp = index_path.with_name(index_path.name + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp, index_path)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pack images into memory-mapped uint8 shards per VAE resolution')
+    parser.add_argument('paths', nargs='*', help='Images or directories to pack')
+    parser.add_argument('--output', type=str, default='helper_scripts/corpus',
+                        help='Corpus directory (default: helper_scripts/corpus)')
+    parser.add_argument('--resolutions', type=int, nargs='+', default=DEFAULT_RESOLUTIONS,
+                        help='Square resolutions to pack (default: 1024 512, as in VAE_CONFIGS)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='Repack even if the corpus is up to date')
+    parser.add_argument('--list', type=str, metavar='CORPUS', default=None,
+                        help='List the images in an existing corpus and exit')
+    args = parser.parse_args()
+
+    if args.list:
+        corpus = ImageCorpus(args.list)
+        print(f"{args.list}: {len(corpus)} image(s) at {corpus.resolutions}")
+        for image_id in corpus.ids:
+            entry = corpus.entry(image_id)
+            print(f"  {image_id:<50} {entry['width']}x{entry['height']}  {entry['source']}")
+        return
+
+    sources = find_images(args.paths)
+    if not sources:
+        parser.error('No images given (pass files or directories)')
+
+    print(f"\n{'='*60}")
+    print(f"Packing {len(sources)} image(s) at {sorted(set(args.resolutions), reverse=True)}")
+    print(f"{'='*60}\n")
+    start = time.perf_counter()
+    try:
+        index = pack_corpus(sources, args.output, args.resolutions, args.workers, args.force)
+    except ValueError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    total = sum(os.path.getsize(Path(args.output) / name) for name in index['shards'].values())
+    print(f"\n✓ Corpus: {args.output} ({total / 1024**2:.0f} MB) in {time.perf_counter() - start:.1f}s\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,9 @@ and tests reconstruction across all 6 end-to-end tuned VAEs from the REPA-E-T2I
 Usage:
     python vae_reconstruction_comparison.py "Your prompt here"
     python vae_reconstruction_comparison.py --image path/to/image.jpg
+    python vae_reconstruction_comparison.py --corpus corpus --image-id name
+    python vae_reconstruction_comparison.py --image input.jpg --progressive --status-file status.json
+    python vae_reconstruction_comparison.py --image input.jpg --deep-zoom
 
 Examples:
     python vae_reconstruction_comparison.py "A hawksbill turtle over coral"
@@ -14,8 +17,13 @@ Examples:
 """
 
 import argparse
+import json
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
@@ -23,13 +31,17 @@ warnings.filterwarnings('ignore')
 import torch
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
-import matplotlib.pyplot as plt
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend
 import matplotlib as mpl
+# Figures are built with the object-oriented API on an Agg canvas, never through
+# pyplot's global state, so ProgressiveFigures can render on a worker thread
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 from diffusers import FluxPipeline, AutoencoderKL, AutoencoderKLQwenImage
 
+from deep_zoom import TILE_FORMATS, create_deep_zoom
+from image_corpus import ImageCorpus
+
 
 # ============================================================================
 # CONFIGURATION - Adjust these to control figure appearance
@@ -40,6 +52,11 @@ LABEL_FONT_SIZE = 19      # Size for VAE labels (e.g., "E2E-FLUX-VAE")
 FIGURE_WIDTH = 24           # Figure width in inches
 FIGURE_HEIGHT = 4.5         # Figure height in inches
 
+# Error analysis configuration
+ERROR_CMAP = 'inferno'      # Colormap for absolute-error heatmaps
+ERROR_VMAX = 0.25           # Error (in [0, 1] intensity units) mapped to the top of the colormap
+CROP_SIZE = 128             # Side of the zoomed worst-error crop (in original-image pixels)
+
 # Configure matplotlib for professional plots
 mpl.rcParams['font.family'] = 'serif'
 mpl.rcParams['font.serif'] = ['Times New Roman', 'DejaVu Serif']
@@ -163,20 +180,27 @@ def generate_image_with_flux(prompt, output_path, resolution=1024, device='cuda'
     return image
 
 
-def reconstruct_with_vae(image, vae_config, device='cuda'):
-    """Reconstruct image using a specific VAE"""
+def reconstruct_with_vae(image, vae_config, device='cuda', pixels=None):
+    """Reconstruct image using a specific VAE
+
+    `pixels` is an optional (R, R, 3) uint8 array already at the VAE's
+    resolution (e.g. an ImageCorpus view); it is used as-is instead of
+    resizing `image`.
+    """
     print(f"\nProcessing {vae_config['name']}...")
 
-    # Resize image if needed
     target_res = vae_config['resolution']
-    if image.size != (target_res, target_res):
-        resized_image = image.resize((target_res, target_res), Image.LANCZOS)
-    else:
-        resized_image = image
+    if pixels is None:
+        # Resize image if needed
+        if image.size != (target_res, target_res):
+            resized_image = image.resize((target_res, target_res), Image.LANCZOS)
+        else:
+            resized_image = image
+        pixels = np.array(resized_image)
 
-    # Convert to tensor
+    # Convert to tensor (a memory-mapped corpus view is read straight from the page cache)
     image_tensor = torch.from_numpy(
-        np.array(resized_image)
+        np.asarray(pixels)
     ).permute(2, 0, 1).unsqueeze(0).to(torch.float32) / 127.5 - 1
     image_tensor = image_tensor.to(device)
 
@@ -213,34 +237,101 @@ def reconstruct_with_vae(image, vae_config, device='cuda'):
     return reconstructed_image
 
 
-def create_comparison_figure(original_image, reconstructions, vae_configs, prompt, output_path):
-    """Create a professional comparison figure in the style of the project page"""
-    print(f"\n{'='*60}")
-    print(f"Creating comparison figure...")
-    print(f"{'='*60}\n")
+def compute_reconstruction_analysis(original_image, reconstructions, crop_size=CROP_SIZE):
+    """Compute error maps, worst-error crops and radial power spectra for all VAEs at once"""
+    size = original_image.size
+    original = np.asarray(original_image, dtype=np.float32) / 255.0
+    recons = np.stack([
+        np.asarray(img if img.size == size else img.resize(size, Image.LANCZOS), dtype=np.float32)
+        for img in reconstructions
+    ]) / 255.0                                                   # (N, H, W, 3)
+    n, h, w, _ = recons.shape
+
+    # Absolute error averaged over channels, plus per-VAE summary metrics
+    diff = recons - original[None]
+    error_maps = np.abs(diff).mean(axis=-1)                      # (N, H, W)
+    mae = error_maps.mean(axis=(1, 2))
+    mse = np.square(diff).mean(axis=(1, 2, 3))
+    psnr = 10 * np.log10(1.0 / np.maximum(mse, 1e-10))
+
+    # Worst-error window per VAE: sliding-window sums from one integral image
+    crop = min(crop_size, h, w)
+    stride = max(crop // 4, 1)
+    integral = np.pad(error_maps.astype(np.float64).cumsum(1).cumsum(2), ((0, 0), (1, 0), (1, 0)))
+    ys = np.arange(0, h - crop + 1, stride)[:, None]
+    xs = np.arange(0, w - crop + 1, stride)[None, :]
+    window_sums = (integral[:, ys + crop, xs + crop] - integral[:, ys, xs + crop]
+                   - integral[:, ys + crop, xs] + integral[:, ys, xs])
+    best = window_sums.reshape(n, -1).argmax(axis=1)
+    rows, cols = np.unravel_index(best, window_sums.shape[1:])
+    crop_boxes = np.stack([xs[0, cols], ys[rows, 0]], axis=1)    # (N, 2) top-left (x, y)
+
+    # Radially averaged power spectrum of the luminance, original first
+    luma = np.concatenate([original[None], recons]) @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    luma -= luma.mean(axis=(1, 2), keepdims=True)
+    power = np.abs(np.fft.rfft2(luma)) ** 2                      # (N+1, H, W//2+1)
+    radius = np.sqrt(np.fft.fftfreq(h)[:, None] ** 2 + np.fft.rfftfreq(w)[None, :] ** 2)
+    n_bins = min(h, w) // 2
+    inside = radius < 0.5
+    bin_idx = (radius[inside] * 2 * n_bins).astype(np.int64)
+    counts = np.maximum(np.bincount(bin_idx, minlength=n_bins), 1)
+    m = power.shape[0]
+    flat_idx = (np.arange(m)[:, None] * n_bins + bin_idx[None, :]).ravel()
+    spectra = np.bincount(flat_idx, weights=power[:, inside].ravel(),
+                          minlength=m * n_bins).reshape(m, n_bins) / counts
+
+    return {
+        'error_maps': error_maps,
+        'mae': mae,
+        'psnr': psnr,
+        'crop_size': crop,
+        'crop_boxes': crop_boxes,
+        'frequencies': (np.arange(n_bins) + 0.5) / (2 * n_bins),
+        'spectra': spectra,
+    }
+
+
+def colorize_error_maps(error_maps, vmax=ERROR_VMAX, cmap=ERROR_CMAP):
+    """Map a batch of error maps to uint8 RGB heatmaps"""
+    normalized = np.clip(error_maps / vmax, 0, 1)
+    return (mpl.colormaps[cmap](normalized)[..., :3] * 255).astype(np.uint8)
+
+
+def create_comparison_figure(original_image, reconstructions, vae_configs, prompt, output_path, analysis=None,
+                             verbose=True):
+    """Create a professional comparison figure in the style of the project page
+
+    If `analysis` (from compute_reconstruction_analysis) is given, a second row
+    shows the absolute-error heatmap under each reconstruction.
+    """
+    if verbose:
+        print(f"\n{'='*60}")
+        print(f"Creating comparison figure...")
+        print(f"{'='*60}\n")
 
     # Single row layout - 7 images total
     n_cols = 7
-    n_rows = 1
+    n_rows = 1 if analysis is None else 2
 
     # Create figure with specific styling (using global config)
-    fig = plt.figure(figsize=(FIGURE_WIDTH, FIGURE_HEIGHT), facecolor='#f5f5f5')
+    fig = Figure(figsize=(FIGURE_WIDTH, FIGURE_HEIGHT * n_rows), facecolor='#f5f5f5')
+    FigureCanvasAgg(fig)
 
     # Adjust layout for tight, clean spacing
-    plt.subplots_adjust(left=0.02, right=0.98, top=0.85, bottom=0.05, wspace=0.08)
+    fig.subplots_adjust(left=0.02, right=0.98, top=0.85, bottom=0.05, wspace=0.08)
 
     # Font settings (using global config - serif fonts from matplotlib rcParams)
     title_font = {'size': LABEL_FONT_SIZE, 'weight': 'normal'}
 
     # Plot original image
-    ax = plt.subplot(n_rows, n_cols, 1)
+    ax = fig.add_subplot(n_rows, n_cols, 1)
     ax.imshow(original_image)
     ax.set_title('Original Image', fontdict=title_font, color='#333333', pad=8)
     ax.axis('off')
 
     # Plot reconstructions
     for idx, (recon_img, vae_config) in enumerate(zip(reconstructions, vae_configs)):
-        ax = plt.subplot(n_rows, n_cols, idx + 2)
+        ax = fig.add_subplot(n_rows, n_cols, idx + 2)
 
         # Resize if needed for display
         if recon_img.size != original_image.size:
@@ -254,25 +345,41 @@ def create_comparison_figure(original_image, reconstructions, vae_configs, promp
         ax.set_title(vae_config['name'], fontdict=title_font, color='#333333', pad=8)
         ax.axis('off')
 
+    # Error heatmaps under each reconstruction
+    if analysis is not None:
+        heatmaps = colorize_error_maps(analysis['error_maps'])
+        for idx, heatmap in enumerate(heatmaps):
+            ax = fig.add_subplot(n_rows, n_cols, n_cols + idx + 2)
+            ax.imshow(heatmap)
+            ax.set_title(f"MAE {analysis['mae'][idx]:.4f} | PSNR {analysis['psnr'][idx]:.2f} dB",
+                         fontdict={'size': LABEL_FONT_SIZE * 0.7}, color='#333333', pad=6)
+            ax.axis('off')
+
     # Save figure
-    plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='#f5f5f5', edgecolor='none')
-    plt.close()
+    fig.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='#f5f5f5', edgecolor='none')
+
+    if verbose:
+        print(f"✓ Comparison figure saved to: {output_path}")
 
-    print(f"✓ Comparison figure saved to: {output_path}")
 
+def create_grid_comparison(original_image, reconstructions, vae_configs, prompt, output_path, analysis=None,
+                           verbose=True):
+    """Create a clean grid comparison (alternative vertical layout)
 
-def create_grid_comparison(original_image, reconstructions, vae_configs, prompt, output_path):
-    """Create a clean grid comparison (alternative vertical layout)"""
-    print(f"Creating vertical grid comparison figure...")
+    If `analysis` is given, each reconstruction row also shows its error heatmap.
+    """
+    if verbose:
+        print(f"Creating vertical grid comparison figure...")
 
-    # Vertical grid: 7 rows, 1 column
+    # Vertical grid: 7 rows, 1 column (2 columns with error heatmaps)
     n_images = len(reconstructions) + 1  # +1 for original
+    n_cols = 1 if analysis is None else 2
     target_size = (800, 800)
 
     # Create grid image with light gray background
     padding = 20
     label_height = 50
-    grid_width = target_size[0] + 2 * padding
+    grid_width = (target_size[0] + padding) * n_cols + padding
     grid_height = (target_size[1] + label_height) * n_images + padding
 
     grid_img = Image.new('RGB', (grid_width, grid_height), color='#f5f5f5')
@@ -307,9 +414,160 @@ def create_grid_comparison(original_image, reconstructions, vae_configs, prompt,
         # Paste image
         grid_img.paste(resized, (x, y + label_height - 10))
 
+    # Add error heatmaps next to each reconstruction
+    if analysis is not None:
+        heatmaps = colorize_error_maps(analysis['error_maps'])
+        for idx, heatmap in enumerate(heatmaps):
+            x = target_size[0] + 2 * padding
+            y = (idx + 1) * (target_size[1] + label_height) + padding
+
+            label = f"Abs. error (MAE {analysis['mae'][idx]:.4f})"
+            bbox = draw.textbbox((0, 0), label, font=label_font)
+            text_x = x + (target_size[0] - (bbox[2] - bbox[0])) // 2
+            draw.text((text_x, y + 5), label, fill='#333333', font=label_font)
+
+            grid_img.paste(Image.fromarray(heatmap).resize(target_size, Image.BILINEAR),
+                           (x, y + label_height - 10))
+
     # Save
     grid_img.save(output_path, quality=95)
-    print(f"✓ Vertical grid comparison saved to: {output_path}")
+    if verbose:
+        print(f"✓ Vertical grid comparison saved to: {output_path}")
+
+
+def create_analysis_figure(original_image, reconstructions, vae_configs, analysis, output_path):
+    """Create zoomed worst-error crops and radial power-spectrum plots for each VAE"""
+    print(f"Creating error analysis figure...")
+
+    n_vaes = len(reconstructions)
+    crop = analysis['crop_size']
+    size = original_image.size
+    original = np.asarray(original_image)
+
+    fig = Figure(figsize=(FIGURE_WIDTH, FIGURE_HEIGHT * 3), facecolor='#f5f5f5')
+    FigureCanvasAgg(fig)
+    grid = fig.add_gridspec(3, n_vaes, height_ratios=[1, 1, 1.4], hspace=0.25, wspace=0.08)
+    title_font = {'size': LABEL_FONT_SIZE * 0.8, 'weight': 'normal'}
+
+    # Rows 1-2: worst-error region of the original and the matching reconstruction crop
+    for idx, (recon_img, vae_config) in enumerate(zip(reconstructions, vae_configs)):
+        x, y = analysis['crop_boxes'][idx]
+        recon = np.asarray(recon_img if recon_img.size == size else recon_img.resize(size, Image.LANCZOS))
+
+        ax = fig.add_subplot(grid[0, idx])
+        ax.imshow(original[y:y + crop, x:x + crop], interpolation='nearest')
+        ax.set_title(f"{vae_config['name']}\nOriginal @ ({x}, {y})", fontdict=title_font, color='#333333')
+        ax.axis('off')
+
+        ax = fig.add_subplot(grid[1, idx])
+        ax.imshow(recon[y:y + crop, x:x + crop], interpolation='nearest')
+        ax.set_title('Reconstruction', fontdict=title_font, color='#333333')
+        ax.axis('off')
+
+    # Row 3: reconstruction power relative to the original, per radial frequency
+    ax = fig.add_subplot(grid[2, :])
+    freqs = analysis['frequencies']
+    spectra = analysis['spectra']
+    ratio_db = 10 * np.log10(np.maximum(spectra[1:], 1e-20) / np.maximum(spectra[:1], 1e-20))
+    for curve, vae_config in zip(ratio_db, vae_configs):
+        ax.plot(freqs, curve, linewidth=1.5, label=vae_config['name'])
+    ax.axhline(0, color='#333333', linestyle='--', linewidth=1.0, label='Original')
+    ax.set_xlabel('Radial frequency (cycles / pixel)')
+    ax.set_ylabel('Power vs. original (dB)')
+    ax.set_xlim(0, 0.5)
+    ax.grid(True, alpha=0.3)
+    ax.legend(ncol=n_vaes + 1, loc='lower left')
+
+    fig.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='#f5f5f5', edgecolor='none')
+
+    print(f"✓ Error analysis figure saved to: {output_path}")
+
+
+def placeholder_image(size, label, color='#e0e0e0'):
+    """Flat placeholder with a centered label, for reconstructions that are not available"""
+    image = Image.new('RGB', size, color=color)
+    draw = ImageDraw.Draw(image)
+    try:
+        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", max(size[1] // 16, 12))
+    except:
+        font = ImageFont.load_default()
+    bbox = draw.textbbox((0, 0), label, font=font)
+    draw.text(((size[0] - (bbox[2] - bbox[0])) // 2, (size[1] - (bbox[3] - bbox[1])) // 2),
+              label, fill='#777777', font=font)
+    return image
+
+
+def save_atomically(render, output_path):
+    """Call render(tmp_path), then move the result over output_path (viewers never see a partial file)"""
+    output_path = Path(output_path)
+    tmp_path = output_path.with_name(f"{output_path.stem}.partial{output_path.suffix}")
+    render(tmp_path)
+    os.replace(tmp_path, output_path)
+
+
+def write_status(path, status):
+    """Write the JSON status file atomically"""
+    status['updated'] = datetime.now(timezone.utc).isoformat(timespec='seconds')
+    tmp_path = Path(path).with_name(Path(path).name + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(status, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+class ProgressiveFigures:
+    """Re-render the comparison and grid figures in a background thread as reconstructions land
+
+    update() only records the newest set of reconstructions and returns, so the
+    next VAE starts immediately. If several VAEs finish while a render is still
+    running, the following render shows all of them at once. Progressive frames
+    skip the error heatmaps; the final figures are drawn by main() as usual.
+    """
+
+    def __init__(self, original_image, vae_configs, display_prompt, comparison_path, grid_path):
+        self.original_image = original_image
+        self.vae_configs = vae_configs
+        self.display_prompt = display_prompt
+        self.comparison_path = comparison_path
+        self.grid_path = grid_path
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.lock = threading.Lock()
+        self.pending = None
+        self.running = False
+        self.renders = 0
+
+    def update(self, reconstructions):
+        with self.lock:
+            self.pending = list(reconstructions)
+            if not self.running:
+                self.running = True
+                self.executor.submit(self._drain)
+
+    def _drain(self):
+        while True:
+            with self.lock:
+                snapshot, self.pending = self.pending, None
+                if snapshot is None:
+                    self.running = False
+                    return
+            try:
+                self._render(snapshot)
+            except Exception as e:
+                print(f"✗ Progressive figure update failed: {e}")
+
+    def _render(self, reconstructions):
+        start = time.perf_counter()
+        save_atomically(lambda path: create_comparison_figure(
+            self.original_image, reconstructions, self.vae_configs, self.display_prompt, path, verbose=False
+        ), self.comparison_path)
+        save_atomically(lambda path: create_grid_comparison(
+            self.original_image, reconstructions, self.vae_configs, self.display_prompt, path, verbose=False
+        ), self.grid_path)
+        self.renders += 1
+        print(f"  ↻ Figures updated in {time.perf_counter() - start:.1f}s (background)")
+
+    def close(self):
+        """Wait for the last update to be written"""
+        self.executor.shutdown(wait=True)
 
 
 def main():
@@ -320,34 +578,74 @@ def main():
 Examples:
   python vae_reconstruction_comparison.py "A hawksbill turtle over coral"
   python vae_reconstruction_comparison.py --image input.jpg
+  python vae_reconstruction_comparison.py --corpus helper_scripts/corpus --image-id input
+  python vae_reconstruction_comparison.py --image input.jpg --progressive --status-file status.json
+  python vae_reconstruction_comparison.py --image input.jpg --deep-zoom
         """
     )
     parser.add_argument('prompt', type=str, nargs='?', default=None,
                        help='Text prompt for image generation (or use --image instead)')
     parser.add_argument('--image', type=str, default=None,
                        help='Path to local image (instead of generating with FLUX)')
+    parser.add_argument('--corpus', type=str, default=None,
+                       help='Pre-decoded corpus directory from image_corpus.py (use with --image-id)')
+    parser.add_argument('--image-id', type=str, default=None,
+                       help='Id of the corpus image to reconstruct')
     parser.add_argument('--resolution', type=int, default=1024,
                        help='Resolution for images (default: 1024)')
     parser.add_argument('--device', type=str, default='cuda',
                        help='Device to use (default: cuda)')
     parser.add_argument('--output-dir', type=str, default='helper_scripts/reconstruction_outputs',
                        help='Output directory for results')
+    parser.add_argument('--no-analysis', action='store_true',
+                       help='Skip error heatmaps, worst-error crops and power spectra')
+    parser.add_argument('--progressive', action='store_true',
+                       help='Update the comparison and grid figures after each VAE (placeholders for the rest)')
+    parser.add_argument('--status-file', type=str, default=None,
+                       help='Write per-VAE progress as JSON to this path while running')
+    parser.add_argument('--deep-zoom', action='store_true',
+                       help='Also write DZI tile pyramids and a synchronized pan/zoom viewer')
+    parser.add_argument('--tile-format', choices=list(TILE_FORMATS), default='png',
+                       help='Deep-zoom tile format (default: png)')
 
     args = parser.parse_args()
 
     # Validate input
-    if args.prompt is None and args.image is None:
-        parser.error("Either provide a prompt or use --image to specify an image path/URL")
-
-    if args.prompt and args.image:
-        parser.error("Cannot use both prompt and --image. Choose one.")
+    sources = [args.prompt is not None, args.image is not None, args.corpus is not None]
+    if not any(sources):
+        parser.error("Either provide a prompt, use --image to specify an image path, or --corpus with --image-id")
+
+    if sum(sources) > 1:
+        parser.error("Use only one of prompt, --image and --corpus.")
+
+    corpus = None
+    if args.corpus:
+        if args.image_id is None:
+            parser.error("--corpus needs --image-id (list ids with: python image_corpus.py --list CORPUS)")
+        corpus = ImageCorpus(args.corpus)
+        if args.image_id not in corpus:
+            parser.error(f"'{args.image_id}' is not in {args.corpus}")
+        needed = {args.resolution} | {cfg['resolution'] for cfg in VAE_CONFIGS}
+        missing = sorted(needed - set(corpus.resolutions), reverse=True)
+        if missing:
+            parser.error(f"{args.corpus} has no shard for resolution(s) {missing}; repack with --resolutions")
+        # Smaller shards are resized from the base one, as a file run resizes from --resolution
+        if args.resolution != corpus.base_resolution:
+            parser.error(f"{args.corpus} was packed from {corpus.base_resolution}px, so its pixels only match "
+                         f"a file-backed run at --resolution {corpus.base_resolution}; repack with "
+                         f"--resolutions {args.resolution} ... to use --resolution {args.resolution}")
+    elif args.image_id:
+        parser.error("--image-id needs --corpus")
 
     # Create output directory
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Create filename-safe name
-    if args.image:
+    if corpus is not None:
+        # Corpus ids are already filename-safe
+        safe_name = args.image_id
+    elif args.image:
         # Extract filename from local path
         safe_name = Path(args.image).stem
         safe_name = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in safe_name)
@@ -364,7 +662,9 @@ Examples:
     print(f"\n{'='*60}")
     print(f"VAE Reconstruction Comparison Tool")
     print(f"{'='*60}")
-    if args.image:
+    if corpus is not None:
+        print(f"Corpus image: {args.image_id} ({args.corpus})")
+    elif args.image:
         print(f"Image: {args.image}")
     else:
         print(f"Prompt: {args.prompt}")
@@ -374,7 +674,12 @@ Examples:
 
     # Step 1: Get original image (generate or load)
     original_path = output_dir / f"{safe_name}_original.png"
-    if args.image:
+    if corpus is not None:
+        original_image = Image.fromarray(np.asarray(corpus.get(args.image_id, args.resolution)))
+        original_image.save(original_path)
+        print(f"✓ Original image saved to: {original_path}")
+        display_prompt = f"Image: {corpus.entry(args.image_id)['source']}"
+    elif args.image:
         original_image = load_image_from_path(
             args.image,
             original_path,
@@ -390,41 +695,111 @@ Examples:
         )
         display_prompt = args.prompt
 
+    comparison_path = output_dir / f"{safe_name}_comparison.png"
+    grid_path = output_dir / f"{safe_name}_grid.png"
+
+    status = None
+    if args.status_file:
+        status = {
+            'name': safe_name,
+            'source': display_prompt,
+            'started': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'done': False,
+            'vaes': [{'name': cfg['name'], 'resolution': cfg['resolution'], 'status': 'pending'}
+                     for cfg in VAE_CONFIGS],
+        }
+        write_status(args.status_file, status)
+
     # Step 2: Reconstruct with each VAE
-    reconstructions = []
-    for vae_config in VAE_CONFIGS:
+    reconstructions = [placeholder_image(original_image.size, 'Pending') for _ in VAE_CONFIGS]
+    progressive = None
+    if args.progressive:
+        progressive = ProgressiveFigures(original_image, VAE_CONFIGS, display_prompt, comparison_path, grid_path)
+        progressive.update(reconstructions)
+
+    for idx, vae_config in enumerate(VAE_CONFIGS):
+        if status is not None:
+            status['vaes'][idx]['status'] = 'running'
+            write_status(args.status_file, status)
+        start = time.perf_counter()
         try:
-            recon = reconstruct_with_vae(original_image, vae_config, device=args.device)
-            reconstructions.append(recon)
+            pixels = corpus.get(args.image_id, vae_config['resolution']) if corpus is not None else None
+            recon = reconstruct_with_vae(original_image, vae_config, device=args.device, pixels=pixels)
+            reconstructions[idx] = recon
 
             # Save individual reconstruction
             recon_path = output_dir / f"{safe_name}_{vae_config['name']}.png"
             recon.save(recon_path)
+            result = {'status': 'done', 'path': recon_path.name}
 
         except Exception as e:
             print(f"✗ Error with {vae_config['name']}: {e}")
             # Create placeholder
-            reconstructions.append(Image.new('RGB', original_image.size, color='gray'))
+            reconstructions[idx] = Image.new('RGB', original_image.size, color='gray')
+            result = {'status': 'failed', 'error': str(e)}
+
+        if progressive is not None:
+            progressive.update(reconstructions)
+        if status is not None:
+            status['vaes'][idx].update(result, seconds=round(time.perf_counter() - start, 2))
+            write_status(args.status_file, status)
+
+    if progressive is not None:
+        progressive.close()
 
     # Step 3: Create comparison figures
-    comparison_path = output_dir / f"{safe_name}_comparison.png"
+    analysis = None
+    if not args.no_analysis:
+        analysis = compute_reconstruction_analysis(original_image, reconstructions)
+
     create_comparison_figure(
         original_image,
         reconstructions,
         VAE_CONFIGS,
         display_prompt,
-        comparison_path
+        comparison_path,
+        analysis=analysis
     )
 
-    grid_path = output_dir / f"{safe_name}_grid.png"
     create_grid_comparison(
         original_image,
         reconstructions,
         VAE_CONFIGS,
         display_prompt,
-        grid_path
+        grid_path,
+        analysis=analysis
     )
 
+    analysis_path = output_dir / f"{safe_name}_analysis.png"
+    if analysis is not None:
+        create_analysis_figure(
+            original_image,
+            reconstructions,
+            VAE_CONFIGS,
+            analysis,
+            analysis_path
+        )
+
+    zoom_dir = output_dir / f"{safe_name}_zoom"
+    if args.deep_zoom:
+        print(f"Creating deep-zoom tile pyramids...")
+        viewer_path, n_tiles = create_deep_zoom(
+            original_image,
+            reconstructions,
+            ['Original Image'] + [cfg['name'] for cfg in VAE_CONFIGS],
+            zoom_dir,
+            title=display_prompt,
+            tile_format=args.tile_format
+        )
+        print(f"✓ Deep-zoom viewer ({n_tiles} tiles) saved to: {viewer_path}")
+
+    if status is not None:
+        status['done'] = True
+        status['figures'] = [comparison_path.name, grid_path.name] + \
+            ([analysis_path.name] if analysis is not None else []) + \
+            ([f"{zoom_dir.name}/index.html"] if args.deep_zoom else [])
+        write_status(args.status_file, status)
+
     print(f"\n{'='*60}")
     print(f"✓ All done! Results saved to: {output_dir}")
     print(f"{'='*60}\n")
@@ -432,6 +807,10 @@ Examples:
     print(f"  • Original image: {original_path.name}")
     print(f"  • Comparison figure: {comparison_path.name}")
     print(f"  • Grid comparison: {grid_path.name}")
+    if analysis is not None:
+        print(f"  • Error analysis: {analysis_path.name}")
+    if args.deep_zoom:
+        print(f"  • Deep-zoom viewer: {zoom_dir.name}/index.html")
     print(f"  • Individual reconstructions: {len(reconstructions)} files")
     print()
 
@@ -1,11 +1,16 @@
 #!/bin/bash
-# Simple HTTP server for local preview of the project page
+# HTTP server for local preview of the project page
+#
+# Serves the repo root (the page links ../static/...) with scripts/serve.py:
+# threaded, precompressed gzip/brotli assets, ETags/304, range requests and
+# memory-mapped large files, with a latency summary on exit.
 
 PORT=8008
 
-echo "Starting local server on http://localhost:$PORT"
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+ROOT_DIR="$(cd "$SCRIPT_DIR/.." && pwd)"
+
 echo "Press Ctrl+C to stop"
 echo ""
 
-# Use Python 3's built-in HTTP server
-python3 -m http.server $PORT
+python3 "$ROOT_DIR/scripts/serve.py" --root "$ROOT_DIR" --port "$PORT" --page repa-e-t2i/ "$@"
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Incremental, dependency-tracked build of the generated site assets.
+
+Every figure / image script is a target in scripts/assets.yaml with its
+command, parameters, inputs (the script itself, data files, globs) and
+outputs. A target is rebuilt only when its stamp -- a hash of the command and
+the content of every input -- differs from the last successful build, or an
+output is missing. Of the selected targets, one that consumes another's
+outputs runs after it; independent targets run in parallel.
+
+Input hashes are cached by (size, mtime), so an up-to-date tree is checked
+without re-reading large images.
+
+Usage:
+    python scripts/asset_build.py                    # All default targets
+    python scripts/asset_build.py irepa-teaser       # Named targets only
+    python scripts/asset_build.py --list             # Show every target
+    python scripts/asset_build.py --dry-run --force  # Show what --force would run
+
+Output:
+    .asset-build-state.json at the repo root (stamps and input hashes)
+
+Requirements:
+    pip install pyyaml
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_GRAPH = Path(__file__).resolve().parent / "assets.yaml"
+DEFAULT_STATE = REPO_ROOT / ".asset-build-state.json"
+
+
+class BuildGraphError(Exception):
+    """Invalid assets.yaml: unknown targets, conflicting outputs or cycles."""
+
+
+def load_graph(path=DEFAULT_GRAPH):
+    """Load assets.yaml into {name: target} with commands formatted from params."""
+    with open(path) as f:
+        spec = yaml.safe_load(f) or {}
+
+    targets = {}
+    for name, config in (spec.get("targets") or {}).items():
+        params = {"python": sys.executable, **(config.get("params") or {})}
+        targets[name] = {
+            "name": name,
+            "description": config.get("description", ""),
+            "default": config.get("default", True),
+            "cwd": config.get("cwd", "."),
+            "command": [str(arg).format(**params) for arg in config["command"]],
+            "inputs": list(config.get("inputs") or []),
+            "exclude": list(config.get("exclude") or []),
+            "outputs": list(config.get("outputs") or []),
+        }
+    return targets
+
+
+def resolve_dependencies(targets):
+    """Map each target to the other targets whose outputs match one of its input patterns."""
+    owners = {}
+    for target in targets.values():
+        for output in target["outputs"]:
+            if output in owners:
+                raise BuildGraphError(
+                    f"{output} is written by both {owners[output]} and {target['name']}"
+                )
+            owners[output] = target["name"]
+
+    deps = {}
+    for target in targets.values():
+        deps[target["name"]] = sorted({
+            owner for output, owner in owners.items()
+            if owner != target["name"]
+            and any(fnmatch.fnmatch(output, pattern) for pattern in target["inputs"])
+        })
+    return deps
+
+
+def topological_order(deps):
+    """Targets ordered so dependencies come first; raises on cycles."""
+    order, visiting, done = [], set(), set()
+
+    def visit(name, path):
+        if name in done:
+            return
+        if name in visiting:
+            raise BuildGraphError(f"dependency cycle: {' -> '.join(path + [name])}")
+        visiting.add(name)
+        for dep in deps[name]:
+            visit(dep, path + [name])
+        visiting.discard(name)
+        done.add(name)
+        order.append(name)
+
+    for name in sorted(deps):
+        visit(name, [])
+    return order
+
+
+def select_targets(targets, names):
+    """Named targets, or every default target if none are named."""
+    unknown = [name for name in names if name not in targets]
+    if unknown:
+        raise BuildGraphError(f"unknown target(s): {', '.join(unknown)}")
+    selected = names or [name for name, target in targets.items() if target["default"]]
+    return {name: targets[name] for name in selected}
+
+
+class FileHashes:
+    """SHA-256 of input files, reused while a file's size and mtime are unchanged."""
+
+    def __init__(self, records=None):
+        self.records = dict(records or {})
+
+    def sha256(self, rel_path):
+        path = REPO_ROOT / rel_path
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        record = self.records.get(rel_path)
+        if record and record["size"] == stat.st_size and record["mtime_ns"] == stat.st_mtime_ns:
+            return record["sha256"]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self.records[rel_path] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+        return digest
+
+
+def expand_inputs(patterns, exclude=()):
+    """Repo-relative input files for a target's patterns; literal paths are kept even if missing.
+
+    Glob matches that also match an `exclude` pattern are dropped, so a target
+    whose inputs glob over its own outputs does not make itself stale.
+    """
+    files = set()
+    for pattern in patterns:
+        if any(ch in pattern for ch in "*?["):
+            files.update(path for path in (p.relative_to(REPO_ROOT).as_posix()
+                                           for p in REPO_ROOT.glob(pattern) if p.is_file())
+                         if not any(fnmatch.fnmatch(path, skip) for skip in exclude))
+        else:
+            files.add(pattern)
+    return sorted(files)
+
+
+def compute_stamp(target, hashes):
+    """Hash of the command, working directory and the content of every input."""
+    exclude = target["exclude"] + target["outputs"]
+    inputs = {path: hashes.sha256(path) for path in expand_inputs(target["inputs"], exclude)}
+    payload = json.dumps(
+        {"command": target["command"][1:], "cwd": target["cwd"], "inputs": inputs},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def is_stale(target, stamp, state):
+    """True if the stamp changed since the last successful build or an output is missing."""
+    return (
+        state.get("targets", {}).get(target["name"], {}).get("stamp") != stamp
+        or not all((REPO_ROOT / output).exists() for output in target["outputs"])
+    )
+
+
+def run_target(target, hashes, state, force, dry_run):
+    """Check one target and run it if stale. Runs in a worker thread."""
+    start = time.perf_counter()
+    stamp = compute_stamp(target, hashes)
+    checked = time.perf_counter()
+
+    if not force and not is_stale(target, stamp, state):
+        return {"status": "up to date", "stamp": stamp, "check": checked - start, "run": 0.0}
+    if dry_run:
+        return {"status": "stale", "stamp": stamp, "check": checked - start, "run": 0.0}
+
+    proc = subprocess.run(
+        target["command"], cwd=REPO_ROOT / target["cwd"],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+    )
+    return {
+        "status": "built" if proc.returncode == 0 else "failed",
+        "stamp": stamp,
+        "check": checked - start,
+        "run": time.perf_counter() - checked,
+        "log": proc.stdout,
+        "returncode": proc.returncode,
+    }
+
+
+def load_state(path):
+    """Load stamps and cached input hashes, or an empty state."""
+    if not path.exists():
+        return {"targets": {}, "files": {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_state(path, state):
+    """Write the state atomically."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def build(targets, state, jobs, force=False, dry_run=False, verbose=False, state_path=DEFAULT_STATE):
+    """Run targets in dependency order, up to `jobs` at a time; returns {name: result}."""
+    deps = resolve_dependencies(targets)
+    order = topological_order(deps)
+    hashes = FileHashes(state.get("files"))
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        running = {}
+        while len(results) < len(order):
+            for name in order:
+                if name in results or name in running.values():
+                    continue
+                dep_results = [results.get(dep) for dep in deps[name]]
+                if any(r is None for r in dep_results):
+                    continue
+                failed = [dep for dep, r in zip(deps[name], dep_results)
+                          if r["status"] in ("failed", "blocked")]
+                if failed:
+                    results[name] = {"status": "blocked", "check": 0.0, "run": 0.0,
+                                     "after": failed}
+                    print(f"- {name}: blocked by {', '.join(failed)}")
+                    continue
+                # Downstream of a stale target in a dry run: its inputs would change
+                if dry_run and any(r["status"] in ("stale", "stale (upstream)") for r in dep_results):
+                    results[name] = {"status": "stale (upstream)", "check": 0.0, "run": 0.0}
+                    continue
+                future = executor.submit(run_target, targets[name], hashes, state, force, dry_run)
+                running[future] = name
+
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                result = results[name] = future.result()
+                if result["status"] == "built":
+                    state.setdefault("targets", {})[name] = {
+                        "stamp": result["stamp"],
+                        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                        "seconds": round(result["run"], 3),
+                    }
+                    print(f"✓ {name} ({result['run']:.1f}s)")
+                elif result["status"] == "failed":
+                    state.get("targets", {}).pop(name, None)
+                    print(f"✗ {name}: exit code {result['returncode']}")
+                if result.get("log") and (verbose or result["status"] == "failed"):
+                    for line in result["log"].rstrip().splitlines()[-40 if not verbose else None:]:
+                        print(f"    {line}")
+                if not dry_run:
+                    state["files"] = hashes.records
+                    save_state(state_path, state)
+    return results
+
+
+def print_report(targets, results, wall):
+    """Per-target status and timings, in build order."""
+    print("\n" + "=" * 60)
+    print(f"  {'target':<32} {'status':<18} {'check':>7} {'run':>8}")
+    for name in targets:
+        result = results[name]
+        print(f"  {name:<32} {result['status']:<18} {result['check']:>6.2f}s {result['run']:>7.1f}s")
+    serial = sum(r["check"] + r["run"] for r in results.values())
+    print("=" * 60)
+    print(f"  Wall time {wall:.1f}s (serial sum {serial:.1f}s)")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild stale site assets from scripts/assets.yaml",
+    )
+    parser.add_argument("targets", nargs="*", help="Targets to build (default: every default target)")
+    parser.add_argument("--graph", type=str, default=str(DEFAULT_GRAPH), help="Build graph YAML")
+    parser.add_argument("--state", type=str, default=str(DEFAULT_STATE), help="State JSON path")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="Targets to run in parallel (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if up to date")
+    parser.add_argument("--dry-run", action="store_true", help="Only report which targets are stale")
+    parser.add_argument("--list", action="store_true", help="List targets and exit")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print each target's output")
+    args = parser.parse_args()
+
+    try:
+        graph = load_graph(args.graph)
+        targets = select_targets(graph, args.targets)
+    except BuildGraphError as e:
+        parser.error(str(e))
+
+    if args.list:
+        for name, target in graph.items():
+            flag = "" if target["default"] else " (explicit)"
+            print(f"  {name:<32} {target['description']}{flag}")
+        return
+
+    state_path = Path(args.state)
+    state = load_state(state_path)
+    try:
+        order = topological_order(resolve_dependencies(targets))
+    except BuildGraphError as e:
+        parser.error(str(e))
+
+    print("=" * 60)
+    print(f"Asset build: {len(order)} target(s){' (dry run)' if args.dry_run else ''}")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    results = build({name: targets[name] for name in order}, state, args.jobs,
+                    force=args.force, dry_run=args.dry_run, verbose=args.verbose,
+                    state_path=state_path)
+    print_report(order, results, time.perf_counter() - start)
+
+    if any(r["status"] in ("failed", "blocked") for r in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
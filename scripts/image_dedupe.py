@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Find duplicate, near-duplicate and unreferenced images across the project pages.
+
+The repo keeps many iterations of the same artwork (irepa/hero-v1..v5,
+repa-e-t2i/repa-e-t2i-v1..v7, e2e-v1/v2, reconstruction outputs), and it is
+hard to tell which ones a page still uses. For every image under the given
+directories this computes
+
+    sha256  exact content hash: byte-identical copies
+    phash   64-bit perceptual hash (DCT of a 32x32 grayscale thumbnail): the
+            same picture re-exported, resized, recompressed or lightly edited
+
+Thumbnails are decoded in parallel (one process per image); the DCT and the
+all-pairs Hamming distances are computed for the whole batch at once in
+NumPy. Images within --threshold bits of each other are clustered.
+
+Each image is cross-referenced with what the pages load (the same resolution
+as page_weight.py: <img>/<source>/<video>, iframes, stylesheet url()s) and,
+failing that, with its file name appearing in any HTML/CSS/JS/Markdown/Python
+file. The report lists exact duplicates, near-duplicate clusters,
+unreferenced files, and the bytes that removing them would save.
+
+Hashes are cached in .image-hash-cache.json (git-ignored) by size and mtime,
+so reruns only decode images that changed; images that fail to decode are
+cached as failures the same way. Generated indexes that list every image (this
+cache, the placeholder/variant manifests, build state, --json reports) are not
+searched for mentions, or every image would count as referenced.
+
+Usage:
+    python scripts/image_dedupe.py                       # Every image in the repo
+    python scripts/image_dedupe.py repa-e-t2i irepa -v   # Some directories, list cluster members
+    python scripts/image_dedupe.py --threshold 6 --json dedupe.json
+
+Requirements:
+    pip install pillow numpy
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+try:
+    from PIL import Image
+except ImportError:
+    print("Error: pillow not installed")
+    print("Install with: pip install pillow")
+    sys.exit(1)
+
+from page_weight import DEFAULT_PAGES, analyze_page
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE = REPO_ROOT / ".image-hash-cache.json"
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".gif"}
+TEXT_EXTENSIONS = {".html", ".css", ".js", ".md", ".py", ".yaml", ".json", ".bib", ".sh"}
+SKIP_DIRS = {".git", ".preview-cache", "node_modules", "__pycache__", "variants"}
+# Generated files that list image paths wholesale; a mention there is not a use
+GENERATED_INDEXES = [
+    ".image-hash-cache.json",
+    ".asset-build-state.json",
+    "placeholders-manifest.json",
+    "variants-manifest.json",
+    "scripts/page_weight_baseline.json",
+    "irepa/assets/flux/outputs/build_state.json",
+    "irepa/assets/flux/.cache/*",
+    "*/corpus/index.json",
+]
+# Bumped when the hash definition changes, so stale cache entries are recomputed
+HASH_VERSION = 2
+THUMB_SIZE = 32
+HASH_SIZE = 8
+
+
+def relative(path):
+    """Path relative to the repo root, in URL (posix) form."""
+    return Path(os.path.relpath(path, REPO_ROOT)).as_posix()
+
+
+def walk(roots, extensions):
+    """Repo-relative files under `roots` with one of `extensions`, skipping SKIP_DIRS."""
+    files = set()
+    for root in map(Path, roots):
+        root = root if root.is_absolute() else REPO_ROOT / root
+        if root.is_file():
+            if root.suffix.lower() in extensions:
+                files.add(relative(root))
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            files.update(relative(Path(dirpath) / name) for name in filenames
+                         if Path(name).suffix.lower() in extensions)
+    return sorted(files)
+
+
+def load_thumbnail(rel_path):
+    """sha256, size and a THUMB_SIZE^2 grayscale thumbnail of one image. Runs in a worker process."""
+    path = REPO_ROOT / rel_path
+    data = path.read_bytes()
+    with Image.open(path) as img:
+        img.seek(0)
+        width, height = img.size
+        img = img.convert("RGBA")
+    # Transparent regions count as the white page background
+    background = Image.new("RGBA", img.size, (255, 255, 255, 255))
+    gray = Image.alpha_composite(background, img).convert("L")
+    thumb = gray.resize((THUMB_SIZE, THUMB_SIZE), Image.Resampling.LANCZOS)
+    return hashlib.sha256(data).hexdigest(), width, height, np.asarray(thumb, dtype=np.float32)
+
+
+def dct_matrix(n):
+    """Orthonormal DCT-II basis as an (n, n) matrix."""
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    basis = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    basis[0] /= np.sqrt(2)
+    return basis
+
+
+def perceptual_hashes(thumbs):
+    """64-bit pHash per thumbnail, for a (N, 32, 32) batch; returns (N, 64) bool bits.
+
+    The 2-D DCT of every thumbnail is two batched matrix products; each hash
+    bit says whether a coefficient of the top-left HASH_SIZE x HASH_SIZE
+    block is above that image's median. The DC term [0, 0] is left out of the
+    median and its bit is always 0, so flat brightness changes do not matter.
+    """
+    basis = dct_matrix(THUMB_SIZE)[:HASH_SIZE]
+    low = (basis @ thumbs @ basis.T).reshape(len(thumbs), -1)   # (N, 64), DC first
+    ac = low[:, 1:]
+    bits = np.zeros(low.shape, dtype=bool)
+    bits[:, 1:] = ac > np.median(ac, axis=1, keepdims=True)
+    return bits
+
+
+def hamming_matrix(bits):
+    """All-pairs Hamming distances of (N, 64) bool bits as an (N, N) int matrix."""
+    b = bits.astype(np.float32)
+    return np.rint(b @ (1 - b).T + (1 - b) @ b.T).astype(np.int32)
+
+
+def bits_to_hex(bits):
+    return np.packbits(bits).tobytes().hex()
+
+
+def hex_to_bits(value):
+    return np.unpackbits(np.frombuffer(bytes.fromhex(value), dtype=np.uint8)).astype(bool)
+
+
+def update_hashes(files, cache, workers):
+    """Hash entries for `files`, decoding only those not in the cache.
+
+    Returns (entries, failures, decoded count); failures are cache records
+    with an "error" instead of hashes, so undecodable files are not retried
+    until they change.
+    """
+    entries, failures = {}, {}
+    pending = []
+    for rel_path in files:
+        stat = (REPO_ROOT / rel_path).stat()
+        record = cache.get(rel_path)
+        if (record and record["size"] == stat.st_size and record["mtime_ns"] == stat.st_mtime_ns
+                and record.get("version") == HASH_VERSION):
+            (failures if "error" in record else entries)[rel_path] = record
+        else:
+            pending.append((rel_path, stat))
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(load_thumbnail, rel_path) for rel_path, _ in pending]
+            decoded = []
+            for (rel_path, stat), future in zip(pending, futures):
+                try:
+                    decoded.append((rel_path, stat, *future.result()))
+                except Exception as e:
+                    print(f"✗ {rel_path}: {e}")
+                    failures[rel_path] = {"version": HASH_VERSION, "size": stat.st_size,
+                                          "mtime_ns": stat.st_mtime_ns, "error": str(e)}
+        if decoded:
+            bits = perceptual_hashes(np.stack([thumb for *_, thumb in decoded]))
+            for (rel_path, stat, sha256, width, height, _), row in zip(decoded, bits):
+                entries[rel_path] = {
+                    "version": HASH_VERSION, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+                    "sha256": sha256, "phash": bits_to_hex(row), "width": width, "height": height,
+                }
+    return entries, failures, len(pending)
+
+
+def cluster(distances, threshold):
+    """Connected components of images within `threshold` bits; only groups of two or more."""
+    parent = list(range(len(distances)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in zip(*np.nonzero(np.triu(distances <= threshold, k=1))):
+        parent[find(i)] = find(j)
+
+    groups = {}
+    for i in range(len(distances)):
+        groups.setdefault(find(i), []).append(i)
+    return [members for members in groups.values() if len(members) > 1]
+
+
+def loaded_images(pages):
+    """Repo-relative paths of every file the pages load (via page_weight's resolver)."""
+    loaded = set()
+    for page in pages:
+        report = analyze_page(REPO_ROOT / page, fold_chars=0)
+        loaded.update(asset["path"] for asset in report["assets"])
+    return loaded
+
+
+def is_generated_index(rel_path, extra=()):
+    """True for generated files that list image paths wholesale (see GENERATED_INDEXES)."""
+    return any(fnmatch.fnmatch(rel_path, pattern) for pattern in [*GENERATED_INDEXES, *extra])
+
+
+def mentioned_names(text_files):
+    """File names that appear anywhere in the repo's text files (scripts, READMEs, JS, ...).
+
+    Returns (names, patterns): literal lower-cased file names, and regexes for
+    templated paths such as `static/img/qualitative/${num}.png` in page JS.
+    """
+    names, patterns = set(), set()
+    literal = re.compile(r"[\w.\-]+\.(?:png|jpe?g|webp|gif)", re.IGNORECASE)
+    templated = re.compile(r"([\w./\-]*)\$\{[^}]*\}([\w.\-]*\.(?:png|jpe?g|webp|gif))", re.IGNORECASE)
+    for rel_path in text_files:
+        try:
+            text = (REPO_ROOT / rel_path).read_text(errors="replace")
+        except OSError:
+            continue
+        names.update(match.lower() for match in literal.findall(text))
+        for prefix, suffix in templated.findall(text):
+            # Anchor on the directory the template points into, e.g. "qualitative/<anything>.png"
+            head, _, stem = prefix.rpartition("/")
+            directory = head.rsplit("/", 1)[-1]
+            anchor = re.escape(directory) + "/" if directory else "(?:^|/)"
+            patterns.add(re.compile(anchor + re.escape(stem) + r"[^/]*" + re.escape(suffix) + "$",
+                                    re.IGNORECASE))
+    return names, patterns
+
+
+def classify(rel_path, loaded, mentioned):
+    """'loaded' by a page, 'mentioned' by name in some text file, or 'unreferenced'."""
+    names, patterns = mentioned
+    if rel_path in loaded:
+        return "loaded"
+    if Path(rel_path).name.lower() in names or any(p.search(rel_path) for p in patterns):
+        return "mentioned"
+    return "unreferenced"
+
+
+def analyze(entries, loaded, mentioned, threshold):
+    """Exact-duplicate groups, near-duplicate clusters and unreferenced files, with savable bytes."""
+    files = sorted(entries)
+    status = {f: classify(f, loaded, mentioned) for f in files}
+    rank = {"loaded": 0, "mentioned": 1, "unreferenced": 2}
+
+    def keeper_order(f):
+        # Keep the copy a page uses, then the shortest path
+        return rank[status[f]], len(f), f
+
+    by_sha = {}
+    for f in files:
+        by_sha.setdefault(entries[f]["sha256"], []).append(f)
+    exact = []
+    for group in by_sha.values():
+        if len(group) > 1:
+            group = sorted(group, key=keeper_order)
+            exact.append({
+                "keep": group[0],
+                "duplicates": group[1:],
+                "savable": sum(entries[f]["size"] for f in group[1:]),
+            })
+
+    near = []
+    if files:
+        bits = np.stack([hex_to_bits(entries[f]["phash"]) for f in files])
+        distances = hamming_matrix(bits)
+        for members in cluster(distances, threshold):
+            paths = [files[i] for i in members]
+            # Distinct contents only; byte-identical copies are already in `exact`
+            if len({entries[p]["sha256"] for p in paths}) < 2:
+                continue
+            sub = distances[np.ix_(members, members)]
+            unused = [p for p in paths if status[p] != "loaded"]
+            near.append({
+                "members": sorted(paths, key=keeper_order),
+                "max_distance": int(sub.max()),
+                "loaded": [p for p in paths if status[p] == "loaded"],
+                # Unused iterations are removable only if some member is still in use
+                "savable": sum(entries[p]["size"] for p in unused) if len(unused) < len(paths) else 0,
+            })
+        near.sort(key=lambda c: -c["savable"])
+
+    unreferenced = [f for f in files if status[f] == "unreferenced"]
+    exact_dupes = {f for group in exact for f in group["duplicates"]}
+    removable = set(unreferenced) | {f for f in exact_dupes if status[f] != "loaded"}
+    return {
+        "files": len(files),
+        "bytes": sum(entries[f]["size"] for f in files),
+        "status": status,
+        "exact": sorted(exact, key=lambda g: -g["savable"]),
+        "near": near,
+        "unreferenced": sorted(unreferenced, key=lambda f: -entries[f]["size"]),
+        "savable": {
+            "exact_duplicates": sum(g["savable"] for g in exact),
+            "unreferenced": sum(entries[f]["size"] for f in unreferenced),
+            "removable_total": sum(entries[f]["size"] for f in removable),
+        },
+    }
+
+
+def load_cache(path):
+    """Load cached hashes, or an empty cache."""
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_cache(path, cache):
+    """Write the cache atomically."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(cache, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def kb(size):
+    return f"{size / 1024:,.0f} KB"
+
+
+def print_report(result, entries, verbose):
+    status = result["status"]
+
+    print(f"\nExact duplicates: {len(result['exact'])} group(s), {kb(result['savable']['exact_duplicates'])}")
+    for group in result["exact"]:
+        print(f"  {kb(group['savable']):>10}  keep {group['keep']} ({status[group['keep']]})")
+        for f in group["duplicates"]:
+            print(f"  {'':>10}    = {f} ({status[f]})")
+
+    print(f"\nNear-duplicate clusters: {len(result['near'])}")
+    shown = result["near"] if verbose else result["near"][:10]
+    for c in shown:
+        print(f"  {kb(c['savable']):>10}  {len(c['members'])} images, <= {c['max_distance']} bits apart")
+        members = c["members"] if verbose else c["members"][:6]
+        for f in members:
+            print(f"  {'':>10}    {status[f]:<12} {kb(entries[f]['size']):>9}  {f}")
+        if len(members) < len(c["members"]):
+            print(f"  {'':>10}    ... {len(c['members']) - len(members)} more")
+    if len(shown) < len(result["near"]):
+        print(f"  ... {len(result['near']) - len(shown)} more cluster(s) (-v to list all)")
+
+    print(f"\nUnreferenced: {len(result['unreferenced'])} file(s), {kb(result['savable']['unreferenced'])}")
+    shown = result["unreferenced"] if verbose else result["unreferenced"][:15]
+    for f in shown:
+        print(f"  {kb(entries[f]['size']):>10}  {f}")
+    if len(shown) < len(result["unreferenced"]):
+        print(f"  ... {len(result['unreferenced']) - len(shown)} more (-v to list all)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Duplicate and unreferenced image report")
+    parser.add_argument("paths", nargs="*", default=["."],
+                        help="Directories or images to scan, relative to the repo root (default: whole repo)")
+    parser.add_argument("--pages", nargs="+", default=DEFAULT_PAGES,
+                        help="Pages whose loaded assets count as used (default: every project page)")
+    parser.add_argument("--threshold", type=int, default=8,
+                        help="Max differing pHash bits (of 64) for a near duplicate (default: 8)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Decode processes (default: CPU count)")
+    parser.add_argument("--cache", type=str, default=str(DEFAULT_CACHE),
+                        help="Hash cache path (default: .image-hash-cache.json at the repo root)")
+    parser.add_argument("--json", type=str, default=None, help="Write the full report as JSON")
+    parser.add_argument("-v", "--verbose", action="store_true", help="List every cluster member")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    files = walk(args.paths, IMAGE_EXTENSIONS)
+    cache_path = Path(args.cache).resolve()
+    cache = load_cache(cache_path)
+
+    # Mentions are collected before this run writes its own cache or report
+    outputs = [relative(cache_path)] + ([relative(Path(args.json).resolve())] if args.json else [])
+    loaded = loaded_images(args.pages)
+    mentioned = mentioned_names([f for f in walk(["."], TEXT_EXTENSIONS) if not is_generated_index(f, outputs)])
+
+    entries, failures, decoded = update_hashes(files, cache, args.workers)
+    if decoded:
+        cache.update(entries)
+        cache.update(failures)
+        # Drop entries for files that no longer exist
+        save_cache(cache_path, {f: e for f, e in cache.items() if (REPO_ROOT / f).is_file()})
+    result = analyze(entries, loaded, mentioned, args.threshold)
+
+    print("=" * 60)
+    print(f"Image dedupe: {result['files']} image(s), {kb(result['bytes'])}")
+    print(f"  {len(files) - decoded} cached, {decoded} hashed, threshold {args.threshold}/64 bits")
+    if failures:
+        print(f"  {len(failures)} unreadable: {', '.join(sorted(failures)[:5])}"
+              f"{', ...' if len(failures) > 5 else ''}")
+    print("=" * 60)
+    print_report(result, entries, args.verbose)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({**result, "hashes": entries}, f, indent=2)
+
+    savable = result["savable"]
+    print("\n" + "=" * 60)
+    print(f"Savable: {kb(savable['exact_duplicates'])} in exact duplicates, "
+          f"{kb(savable['unreferenced'])} unreferenced ({kb(savable['removable_total'])} combined)")
+    print(f"✓ Done in {time.perf_counter() - start:.1f}s")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Generate low-quality image placeholders (LQIP), blurhash strings and intrinsic
+dimensions for every image the project pages load.
+
+Large figures (repa-e-t2i-v*.png, t2i_qualitative.jpg, training_time.png, ...)
+take a while to arrive, and an <img> without width/height collapses to zero
+height until they do, so the page jumps. For each image this records
+
+    width, height  intrinsic size, for width/height attributes (stable layout)
+    color          average color, for a plain background while loading
+    transparent    whether the image has alpha (no placeholder background then)
+    lqip           a ~20 px wide blurred WebP as a data: URI (a few hundred bytes)
+    blurhash       a ~30 character blurhash string (https://blurha.sh), for pages
+                   that decode placeholders in JS
+
+in placeholders-manifest.json at the repo root, which the pages can inline:
+
+    <img src="static/img/training_time.png" width="2400" height="1200" loading="lazy"
+         style="background: #f4f4f6 url(data:image/webp;base64,...) center / cover no-repeat">
+
+The images are found the same way page_weight.py resolves a page (img/source
+srcsets, iframes, stylesheet url()s), or given explicitly. They are processed
+in parallel (one process per image); each entry stores the source SHA-256 and
+settings, so unchanged images are skipped on the next run.
+
+Usage:
+    python scripts/image_placeholders.py                               # Every page's images
+    python scripts/image_placeholders.py --pages repa-e-t2i/index.html --html
+    python scripts/image_placeholders.py diffusion-bench/assets/t2i_qualitative.jpg
+
+Requirements:
+    pip install pillow numpy
+"""
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+try:
+    from PIL import Image, ImageFilter
+except ImportError:
+    print("Error: pillow not installed")
+    print("Install with: pip install pillow")
+    sys.exit(1)
+
+from page_weight import DEFAULT_PAGES, analyze_page
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_MANIFEST = REPO_ROOT / "placeholders-manifest.json"
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".gif"}
+DEFAULT_SETTINGS = {"lqip_width": 20, "lqip_quality": 40, "components": [4, 3]}
+
+BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+# Blurhash factors are computed on a downscaled copy; more pixels do not change the result
+BLURHASH_SAMPLE = 64
+
+
+def relative(path):
+    """Path relative to the repo root, in URL (posix) form."""
+    return Path(os.path.relpath(path, REPO_ROOT)).as_posix()
+
+
+def file_sha256(path):
+    """SHA-256 of a file's contents."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def page_images(pages):
+    """{repo-relative image: [pages that load it]} for every raster image the pages load."""
+    images = {}
+    for page in pages:
+        report = analyze_page(REPO_ROOT / page, fold_chars=0)
+        for asset in report["assets"]:
+            if Path(asset["path"]).suffix.lower() in IMAGE_EXTENSIONS:
+                images.setdefault(asset["path"], []).append(report["page"])
+    return images
+
+
+def base83(value, length):
+    """Fixed-width base-83 digits of an integer (blurhash encoding)."""
+    return "".join(BASE83[(value // 83 ** (length - i - 1)) % 83] for i in range(length))
+
+
+def srgb_to_linear(values):
+    v = values / 255.0
+    return np.where(v <= 0.04045, v / 12.92, ((v + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(value):
+    v = min(max(value, 0.0), 1.0)
+    if v <= 0.0031308:
+        return int(v * 12.92 * 255 + 0.5)
+    return int((1.055 * v ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def blurhash(rgb, components_x, components_y):
+    """Blurhash of an (H, W, 3) uint8 array.
+
+    All components_x * components_y cosine factors come from one einsum over
+    the linear-light pixels, instead of a Python loop per component and pixel.
+    """
+    height, width, _ = rgb.shape
+    linear = srgb_to_linear(rgb.astype(np.float64))
+    basis_x = np.cos(np.pi * np.arange(components_x)[:, None] * np.arange(width)[None, :] / width)
+    basis_y = np.cos(np.pi * np.arange(components_y)[:, None] * np.arange(height)[None, :] / height)
+    factors = np.einsum("jy,ix,yxc->jic", basis_y, basis_x, linear) / (width * height)
+    factors[1:] *= 2
+    factors[0, 1:] *= 2
+    factors = factors.reshape(-1, 3)            # row-major: y outer, x inner, as the spec orders them
+    dc, ac = factors[0], factors[1:]
+
+    result = base83((components_x - 1) + (components_y - 1) * 9, 1)
+    if len(ac):
+        quantised_max = int(max(0, min(82, np.floor(np.abs(ac).max() * 166 - 0.5))))
+        max_value = (quantised_max + 1) / 166
+        result += base83(quantised_max, 1)
+    else:
+        max_value = 1.0
+        result += base83(0, 1)
+
+    r, g, b = (linear_to_srgb(c) for c in dc)
+    result += base83((r << 16) + (g << 8) + b, 4)
+
+    scaled = ac / max_value
+    quantised = np.clip(np.floor(np.sign(scaled) * np.abs(scaled) ** 0.5 * 9 + 9.5), 0, 18).astype(int)
+    for qr, qg, qb in quantised:
+        result += base83(int(qr) * 19 * 19 + int(qg) * 19 + int(qb), 2)
+    return result
+
+
+def build_placeholder(source, sha256, settings):
+    """Dimensions, average color, LQIP data URI and blurhash of one image. Runs in a worker process."""
+    source = Path(source)
+    with Image.open(source) as img:
+        img.seek(0)
+        width, height = img.size
+        img = img.convert("RGBA")
+    transparent = bool(img.getextrema()[3][0] < 255)
+    # Transparent figures sit on the white page background
+    background = Image.new("RGBA", img.size, (255, 255, 255, 255))
+    rgb = Image.alpha_composite(background, img).convert("RGB")
+
+    scale = BLURHASH_SAMPLE / max(width, height)
+    sample = rgb.resize((max(1, round(width * scale)), max(1, round(height * scale))), Image.Resampling.BOX) \
+        if scale < 1 else rgb
+    pixels = np.asarray(sample)
+    average = pixels.reshape(-1, 3).mean(axis=0).round().astype(int)
+
+    lqip_width = min(settings["lqip_width"], width)
+    lqip_height = max(1, round(height * lqip_width / width))
+    tiny = sample.resize((lqip_width, lqip_height), Image.Resampling.LANCZOS)
+    tiny = tiny.filter(ImageFilter.GaussianBlur(0.6))
+    buffer = io.BytesIO()
+    tiny.save(buffer, "WEBP", quality=settings["lqip_quality"], method=6)
+
+    return relative(source), {
+        "sha256": sha256,
+        "settings": settings,
+        "width": width,
+        "height": height,
+        "transparent": transparent,
+        "color": "#{:02x}{:02x}{:02x}".format(*average),
+        "lqip": "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode("ascii"),
+        "blurhash": blurhash(pixels, *settings["components"]),
+    }
+
+
+def is_current(entry, sha256, settings):
+    """True if a manifest entry was built from the same bytes and settings."""
+    return entry is not None and entry["sha256"] == sha256 and entry["settings"] == settings
+
+
+def placeholder_html(path, entry, base=""):
+    """Suggested <img> markup with intrinsic size and an inline placeholder background.
+
+    Images with transparency get only width/height: the placeholder would keep
+    showing through them after they load.
+    """
+    style = ""
+    if not entry["transparent"]:
+        style = f' style="background: {entry["color"]} url({entry["lqip"]}) center / cover no-repeat"'
+    return (f'<img src="{base}{path}" width="{entry["width"]}" height="{entry["height"]}" '
+            f'loading="lazy" decoding="async"{style}>')
+
+
+def load_manifest(path):
+    """Load the manifest, or an empty one."""
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_manifest(path, manifest):
+    """Write the manifest atomically with stable ordering."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate LQIP / blurhash placeholders and intrinsic sizes")
+    parser.add_argument("paths", nargs="*",
+                        help="Images to process (default: every image the pages load)")
+    parser.add_argument("--pages", nargs="+", default=DEFAULT_PAGES,
+                        help="Pages whose images are processed (default: every project page)")
+    parser.add_argument("--lqip-width", type=int, default=DEFAULT_SETTINGS["lqip_width"],
+                        help=f"LQIP width in pixels (default: {DEFAULT_SETTINGS['lqip_width']})")
+    parser.add_argument("--components", type=int, nargs=2, default=DEFAULT_SETTINGS["components"],
+                        metavar=("X", "Y"), help="Blurhash components, 1-9 each (default: 4 3)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--manifest", type=str, default=str(DEFAULT_MANIFEST),
+                        help="Manifest JSON path (default: placeholders-manifest.json at the repo root)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if inputs are unchanged")
+    parser.add_argument("--html", action="store_true", help="Print <img> markup for each image")
+    args = parser.parse_args()
+
+    if not all(1 <= c <= 9 for c in args.components):
+        parser.error("--components must be between 1 and 9")
+    settings = {**DEFAULT_SETTINGS, "lqip_width": args.lqip_width, "components": args.components}
+
+    if args.paths:
+        sources = {relative(Path(p).resolve()): [] for p in args.paths}
+    else:
+        sources = page_images(args.pages)
+    missing = [s for s in sources if not (REPO_ROOT / s).is_file()]
+    for path in missing:
+        print(f"? missing: {path}")
+        del sources[path]
+
+    manifest_path = Path(args.manifest)
+    manifest = load_manifest(manifest_path)
+
+    print("=" * 60)
+    print(f"Image placeholders: {len(sources)} image(s)")
+    print(f"LQIP {settings['lqip_width']}px WebP, blurhash {settings['components'][0]}x{settings['components'][1]}")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    pending = []
+    for path in sorted(sources):
+        sha256 = file_sha256(REPO_ROOT / path)
+        if args.force or not is_current(manifest.get(path), sha256, settings):
+            pending.append((path, sha256))
+    print(f"  {len(sources) - len(pending)} unchanged, {len(pending)} to build")
+
+    changed = False
+    if pending:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = [executor.submit(build_placeholder, REPO_ROOT / path, sha256, settings)
+                       for path, sha256 in pending]
+            for (path, _), future in zip(pending, futures):
+                try:
+                    key, entry = future.result()
+                except Exception as e:
+                    print(f"✗ {path}: {e}")
+                    continue
+                manifest[key] = entry
+                changed = True
+                print(f"✓ {key}: {entry['width']}x{entry['height']}, "
+                      f"LQIP {len(entry['lqip'])} B, blurhash {entry['blurhash']}")
+
+    # Record which pages use each image, so a page can pick out its own entries
+    for path, pages in sources.items():
+        if path in manifest and pages and manifest[path].get("pages") != sorted(pages):
+            manifest[path]["pages"] = sorted(pages)
+            changed = True
+    if changed:
+        save_manifest(manifest_path, manifest)
+
+    if args.html:
+        for path in sorted(sources):
+            entry = manifest.get(path)
+            if entry is not None:
+                print(f"\n<!-- {path} -->")
+                print(placeholder_html(path, entry, base="/"))
+
+    print("=" * 60)
+    print(f"✓ Done in {time.perf_counter() - start:.1f}s. Manifest: {manifest_path}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
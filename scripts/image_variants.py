@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Generate responsive image variants (srcset ladders) for the project pages.
+
+optimize_image / optimize_icon in irepa/assets/flux write one capped PNG per
+asset. This extends the same resize-and-compress step to a ladder of widths
+in several formats (WebP, AVIF, optimized PNG), so a page can serve
+
+    <picture>
+      <source type="image/avif" srcset="hero-480w.avif 480w, hero-960w.avif 960w, ...">
+      <source type="image/webp" srcset="hero-480w.webp 480w, ...">
+      <img src="hero-1920w.png" srcset="..." sizes="100vw" width="..." height="...">
+    </picture>
+
+and visitors only download the bytes their screen needs.
+
+Sources are processed in parallel (one process per image). Each source's
+SHA-256 and settings are recorded in the manifest, so unchanged inputs are
+skipped on the next run.
+
+Usage:
+    python scripts/image_variants.py repa-e-t2i/static/img            # Whole directory
+    python scripts/image_variants.py irepa/static/img/hero.png --html # Print <picture> markup
+    python scripts/image_variants.py diffusion-bench/assets --widths 640 1280 --formats webp png
+
+Output:
+    <source dir>/variants/<stem>-<width>w.<ext> for every width and format
+    variants-manifest.json at the repo root (paths relative to the repo root)
+
+Requirements:
+    pip install pillow   (AVIF needs Pillow >= 11.2 built with libavif)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    from PIL import Image, features
+except ImportError:
+    print("Error: pillow not installed")
+    print("Install with: pip install pillow")
+    sys.exit(1)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_MANIFEST = REPO_ROOT / "variants-manifest.json"
+DEFAULT_WIDTHS = [480, 960, 1440, 1920]
+DEFAULT_FORMATS = ["avif", "webp", "png"]
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg"}
+VARIANTS_DIRNAME = "variants"
+
+# Pillow save arguments per output format
+FORMAT_OPTIONS = {
+    "avif": ("AVIF", ".avif", "image/avif", lambda q: {"quality": q, "speed": 6}),
+    "webp": ("WEBP", ".webp", "image/webp", lambda q: {"quality": q, "method": 6}),
+    "png": ("PNG", ".png", "image/png", lambda q: {"optimize": True}),
+}
+
+
+def find_sources(paths):
+    """Expand files and directories into a sorted list of source images (skipping variants)."""
+    sources = set()
+    for path in map(Path, paths):
+        if path.is_dir():
+            candidates = (p for p in path.rglob("*") if p.suffix.lower() in IMAGE_EXTENSIONS)
+        else:
+            candidates = [path]
+        for candidate in candidates:
+            if VARIANTS_DIRNAME not in candidate.parts:
+                sources.add(candidate.resolve())
+    return sorted(sources)
+
+
+def file_sha256(path):
+    """SHA-256 of a file's contents."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def relative(path):
+    """Path relative to the repo root, in URL (posix) form."""
+    return Path(os.path.relpath(path, REPO_ROOT)).as_posix()
+
+
+def width_ladder(source_width, widths):
+    """Requested widths that do not upscale; the source width stands in for larger rungs."""
+    return sorted({w for w in widths if w < source_width} | {min(source_width, max(widths))})
+
+
+def build_variants(source, sha256, widths, formats, quality):
+    """Write every width x format variant of one source image. Runs in a worker process."""
+    source = Path(source)
+    out_dir = source.parent / VARIANTS_DIRNAME
+    out_dir.mkdir(exist_ok=True)
+
+    img = Image.open(source)
+    img.load()
+    has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+    img = img.convert("RGBA" if has_alpha else "RGB")
+
+    entry = {
+        "sha256": sha256,
+        "width": img.width,
+        "height": img.height,
+        "settings": {"widths": widths, "formats": formats, "quality": quality},
+        "variants": {fmt: [] for fmt in formats},
+    }
+
+    # Resize from the largest rung down, so each step resamples a smaller image
+    current = img
+    for width in sorted(width_ladder(img.width, widths), reverse=True):
+        height = round(img.height * width / img.width)
+        if current.width != width:
+            current = current.resize((width, height), Image.Resampling.LANCZOS)
+        for fmt in formats:
+            pil_format, ext, _, options = FORMAT_OPTIONS[fmt]
+            out_path = out_dir / f"{source.stem}-{width}w{ext}"
+            tmp_path = out_path.with_name(out_path.name + ".tmp")
+            current.save(tmp_path, pil_format, **options(quality))
+            os.replace(tmp_path, out_path)
+            entry["variants"][fmt].append({
+                "width": width,
+                "height": height,
+                "path": relative(out_path),
+                "bytes": out_path.stat().st_size,
+            })
+
+    for fmt in formats:
+        entry["variants"][fmt].sort(key=lambda v: v["width"])
+    return relative(source), entry
+
+
+def is_current(entry, sha256, settings):
+    """True if a manifest entry was built from the same bytes and settings and all files exist."""
+    return (
+        entry is not None
+        and entry["sha256"] == sha256
+        and entry["settings"] == settings
+        and all((REPO_ROOT / v["path"]).exists()
+                for variants in entry["variants"].values() for v in variants)
+    )
+
+
+def srcset(variants, base=""):
+    """Build a srcset string from one format's variant list."""
+    return ", ".join(f"{base}{v['path']} {v['width']}w" for v in variants)
+
+
+def picture_html(entry, alt="", sizes="100vw", base="/"):
+    """Render a <picture> element for one manifest entry."""
+    lines = ["<picture>"]
+    fallback = None
+    for fmt, variants in entry["variants"].items():
+        mime = FORMAT_OPTIONS[fmt][2]
+        if fmt == "png":
+            fallback = variants
+            continue
+        lines.append(f'  <source type="{mime}" srcset="{srcset(variants, base)}" sizes="{sizes}">')
+    fallback = fallback or next(iter(entry["variants"].values()))
+    lines.append(
+        f'  <img src="{base}{fallback[-1]["path"]}" srcset="{srcset(fallback, base)}" sizes="{sizes}" '
+        f'width="{entry["width"]}" height="{entry["height"]}" alt="{alt}" loading="lazy" decoding="async">'
+    )
+    lines.append("</picture>")
+    return "\n".join(lines)
+
+
+def load_manifest(path):
+    """Load the manifest, or an empty one."""
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_manifest(path, manifest):
+    """Write the manifest atomically with stable ordering."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate responsive WebP/AVIF/PNG variants and a srcset manifest",
+    )
+    parser.add_argument("paths", nargs="+", help="Image files or directories to process")
+    parser.add_argument("--widths", type=int, nargs="+", default=DEFAULT_WIDTHS,
+                        help=f"Width ladder in pixels (default: {' '.join(map(str, DEFAULT_WIDTHS))})")
+    parser.add_argument("--formats", nargs="+", default=DEFAULT_FORMATS, choices=list(FORMAT_OPTIONS),
+                        help="Output formats (default: avif webp png)")
+    parser.add_argument("--quality", type=int, default=80, help="WebP/AVIF quality (default: 80)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--manifest", type=str, default=str(DEFAULT_MANIFEST),
+                        help="Manifest JSON path (default: variants-manifest.json at the repo root)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if inputs are unchanged")
+    parser.add_argument("--html", action="store_true", help="Print <picture> markup for each source")
+    args = parser.parse_args()
+
+    formats = list(dict.fromkeys(args.formats))
+    if "avif" in formats and not features.check("avif"):
+        print("Warning: this Pillow build has no AVIF support, skipping AVIF")
+        formats.remove("avif")
+    settings = {"widths": sorted(set(args.widths)), "formats": formats, "quality": args.quality}
+
+    manifest_path = Path(args.manifest)
+    manifest = load_manifest(manifest_path)
+    sources = find_sources(args.paths)
+
+    print("=" * 60)
+    print(f"Responsive variants: {len(sources)} source image(s)")
+    print(f"Widths: {settings['widths']}  Formats: {formats}")
+    print("=" * 60)
+
+    # Hash every source and keep only the ones that changed
+    start = time.perf_counter()
+    pending = []
+    for source in sources:
+        sha256 = file_sha256(source)
+        if args.force or not is_current(manifest.get(relative(source)), sha256, settings):
+            pending.append((source, sha256))
+    print(f"  {len(sources) - len(pending)} unchanged, {len(pending)} to build")
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = [
+                executor.submit(build_variants, source, sha256, settings["widths"], formats, args.quality)
+                for source, sha256 in pending
+            ]
+            for (source, _), future in zip(pending, futures):
+                try:
+                    key, entry = future.result()
+                except Exception as e:
+                    print(f"✗ {relative(source)}: {e}")
+                    continue
+                manifest[key] = entry
+                original = source.stat().st_size
+                smallest = min(v["bytes"] for vs in entry["variants"].values() for v in vs)
+                print(f"✓ {key}: {original / 1024:.0f} KB -> smallest variant {smallest / 1024:.0f} KB")
+        save_manifest(manifest_path, manifest)
+
+    if args.html:
+        for source in sources:
+            entry = manifest.get(relative(source))
+            if entry is not None:
+                print(f"\n<!-- {relative(source)} -->")
+                print(picture_html(entry, alt=source.stem))
+
+    print("=" * 60)
+    print(f"✓ Done in {time.perf_counter() - start:.1f}s. Manifest: {manifest_path}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
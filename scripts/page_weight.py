@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Offline page-weight and critical-path budget report for the project pages.
+
+Each page is parsed and every local image, stylesheet, script, video and
+iframe it references is resolved on disk (iframes such as
+diffusion-bench/assets/fid_correlation*.html are parsed recursively, and
+url() references inside local stylesheets are followed). Every asset is
+placed on the loading path it takes in the browser:
+
+    critical  render-blocking stylesheets and synchronous scripts, plus
+              media that appears before the fold (--fold-chars of visible text)
+    eager     other media fetched at load time (candidates for loading="lazy")
+    deferred  loading="lazy", async/defer scripts, lazy iframes and what they
+              load, and url() assets that stylesheets fetch on use
+
+Bytes are reported as transfer size (text assets gzip-compressed, as GitHub
+Pages serves them). Assets and pages over budget are flagged, and the totals
+are compared with a stored baseline: any page that grows by more than
+--tolerance fails the run, so a stray 5 MB PNG is caught before it ships.
+
+Usage:
+    python scripts/page_weight.py                     # All pages, compare with baseline
+    python scripts/page_weight.py irepa/index.html -v # One page, list every asset
+    python scripts/page_weight.py --update-baseline   # Accept current weights
+    python scripts/page_weight.py --json report.json
+
+Requirements:
+    Python 3 standard library
+"""
+
+import argparse
+import functools
+import json
+import os
+import re
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_PAGES = [
+    "index.html",
+    "repa-e/index.html",
+    "repa-e-t2i/index.html",
+    "irepa/index.html",
+    "diffusion-bench/index.html",
+]
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "page_weight_baseline.json"
+
+# Transfer-size budgets in KB: per asset kind, and per page for each loading path
+BUDGETS = {
+    "asset": {"image": 500, "video": 5000, "stylesheet": 100, "script": 300, "document": 200, "font": 150},
+    "page": {"critical": 1000, "total": 8000},
+}
+
+TEXT_EXTENSIONS = {".html", ".css", ".js", ".mjs", ".json", ".svg", ".txt", ".xml"}
+KIND_BY_EXTENSION = {
+    **dict.fromkeys([".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".svg", ".ico"], "image"),
+    **dict.fromkeys([".mp4", ".webm", ".mov"], "video"),
+    **dict.fromkeys([".woff2", ".woff", ".ttf", ".otf", ".eot"], "font"),
+    ".css": "stylesheet",
+    ".js": "script",
+    ".mjs": "script",
+    ".html": "document",
+}
+CSS_URL_PATTERN = re.compile(r"""url\(\s*['"]?([^'")]+)['"]?\s*\)""")
+CSS_IMPORT_PATTERN = re.compile(r"""@import\s+['"]([^'"]+)['"]""")
+# A browser downloads one format per @font-face; these are fallbacks for old browsers
+FONT_PREFERENCE = [".woff2", ".woff", ".ttf", ".otf", ".eot"]
+
+
+def is_external(url):
+    """True for URLs the analyzer cannot measure offline (other hosts, data: URIs)."""
+    parts = urlsplit(url)
+    return bool(parts.scheme or parts.netloc) or url.startswith("//")
+
+
+def resolve(url, base_dir):
+    """Local file a URL points to (query/fragment stripped), or None if it is external."""
+    if not url or is_external(url) or url.startswith("#"):
+        return None
+    path = unquote(urlsplit(url).path)
+    if not path:
+        return None
+    target = REPO_ROOT / path.lstrip("/") if path.startswith("/") else base_dir / path
+    target = Path(os.path.normpath(target))
+    if target.is_dir() or path.endswith("/"):
+        target = target / "index.html"
+    return target
+
+
+def relative(path):
+    """Path relative to the repo root, in URL (posix) form."""
+    return Path(os.path.relpath(path, REPO_ROOT)).as_posix()
+
+
+@functools.lru_cache(maxsize=None)
+def measure(path):
+    """(raw bytes, transfer bytes) of a local file; text is gzip-estimated. None if missing."""
+    try:
+        data = Path(path).read_bytes()
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+    if Path(path).suffix.lower() in TEXT_EXTENSIONS:
+        return len(data), len(zlib.compress(data, 6)) + 18  # gzip header + trailer
+    return len(data), len(data)
+
+
+def srcset_urls(value):
+    """URLs in a srcset attribute."""
+    return [candidate.strip().split()[0] for candidate in value.split(",") if candidate.strip()]
+
+
+class PageParser(HTMLParser):
+    """Collects (url, kind, loading path, tag) references in document order."""
+
+    def __init__(self, fold_chars):
+        super().__init__(convert_charrefs=True)
+        self.fold_chars = fold_chars
+        self.refs = []
+        self.text_chars = 0
+        self.in_body = False
+        self.skip_text = 0
+
+    def above_fold(self):
+        return self.text_chars < self.fold_chars
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "body":
+            self.in_body = True
+        if tag in ("script", "style"):
+            self.skip_text += 1
+
+        lazy = attrs.get("loading") == "lazy"
+        media_path = "deferred" if lazy else ("critical" if self.above_fold() else "eager")
+
+        if tag == "link":
+            rel = (attrs.get("rel") or "").lower().split()
+            href = attrs.get("href")
+            if "stylesheet" in rel:
+                path = "deferred" if attrs.get("media") == "print" else "critical"
+                self.add(href, "stylesheet", path, tag)
+            elif "icon" in rel:
+                self.add(href, "image", "deferred", tag)
+            elif "preload" in rel:
+                self.add(href, None, "critical", tag)
+        elif tag == "script" and attrs.get("src"):
+            blocking = not ("async" in attrs or "defer" in attrs or attrs.get("type") == "module")
+            self.add(attrs["src"], "script", "critical" if blocking else "deferred", tag)
+        elif tag in ("img", "source"):
+            for url in [attrs.get("src")] + srcset_urls(attrs.get("srcset") or ""):
+                self.add(url, None, media_path, tag)
+        elif tag == "video":
+            preload_none = attrs.get("preload") == "none"
+            self.add(attrs.get("src"), "video", "deferred" if preload_none else media_path, tag)
+            self.add(attrs.get("poster"), "image", media_path, tag)
+        elif tag in ("iframe", "embed", "object"):
+            self.add(attrs.get("src") or attrs.get("data"), "document", media_path, tag)
+
+        # Inline style backgrounds are fetched with the element
+        for url in CSS_URL_PATTERN.findall(attrs.get("style") or ""):
+            self.add(url, None, media_path, tag)
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style") and self.skip_text:
+            self.skip_text -= 1
+
+    def handle_data(self, data):
+        if self.in_body and not self.skip_text:
+            self.text_chars += len(data.strip())
+
+    def add(self, url, kind, loading, tag):
+        if url:
+            self.refs.append((url.strip(), kind, loading, tag))
+
+
+def stylesheet_refs(css_path):
+    """url() and @import references of a stylesheet, one font format per face."""
+    try:
+        css = css_path.read_text(errors="replace")
+    except FileNotFoundError:
+        return []
+    urls = CSS_URL_PATTERN.findall(css) + CSS_IMPORT_PATTERN.findall(css)
+    urls = [url for url in dict.fromkeys(urls) if not url.startswith("data:")]
+
+    # Keep only the preferred format among font files sharing a stem (SVG fonts included)
+    def split(url):
+        path = urlsplit(url).path
+        suffix = Path(path).suffix.lower()
+        return path[: len(path) - len(suffix)], suffix
+
+    fonts = {}
+    for url in urls:
+        stem, suffix = split(url)
+        if suffix in FONT_PREFERENCE:
+            best = fonts.get(stem)
+            if best is None or FONT_PREFERENCE.index(suffix) < FONT_PREFERENCE.index(split(best)[1]):
+                fonts[stem] = url
+    return [url for url in urls if split(url)[0] not in fonts or url == fonts[split(url)[0]]]
+
+
+def analyze_page(page, fold_chars):
+    """Resolve and measure every asset a page loads; returns the page report dict."""
+    page = Path(page)
+    assets = {}
+    external = set()
+    missing = []
+
+    def visit(url, base_dir, kind, loading, via):
+        target = resolve(url, base_dir)
+        if target is None:
+            if url and is_external(url) and not url.startswith("data:"):
+                external.add(url)
+            return
+        key = relative(target)
+        kind = kind or KIND_BY_EXTENSION.get(target.suffix.lower(), "other")
+        rank = ("critical", "eager", "deferred")
+        if key in assets:
+            # Referenced more than once: it is fetched on the earliest path
+            if rank.index(loading) < rank.index(assets[key]["loading"]):
+                assets[key]["loading"] = loading
+            return
+        size = measure(str(target))
+        if size is None:
+            missing.append({"path": key, "via": via})
+            return
+        assets[key] = {"path": key, "kind": kind, "loading": loading, "bytes": size[0],
+                       "transfer": size[1], "via": via}
+
+        if kind == "stylesheet":
+            for ref in stylesheet_refs(target):
+                visit(ref, target.parent, None, "deferred", key)
+        elif kind == "document":
+            # Everything an iframe loads is on its loading path (critical inside becomes eager)
+            child_loading = "eager" if loading == "critical" else loading
+            parser = PageParser(fold_chars=0)
+            parser.feed(target.read_text(errors="replace"))
+            for child_url, child_kind, child_path, _ in parser.refs:
+                child = child_loading if child_path != "deferred" else "deferred"
+                visit(child_url, target.parent, child_kind, child, key)
+
+    html = page.read_text(errors="replace")
+    parser = PageParser(fold_chars)
+    parser.feed(html)
+
+    # The page itself is the first critical request
+    size = measure(str(page))
+    assets[relative(page)] = {"path": relative(page), "kind": "document", "loading": "critical",
+                              "bytes": size[0], "transfer": size[1], "via": None}
+    for url, kind, loading, tag in parser.refs:
+        visit(url, page.parent, kind, loading, f"<{tag}>")
+
+    totals = {path: 0 for path in ("critical", "eager", "deferred")}
+    for asset in assets.values():
+        totals[asset["loading"]] += asset["transfer"]
+    totals["total"] = sum(totals.values())
+
+    return {
+        "page": relative(page),
+        "totals": totals,
+        "requests": len(assets),
+        "external": sorted(external),
+        "missing": missing,
+        "assets": sorted(assets.values(), key=lambda a: -a["transfer"]),
+        "violations": find_violations(assets.values(), totals),
+    }
+
+
+def find_violations(assets, totals):
+    """Assets and page totals over BUDGETS, plus large eager media that could be lazy-loaded."""
+    violations = []
+    for asset in assets:
+        problems = []
+        budget = BUDGETS["asset"].get(asset["kind"])
+        if budget and asset["transfer"] > budget * 1024:
+            problems.append(f"over the {budget} KB {asset['kind']} budget")
+        if asset["loading"] == "eager" and asset["kind"] in ("image", "video", "document") \
+                and asset["transfer"] > 100 * 1024:
+            problems.append('below the fold without loading="lazy"')
+        if problems:
+            violations.append(f"{asset['path']}: {asset['transfer'] / 1024:.0f} KB, {'; '.join(problems)}")
+    for path, budget in BUDGETS["page"].items():
+        if totals[path] > budget * 1024:
+            violations.append(f"page {path}: {totals[path] / 1024:.0f} KB > {budget} KB budget")
+    return violations
+
+
+def compare_with_baseline(reports, baseline, tolerance):
+    """Pages whose critical or total transfer grew by more than `tolerance` (fraction)."""
+    regressions = []
+    for report in reports:
+        previous = baseline.get(report["page"])
+        if previous is None:
+            continue
+        for path in ("critical", "total"):
+            before, after = previous[path], report["totals"][path]
+            # Ignore sub-KB noise on tiny totals
+            if after > before * (1 + tolerance) and after - before > 1024:
+                regressions.append(f"{report['page']} {path}: {before / 1024:.0f} KB -> "
+                                   f"{after / 1024:.0f} KB (+{(after - before) / 1024:.0f} KB)")
+    return regressions
+
+
+def baseline_entry(report):
+    return {**report["totals"], "requests": report["requests"]}
+
+
+def print_report(report, verbose):
+    totals = report["totals"]
+    print(f"\n{report['page']}")
+    print(f"  {report['requests']} local request(s), {len(report['external'])} external (not measured)")
+    print(f"  critical {totals['critical'] / 1024:>8.0f} KB   eager {totals['eager'] / 1024:>8.0f} KB   "
+          f"deferred {totals['deferred'] / 1024:>8.0f} KB   total {totals['total'] / 1024:>8.0f} KB")
+    shown = report["assets"] if verbose else report["assets"][:5]
+    for asset in shown:
+        print(f"    {asset['transfer'] / 1024:>8.1f} KB  {asset['loading']:<8} {asset['kind']:<10} {asset['path']}")
+    if not verbose and len(report["assets"]) > len(shown):
+        print(f"    ... {len(report['assets']) - len(shown)} more (-v to list all)")
+    for item in report["missing"]:
+        print(f"  ? missing: {item['path']} (via {item['via']})")
+    for violation in report["violations"]:
+        print(f"  ! {violation}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Page-weight and critical-path budget report")
+    parser.add_argument("pages", nargs="*", default=DEFAULT_PAGES,
+                        help="HTML pages relative to the repo root (default: every project page)")
+    parser.add_argument("--baseline", type=str, default=str(DEFAULT_BASELINE),
+                        help="Baseline JSON to compare against")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write the current totals as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.02,
+                        help="Allowed growth before a page counts as a regression (default: 0.02 = 2%%)")
+    parser.add_argument("--fold-chars", type=int, default=1200,
+                        help="Visible text characters treated as the first screen (default: 1200)")
+    parser.add_argument("--json", type=str, default=None, help="Write the full report as JSON")
+    parser.add_argument("-v", "--verbose", action="store_true", help="List every asset")
+    args = parser.parse_args()
+
+    pages = [REPO_ROOT / page for page in args.pages]
+    for page in pages:
+        if not page.is_file():
+            parser.error(f"page not found: {page}")
+
+    with ThreadPoolExecutor() as executor:
+        reports = list(executor.map(lambda page: analyze_page(page, args.fold_chars), pages))
+
+    print("=" * 60)
+    print(f"Page weight: {len(reports)} page(s), transfer sizes")
+    print("=" * 60)
+    for report in reports:
+        print_report(report, args.verbose)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(reports, f, indent=2)
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+
+    print("\n" + "=" * 60)
+    if args.update_baseline:
+        baseline.update({report["page"]: baseline_entry(report) for report in reports})
+        baseline_path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"✓ Baseline updated: {baseline_path}")
+        print("=" * 60)
+        return
+
+    regressions = compare_with_baseline(reports, baseline, args.tolerance)
+    violations = sum(len(report["violations"]) for report in reports)
+    print(f"{violations} budget warning(s)")
+    if not baseline:
+        print(f"No baseline at {baseline_path}; run with --update-baseline to create one")
+    for regression in regressions:
+        print(f"✗ Regression: {regression}")
+    if not regressions and baseline:
+        print("✓ No regressions against baseline")
+    print("=" * 60)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Local preview server for the project pages.
+
+A drop-in replacement for `python3 -m http.server` that keeps page reloads
+fast on the large pages:
+
+- one thread per connection, HTTP/1.1 keep-alive
+- text assets (HTML, CSS, JS, JSON, SVG, ...) are precompressed once at
+  startup into .preview-cache/ (gzip, plus brotli if installed) and served
+  according to Accept-Encoding
+- strong ETags (content SHA-256, cached by size and mtime) with
+  `Cache-Control: no-cache`, so unchanged files revalidate with a 304
+- single byte-range requests (206 / 416, If-Range) for video and big images
+- files above --mmap-threshold are memory-mapped and written straight from
+  the mapping
+- a per-request log line and a latency summary (p50 / p95 / p99) on exit
+
+Usage:
+    python scripts/serve.py                           # Serve the repo root on :8000
+    python scripts/serve.py --port 8008 --page repa-e-t2i/
+    python scripts/serve.py --quiet --no-precompress
+
+Requirements:
+    Python 3 standard library (pip install brotli for .br variants)
+"""
+
+import argparse
+import email.utils
+import gzip
+import hashlib
+import mmap
+import os
+import re
+import shutil
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIRNAME = ".preview-cache"
+COMPRESSIBLE_EXTENSIONS = {
+    ".html", ".css", ".js", ".mjs", ".json", ".svg", ".txt", ".md", ".bib", ".xml", ".csv",
+}
+MIN_COMPRESS_BYTES = 1024
+MMAP_CHUNK = 1024 * 1024
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# Encoding -> (variant suffix, compress function); preferred first
+ENCODINGS = {"gzip": (".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))}
+if brotli is not None:
+    ENCODINGS = {"br": (".br", lambda data: brotli.compress(data, quality=11)), **ENCODINGS}
+
+
+def is_skipped(rel_path):
+    """Hidden paths (.git, .preview-cache, ...) are neither precompressed nor served."""
+    return any(part.startswith(".") for part in rel_path.parts)
+
+
+def variant_path(root, rel_path, encoding):
+    """Where the precompressed variant of a file lives under .preview-cache/."""
+    suffix = ENCODINGS[encoding][0]
+    return root / CACHE_DIRNAME / rel_path.parent / (rel_path.name + suffix)
+
+
+def compress_file(root, rel_path):
+    """Write every encoding of one file whose variant is missing or older; returns bytes saved."""
+    source = root / rel_path
+    data = None
+    saved = 0
+    for encoding, (_, compress) in ENCODINGS.items():
+        target = variant_path(root, rel_path, encoding)
+        if target.exists() and target.stat().st_mtime_ns >= source.stat().st_mtime_ns:
+            continue
+        if data is None:
+            data = source.read_bytes()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_bytes(compress(data))
+        os.replace(tmp, target)
+        saved += len(data) - target.stat().st_size
+    return saved
+
+
+def precompress(root, workers):
+    """Build missing or stale compressed variants of every text asset under root, in parallel."""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for filename in filenames:
+            path = Path(dirpath) / filename
+            if path.suffix.lower() in COMPRESSIBLE_EXTENSIONS and path.stat().st_size >= MIN_COMPRESS_BYTES:
+                files.append(path.relative_to(root))
+
+    start = time.perf_counter()
+    # zlib and brotli release the GIL, so threads compress in parallel
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        saved = sum(executor.map(lambda rel: compress_file(root, rel), files))
+    print(f"✓ Precompressed {len(files)} text asset(s) [{', '.join(ENCODINGS)}] in "
+          f"{time.perf_counter() - start:.1f}s ({saved / 1024:.0f} KB saved on rebuilt files)")
+    if brotli is None:
+        print("  (pip install brotli to also serve .br variants)")
+
+
+class ETagCache:
+    """Content SHA-256 per path, reused while size and mtime are unchanged."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    def get(self, path, stat):
+        key = (stat.st_size, stat.st_mtime_ns)
+        with self.lock:
+            entry = self.entries.get(path)
+        if entry and entry[0] == key:
+            return entry[1]
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            if stat.st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    digest.update(mapped)
+        etag = f'"{digest.hexdigest()[:32]}"'
+        with self.lock:
+            self.entries[path] = (key, etag)
+        return etag
+
+
+class LatencyStats:
+    """Thread-safe per-request latency and status counters."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = []
+        self.statuses = {}
+        self.bytes_sent = 0
+
+    def record(self, seconds, status, nbytes):
+        with self.lock:
+            self.latencies.append(seconds)
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            self.bytes_sent += nbytes
+
+    def summary(self):
+        with self.lock:
+            latencies = sorted(self.latencies)
+            statuses = dict(sorted(self.statuses.items()))
+            sent = self.bytes_sent
+        if not latencies:
+            return "No requests served."
+
+        def pct(p):
+            return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000
+
+        codes = "  ".join(f"{code}: {count}" for code, count in statuses.items())
+        return (
+            f"{len(latencies)} request(s), {sent / 1024 ** 2:.1f} MB sent\n"
+            f"  latency p50 {pct(50):.1f} ms  p95 {pct(95):.1f} ms  p99 {pct(99):.1f} ms  "
+            f"max {latencies[-1] * 1000:.1f} ms\n"
+            f"  status  {codes}"
+        )
+
+
+class PreviewHandler(SimpleHTTPRequestHandler):
+    """Static file handler with precompressed variants, ETags, ranges and mmap."""
+
+    protocol_version = "HTTP/1.1"
+    etags = ETagCache()
+    stats = LatencyStats()
+    mmap_threshold = 4 * 1024 * 1024
+    quiet = False
+
+    def handle_one_request(self):
+        self._status = None
+        self._sent = 0
+        # Reset by parse_request(); errors raised before it (e.g. 414) are timed from here
+        self._start = time.perf_counter()
+        super().handle_one_request()
+        if self._status is not None:
+            elapsed = time.perf_counter() - self._start
+            self.stats.record(elapsed, self._status, self._sent)
+            if not self.quiet:
+                sys.stderr.write(f"{self.command or '-':<4} {self._status} {elapsed * 1000:7.1f} ms "
+                                 f"{self._sent / 1024:9.1f} KB  {getattr(self, 'path', '-')}\n")
+
+    def parse_request(self):
+        # Start timing once the request line has arrived, not while idling on keep-alive
+        self._start = time.perf_counter()
+        return super().parse_request()
+
+    def send_response(self, code, message=None):
+        self._status = int(code)
+        super().send_response(code, message)
+
+    def log_request(self, code="-", size="-"):
+        pass  # Replaced by the timed line in handle_one_request
+
+    def end_headers(self):
+        self.send_header("Cache-Control", "no-cache")
+        super().end_headers()
+
+    def do_GET(self):
+        self.serve(head_only=False)
+
+    def do_HEAD(self):
+        self.serve(head_only=True)
+
+    def serve(self, head_only):
+        path = Path(self.translate_path(self.path))
+        rel_path = Path(os.path.relpath(path, self.directory))
+        if rel_path.parts[:1] == ("..",) or is_skipped(rel_path):
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return
+
+        if path.is_dir():
+            url = urlsplit(self.path)
+            if not url.path.endswith("/"):
+                self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+                self.send_header("Location", url._replace(path=url.path + "/").geturl())
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if not (path / "index.html").is_file():
+                listing = self.list_directory(str(path))
+                if listing is not None:
+                    if not head_only:
+                        shutil.copyfileobj(listing, self.wfile)
+                        self._sent += listing.tell()
+                    listing.close()
+                return
+            path, rel_path = path / "index.html", rel_path / "index.html"
+
+        try:
+            stat = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return
+
+        # Compressed variant if the client accepts one and it is current (whole-file responses only)
+        encoding, body_path, body_stat = None, path, stat
+        if "Range" not in self.headers:
+            accepted = self.accepted_encodings()
+            for name in ENCODINGS:
+                if name not in accepted:
+                    continue
+                candidate = variant_path(Path(self.directory), rel_path, name)
+                try:
+                    candidate_stat = candidate.stat()
+                except FileNotFoundError:
+                    continue
+                if candidate_stat.st_mtime_ns >= stat.st_mtime_ns:
+                    encoding, body_path, body_stat = name, candidate, candidate_stat
+                    break
+
+        etag = self.etags.get(path, stat)
+        if encoding:
+            etag = f'{etag[:-1]}-{encoding}"'
+        if etag in [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_common_headers(etag, stat, path)
+            self.end_headers()
+            return
+
+        size = body_stat.st_size
+        start, end = 0, size - 1
+        status = HTTPStatus.OK
+        range_header = self.headers.get("Range")
+        if range_header and self.headers.get("If-Range", etag) == etag:
+            try:
+                byte_range = self.parse_range(range_header, size)
+            except ValueError:
+                byte_range = (0, size - 1)  # Malformed or multi-range: send the whole file
+            else:
+                status = HTTPStatus.PARTIAL_CONTENT
+            if byte_range is None:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            start, end = byte_range
+
+        self.send_response(status)
+        self.send_common_headers(etag, stat, path)
+        self.send_header("Content-Type", self.guess_type(str(path)))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        if status == HTTPStatus.PARTIAL_CONTENT:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        if not head_only:
+            self.write_body(body_path, start, end + 1, size)
+
+    def send_common_headers(self, etag, stat, path):
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", email.utils.formatdate(stat.st_mtime, usegmt=True))
+        self.send_header("Accept-Ranges", "bytes")
+        if path.suffix.lower() in COMPRESSIBLE_EXTENSIONS:
+            self.send_header("Vary", "Accept-Encoding")
+
+    def accepted_encodings(self):
+        """Encodings named in Accept-Encoding without q=0."""
+        accepted = set()
+        for item in self.headers.get("Accept-Encoding", "").split(","):
+            name, _, params = item.strip().partition(";")
+            if params.strip().replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+                accepted.add(name.strip().lower())
+        return accepted
+
+    @staticmethod
+    def parse_range(header, size):
+        """(start, end) of a single `bytes=` range, or None if unsatisfiable.
+
+        Raises ValueError for headers we do not honour (malformed, multiple ranges).
+        """
+        match = RANGE_PATTERN.match(header.strip())
+        if not match or not any(match.groups()):
+            raise ValueError(header)
+        first, last = match.groups()
+        if first:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+        else:
+            start, end = max(size - int(last), 0), size - 1
+        if start >= size or start > end:
+            return None
+        return start, end
+
+    def write_body(self, path, start, stop, size):
+        try:
+            self.write_file(path, start, stop, size)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True  # Client went away (e.g. a reload mid-download)
+
+    def write_file(self, path, start, stop, size):
+        with open(path, "rb") as f:
+            if size >= self.mmap_threshold:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        for offset in range(start, stop, MMAP_CHUNK):
+                            with view[offset:min(offset + MMAP_CHUNK, stop)] as chunk:
+                                self.wfile.write(chunk)
+                                self._sent += len(chunk)
+            else:
+                f.seek(start)
+                data = f.read(stop - start)
+                self.wfile.write(data)
+                self._sent += len(data)
+
+
+def stop_on_sigterm(signum, frame):
+    """Let `kill` stop the server with a summary, like Ctrl+C."""
+    raise KeyboardInterrupt
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Threaded local preview server for the project pages")
+    parser.add_argument("--root", type=str, default=str(REPO_ROOT),
+                        help="Directory to serve (default: repo root, so ../static links resolve)")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--bind", type=str, default="127.0.0.1")
+    parser.add_argument("--page", type=str, default="",
+                        help="Page path to print in the URL, e.g. repa-e-t2i/")
+    parser.add_argument("--no-precompress", action="store_true",
+                        help="Skip building gzip/brotli variants at startup")
+    parser.add_argument("--mmap-threshold-mb", type=float, default=4.0,
+                        help="Memory-map files at least this large (default: 4)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Compression threads (default: CPU count)")
+    parser.add_argument("--quiet", action="store_true", help="No per-request log lines")
+    args = parser.parse_args()
+
+    root = Path(args.root).resolve()
+    if not args.no_precompress:
+        precompress(root, args.workers)
+
+    PreviewHandler.mmap_threshold = int(args.mmap_threshold_mb * 1024 ** 2)
+    PreviewHandler.quiet = args.quiet
+
+    def handler(*handler_args, **handler_kwargs):
+        return PreviewHandler(*handler_args, directory=str(root), **handler_kwargs)
+
+    server = ThreadingHTTPServer((args.bind, args.port), handler)
+    server.daemon_threads = True
+    signal.signal(signal.SIGTERM, stop_on_sigterm)
+    print(f"Serving {root}")
+    print(f"Open: http://localhost:{args.port}/{args.page}")
+    print("Press Ctrl+C to stop (prints a latency summary)")
+    print("")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print("\n" + "=" * 60)
+        print(PreviewHandler.stats.summary())
+        print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()